@@ -0,0 +1 @@
+"""Performance benchmarks for DocumentAssistant; run modules with `python -m`."""
@@ -0,0 +1,198 @@
+"""
+Compare bulk inserts with the per-document storage path.
+
+    python -m benchmarks.bench_bulk_insert --documents 10000
+
+Inserts synthetic documents (a mix of invoices, notes and lab results with
+their child rows) into a fresh SQLite database per variant and reports rows
+per second. The per-document variants commit every document on its own and
+are slow, so they run on the first --per-document documents only.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from documentassistent.storage import DocumentRepository, FileMetadata, init_database
+from documentassistent.storage.bulk_insert import DocumentRecord
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.pydantic_llm_calls.invoice_call import (
+    InvoiceExtraction,
+    InvoiceTypeEnum,
+    Logs,
+)
+from documentassistent.structure.pydantic_llm_calls.note_call import NoteExtraction
+from documentassistent.structure.pydantic_llm_calls.result_call import (
+    ResultExtraction,
+    TestResult,
+)
+
+
+def _extraction(
+    label: DocumentType,
+    rng: random.Random,
+) -> InvoiceExtraction | NoteExtraction | ResultExtraction:
+    if label == DocumentType.INVOICE:
+        return InvoiceExtraction(
+            type=rng.choice(list(InvoiceTypeEnum)),
+            price=round(rng.uniform(5, 900), 2),
+            date="2024-05-01",
+            description="Synthetische Rechnung",
+            notes=None,
+            logs=[Logs(log=f"Eintrag {n}", date="2024-05-02") for n in range(2)],
+        )
+    if label == DocumentType.NOTE:
+        return NoteExtraction(
+            author="Erika Muster",
+            date=None,
+            content="Synthetische Notiz " * 20,
+            tags=["synthetisch", "notiz", "test"],
+        )
+    return ResultExtraction(
+        patient_name="Erika Muster",
+        test_results=[
+            TestResult(
+                test_name=f"Messwert {n}",
+                value=f"{rng.uniform(0, 20):.1f}",
+                unit="mg/dl",
+                reference_range="1-10",
+                date="2024-05-01",
+                notes=None,
+            )
+            for n in range(8)
+        ],
+        overall_notes=None,
+    )
+
+
+def synthetic_records(count: int, seed: int = 0) -> list[DocumentRecord]:
+    """Return count documents with random labels and extractions."""
+    rng = random.Random(seed)  # noqa: S311
+    records = []
+    for number in range(count):
+        label = rng.choice(list(DocumentType))
+        records.append(
+            DocumentRecord(
+                file_metadata=FileMetadata(
+                    path=f"/scans/{number}.pdf",
+                    hash=f"{number:064x}",
+                    size=rng.randint(10_000, 2_000_000),
+                    type="pdf",
+                ),
+                classification=Classification(
+                    label=label,
+                    confidence=Confidence(
+                        level=ConfidenceLevel.HIGH,
+                        explanation="synthetic",
+                    ),
+                ),
+                extraction=_extraction(label, rng),
+                text_content="Synthetischer Text " * 50,
+            ),
+        )
+    return records
+
+
+def row_count(records: list[DocumentRecord]) -> int:
+    """Return the number of rows the records are stored in."""
+    rows = 0
+    for record in records:
+        extraction = record.extraction
+        rows += 1 if extraction is None else 2
+        if isinstance(extraction, InvoiceExtraction):
+            rows += len(extraction.logs)
+        elif isinstance(extraction, NoteExtraction):
+            rows += len(extraction.tags or [])
+        elif isinstance(extraction, ResultExtraction):
+            rows += len(extraction.test_results)
+    return rows
+
+
+def _per_document(
+    repository: DocumentRepository,
+    records: list[DocumentRecord],
+) -> None:
+    """Store each document with its own sessions, as before save_many()."""
+    save = {
+        InvoiceExtraction: repository.save_invoice_extraction,
+        NoteExtraction: repository.save_note_extraction,
+        ResultExtraction: repository.save_result_extraction,
+    }
+    for record in records:
+        document_id = repository.save_document(
+            record.file_metadata,
+            record.classification,
+            record.text_content,
+        )
+        if record.extraction is not None:
+            save[type(record.extraction)](document_id, record.extraction)  # type: ignore[operator]
+
+
+def _unit_of_work(
+    repository: DocumentRepository,
+    records: list[DocumentRecord],
+) -> None:
+    """Store each document in one transaction, as StorageAgent does."""
+    for record in records:
+        with repository.unit_of_work() as uow:
+            document = uow.add_document(
+                record.file_metadata,
+                record.classification,
+                record.text_content,
+            )
+            if record.extraction is not None:
+                uow.add_extraction(document, record.extraction)
+
+
+def _timed(
+    store: Callable[[DocumentRepository, list[DocumentRecord]], object],
+    records: list[DocumentRecord],
+) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        init_database(str(Path(directory) / "bench.db"))
+        start = time.perf_counter()
+        store(DocumentRepository(), records)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Insert synthetic documents per variant and print rows per second."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=10_000)
+    parser.add_argument("--per-document", type=int, default=1_000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.documents)
+    sample = records[: args.per_document]
+    variants: list[tuple[str, list[DocumentRecord], Callable[..., object]]] = [
+        ("per document (2 commits)", sample, _per_document),
+        ("unit of work (1 commit)", sample, _unit_of_work),
+        (
+            f"save_many (chunks of {args.chunk_size})",
+            records,
+            lambda repository, items: repository.save_many(items, args.chunk_size),
+        ),
+    ]
+    for name, items, store in variants:
+        seconds = _timed(store, items)
+        rows = row_count(items)
+        sys.stdout.write(
+            f"{name:<28} {len(items):>6} docs {rows:>7} rows "
+            f"{seconds:7.2f}s {rows / seconds:10.0f} rows/s\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare LLM classification on the full text with classification on an excerpt.
+
+    python -m benchmarks.bench_classification_input --limit 50 --max-tokens 800
+
+Runs the configured LLM (response cache off, fast path off) on the documents
+stored in SQLite, once with the full text and once with the excerpt policy,
+and reports latency and how often the excerpt label agrees with the
+full-text label and with the stored label.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from copy import deepcopy
+
+from documentassistent.agents.classification_agent import ClassificationAgent
+from documentassistent.agents.input_policy import EXCERPT, InputPolicy
+from documentassistent.llm.llm_factory import LLMFactory, config_from_settings
+from documentassistent.storage import (
+    DocumentRepository,
+    SQLiteProfile,
+    init_database,
+)
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    DocumentType,
+)
+from documentassistent.structure.state import ClassificationState
+from documentassistent.utils.tokens import count_tokens
+from load_config import load_config
+
+
+def _classify(
+    agent: ClassificationAgent,
+    text: str,
+) -> tuple[DocumentType | None, float]:
+    start = time.perf_counter()
+    state = agent.classify(ClassificationState(text=text))
+    seconds = time.perf_counter() - start
+    label = state.classification_result.label if state.classification_result else None
+    return label, seconds
+
+
+def main() -> None:
+    """Classify the stored corpus both ways and print latency and agreement."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--max-tokens", type=int, default=800)
+    args = parser.parse_args()
+
+    settings = deepcopy(load_config("config.yaml"))
+    settings.setdefault("llm", {})["cache"] = {"enabled": False}
+    init_database(
+        settings["database"]["path"],
+        SQLiteProfile.from_settings(settings),
+    )
+    stored = DocumentRepository().list_all()
+    documents = [doc for doc in stored if doc.text_content][: args.limit]
+    if not documents:
+        sys.stderr.write("No stored documents; process some files first\n")
+        sys.exit(1)
+
+    llm = LLMFactory.create_llm(config_from_settings(settings))
+    policy = InputPolicy(mode=EXCERPT, max_tokens=args.max_tokens)
+    full_agent = ClassificationAgent(llm=llm)
+    excerpt_agent = ClassificationAgent(llm=llm, input_policy=policy)
+
+    full_seconds: list[float] = []
+    excerpt_seconds: list[float] = []
+    tokens_full = tokens_excerpt = agree_full = agree_stored = 0
+    for doc in documents:
+        text = str(doc.text_content)
+        full_label, elapsed = _classify(full_agent, text)
+        full_seconds.append(elapsed)
+        excerpt_label, elapsed = _classify(excerpt_agent, text)
+        excerpt_seconds.append(elapsed)
+        tokens_full += count_tokens(text)
+        tokens_excerpt += count_tokens(policy.apply(text))
+        agree_full += int(excerpt_label == full_label)
+        agree_stored += int(excerpt_label == doc.classification_label)
+
+    count = len(documents)
+    sys.stdout.write(f"{count} stored documents, excerpt budget {args.max_tokens}\n")
+    for label, seconds, tokens in (
+        ("full text", full_seconds, tokens_full),
+        ("excerpt", excerpt_seconds, tokens_excerpt),
+    ):
+        sys.stdout.write(
+            f"{label:<10} mean {statistics.mean(seconds):6.2f}s  "
+            f"median {statistics.median(seconds):6.2f}s  "
+            f"{tokens / count:8.0f} tokens/doc\n",
+        )
+    sys.stdout.write(
+        f"excerpt label agrees with full text {agree_full / count:.1%}, "
+        f"with stored label {agree_stored / count:.1%}\n",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare per-call tesseract subprocesses with the persistent OCR worker pool.
+
+    python -m benchmarks.bench_ocr --images 200 --workers 4
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+from benchmarks.synthetic import phone_photo, receipt_lines
+from documentassistent.input_engineering.ocr_engine import (
+    AUTO,
+    OCRWorkerPool,
+    PytesseractEngine,
+)
+
+
+def _subprocess_per_call(images: list[bytes]) -> float:
+    """OCR images one by one the way ImageReader used to: a CLI call each."""
+    import pytesseract
+    from PIL import Image
+
+    start = time.perf_counter()
+    for data in images:
+        with Image.open(io.BytesIO(data)) as image:
+            pytesseract.image_to_string(image)
+    return time.perf_counter() - start
+
+
+def _pool(images: list[bytes], workers: int, engine: str) -> tuple[float, str]:
+    """OCR images on long-lived workers; excludes the one-off pool start-up."""
+    with OCRWorkerPool(workers=workers, engine=engine) as pool:
+        # Start the workers and load their engines before timing
+        pool.recognize_many(images[:workers])
+        start = time.perf_counter()
+        pool.recognize_many(images)
+        return time.perf_counter() - start, pool.engine
+
+
+def main() -> None:
+    """Generate the photos and print images/sec for each approach."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--images", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engine", default=AUTO)
+    args = parser.parse_args()
+
+    if PytesseractEngine().version() == "unavailable":
+        sys.stderr.write("tesseract is not installed; nothing to benchmark\n")
+        sys.exit(1)
+
+    images = [
+        phone_photo(receipt_lines(number), seed=number) for number in range(args.images)
+    ]
+    sys.stdout.write(f"{args.images} photos, {args.workers} workers\n")
+
+    seconds = _subprocess_per_call(images)
+    sys.stdout.write(
+        f"{'subprocess per call':<28}{args.images / seconds:>8.2f} img/s\n",
+    )
+    seconds, engine = _pool(images, args.workers, args.engine)
+    label = f"worker pool ({engine})"
+    sys.stdout.write(f"{label:<28}{args.images / seconds:>8.2f} img/s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Compare PDF text extraction modes on a synthetic multi-page PDF.
+
+Each mode runs in a fresh interpreter so peak RSS is measured independently:
+
+    python -m benchmarks.bench_pdf_reader --pages 500 --workers 4
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import statement_page, write_text_pdf
+from documentassistent.input_engineering.input_reader import PDFReader
+
+MODES = ("legacy", "serial", "parallel")
+
+
+def _legacy_read(path: str) -> str:
+    """Replicate the original reader: serial, with `+=` string growth."""
+    import PyPDF2
+
+    content = ""
+    with Path(path).open("rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        for page in reader.pages:
+            content += page.extract_text() or ""
+    return content
+
+
+def _peak_rss_mb() -> float:
+    """Peak RSS of this process plus its largest child, in MiB (Linux units)."""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (own + children) / 1024
+
+
+def _run_mode(mode: str, pdf: str, pages: int, workers: int) -> dict[str, float]:
+    """Extract the PDF once with mode and return timing and memory figures."""
+    start = time.perf_counter()
+    if mode == "legacy":
+        text = _legacy_read(pdf)
+    else:
+        reader = PDFReader(workers=workers if mode == "parallel" else None)
+        text = reader.read(pdf).content
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": seconds,
+        "pages_per_second": pages / seconds,
+        "peak_rss_mb": _peak_rss_mb(),
+        "characters": len(text),
+    }
+
+
+def main() -> None:
+    """Generate the PDF, run every mode in a subprocess and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--pdf", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        result = _run_mode(args.mode, args.pdf, args.pages, args.workers)
+        sys.stdout.write(json.dumps(result) + "\n")
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        pdf = write_text_pdf(
+            Path(directory) / "synthetic.pdf",
+            [statement_page(number) for number in range(args.pages)],
+        )
+        sys.stdout.write(
+            f"{args.pages} pages, {pdf.stat().st_size / 1024:.0f} KiB, "
+            f"{args.workers} workers\n",
+        )
+        sys.stdout.write(f"{'mode':<10}{'pages/s':>10}{'seconds':>10}{'RSS MiB':>10}\n")
+        for mode in MODES:
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.bench_pdf_reader",
+                    "--mode",
+                    mode,
+                    "--pdf",
+                    str(pdf),
+                    "--pages",
+                    str(args.pages),
+                    "--workers",
+                    str(args.workers),
+                ],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            result = json.loads(output.splitlines()[-1])
+            sys.stdout.write(
+                f"{mode:<10}{result['pages_per_second']:>10.1f}"
+                f"{result['seconds']:>10.2f}{result['peak_rss_mb']:>10.1f}\n",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Compare OCR latency and accuracy with and without image preprocessing.
+
+    python -m benchmarks.bench_preprocessing --images 20
+    python -m benchmarks.bench_preprocessing --pictures data/Pictures
+
+Synthetic 12-megapixel photos are scored by character-level agreement with
+the text they were rendered from. Real photos have no ground truth, so they
+are scored against the OCR of the unprocessed image instead.
+"""
+
+import argparse
+import io
+import sys
+import time
+from dataclasses import replace
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from benchmarks.synthetic import phone_photo, receipt_lines
+from documentassistent.input_engineering.ocr_engine import AUTO, get_engine
+from documentassistent.input_engineering.preprocessing import (
+    PreprocessConfig,
+    preprocess,
+)
+
+TWELVE_MEGAPIXELS = (3024, 4032)
+
+VARIANTS: dict[str, PreprocessConfig | None] = {
+    "raw": None,
+    "rotate+downscale": PreprocessConfig(grayscale=False, binarize=False),
+    "+grayscale": PreprocessConfig(binarize=False),
+    "+binarize": PreprocessConfig(),
+    "+binarize (200 dpi)": PreprocessConfig(target_dpi=200),
+    "+binarize+deskew": PreprocessConfig(deskew=True),
+}
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def agreement(text: str, reference: str) -> float:
+    """Return the character-level similarity (0..1) ignoring whitespace runs."""
+    return SequenceMatcher(None, _normalize(text), _normalize(reference)).ratio()
+
+
+def _ocr(
+    data: bytes,
+    config: PreprocessConfig | None,
+    engine: str,
+) -> tuple[str, float, float]:
+    """Return the text, preprocessing seconds and OCR seconds of one image."""
+    from PIL import Image
+
+    ocr = get_engine(engine)
+    with Image.open(io.BytesIO(data)) as image:
+        start = time.perf_counter()
+        prepared = image if config is None else preprocess(image, config)
+        prepared.load()
+        prepared_at = time.perf_counter()
+        text = ocr.recognize(prepared)
+        done = time.perf_counter()
+    return text, prepared_at - start, done - prepared_at
+
+
+def _synthetic(count: int) -> list[tuple[bytes, str]]:
+    return [
+        (
+            phone_photo(
+                receipt_lines(number),
+                size=TWELVE_MEGAPIXELS,
+                seed=number,
+                shade=True,
+                exif_orientation=6 if number % 2 else None,
+            ),
+            "\n".join(receipt_lines(number)),
+        )
+        for number in range(count)
+    ]
+
+
+def main() -> None:
+    """Print latency and agreement per preprocessing variant."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--pictures", type=Path, default=None)
+    parser.add_argument("--engine", default=AUTO)
+    parser.add_argument("--block-size", type=int, default=31)
+    parser.add_argument("--offset", type=float, default=10.0)
+    args = parser.parse_args()
+
+    if get_engine(args.engine).version() == "unavailable":
+        sys.stderr.write("tesseract is not installed; nothing to benchmark\n")
+        sys.exit(1)
+
+    if args.pictures is None:
+        samples: list[tuple[bytes, str | None]] = list(_synthetic(args.images))
+        source = f"{len(samples)} synthetic {TWELVE_MEGAPIXELS} photos"
+    else:
+        paths = sorted(
+            path
+            for path in args.pictures.iterdir()
+            if path.suffix.lower() in {".jpg", ".jpeg", ".png"}
+        )
+        samples = [(path.read_bytes(), None) for path in paths]
+        source = f"{len(samples)} photos from {args.pictures}, scored against raw OCR"
+    sys.stdout.write(f"{source}, engine {get_engine(args.engine).name}\n")
+
+    # Without ground truth, the raw OCR output is the reference
+    references = [
+        truth if truth is not None else _ocr(data, None, args.engine)[0]
+        for data, truth in samples
+    ]
+    sys.stdout.write(
+        f"{'variant':<22}{'prep ms':>9}{'ocr ms':>9}{'total ms':>10}{'agree':>8}\n",
+    )
+    for label, variant in VARIANTS.items():
+        config = (
+            None
+            if variant is None
+            else replace(variant, block_size=args.block_size, offset=args.offset)
+        )
+        prep = ocr = score = 0.0
+        for (data, _), reference in zip(samples, references, strict=True):
+            text, prep_seconds, ocr_seconds = _ocr(data, config, args.engine)
+            prep += prep_seconds
+            ocr += ocr_seconds
+            score += agreement(text, reference)
+        count = len(samples)
+        sys.stdout.write(
+            f"{label:<22}{prep / count * 1000:>9.0f}{ocr / count * 1000:>9.0f}"
+            f"{(prep + ocr) / count * 1000:>10.0f}{score / count:>8.3f}\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Compare FTS5 search with a LIKE scan over stored document texts.
+
+    python -m benchmarks.bench_search --documents 50000 --query "Zahnarzt 2024"
+
+Stores synthetic documents with varied German texts in a fresh database and
+times DocumentRepository.search() against filtering text_content with LIKE
+for every word of the query.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy import and_, select
+
+from benchmarks.bench_bulk_insert import synthetic_records
+from documentassistent.storage import DocumentRepository, get_session, init_database
+from documentassistent.storage.models import Document
+
+WORDS = [
+    "Rechnung",
+    "Behandlung",
+    "Hausarzt",
+    "Apotheke",
+    "Miete",
+    "Nebenkosten",
+    "Strom",
+    "Versicherung",
+    "Beitrag",
+    "Laborbefund",
+    "Leukozyten",
+    "Kreatinin",
+    "Termin",
+    "Überweisung",
+    "Betrag",
+    "Summe",
+    "Kundennummer",
+    "Praxis",
+    "Quittung",
+    "Schreibwaren",
+    "Notiz",
+    "Vertrag",
+    "Kündigung",
+    "Mahnung",
+]
+# Share of documents from the dentist, so the query is selective
+DENTIST_SHARE = 0.01
+
+
+def _text(rng: random.Random) -> str:
+    lines = [" ".join(rng.choices(WORDS, k=8)) for _ in range(30)]
+    day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(2019, 2025)
+    lines.insert(0, f"Datum {day}.{month}.{year}")
+    if rng.random() < DENTIST_SHARE:
+        lines.insert(1, "Zahnarzt Dr. Müller, Behandlung")
+    return "\n".join(lines)
+
+
+def _time(run: Callable[[], object], repeat: int) -> tuple[float, object]:
+    """Return the median milliseconds of run and its last result."""
+    timings = []
+    result: object = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main() -> None:
+    """Time full-text search and a LIKE scan for the same query."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=50_000)
+    parser.add_argument("--query", default="Zahnarzt 2024")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)  # noqa: S311
+    records = [
+        record._replace(text_content=_text(rng))
+        for record in synthetic_records(args.documents)
+    ]
+    words = args.query.split()
+
+    def like_scan() -> list[int]:
+        condition = and_(*(Document.text_content.like(f"%{word}%") for word in words))
+        session = get_session()
+        try:
+            statement = select(Document.id).where(condition).limit(args.limit)
+            return list(session.scalars(statement))
+        finally:
+            session.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        init_database(str(Path(directory) / "bench.db"))
+        repository = DocumentRepository()
+        start = time.perf_counter()
+        repository.save_many(records)
+        sys.stdout.write(
+            f"{args.documents} documents stored and indexed in "
+            f"{time.perf_counter() - start:.1f}s\n",
+        )
+        for name, run in (
+            (
+                "FTS5 search (BM25 ranked)",
+                lambda: repository.search(args.query, args.limit),
+            ),
+            ("LIKE scan (unranked)", like_scan),
+        ):
+            milliseconds, hits = _time(run, args.repeat)
+            sys.stdout.write(
+                f"{name:<26} {milliseconds:9.2f} ms  {len(hits):>3} hits\n",  # type: ignore[arg-type]
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Compare SQLite profiles under concurrent ingestion and reads.
+
+    python -m benchmarks.bench_sqlite_profiles --documents 2000 --writers 4
+
+For each profile, writer threads store synthetic documents one transaction
+each (as StorageAgent does) while reader threads keep querying the database.
+Reports write throughput and latency, read throughput and failed operations
+("database is locked").
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from benchmarks.bench_bulk_insert import synthetic_records
+from documentassistent.exceptions import DatabaseError
+from documentassistent.storage import DocumentRepository, init_database
+from documentassistent.storage.bulk_insert import DocumentRecord
+from documentassistent.storage.database import (
+    DEFAULT_PROFILE,
+    PERFORMANCE_PROFILE,
+    SQLiteProfile,
+)
+
+PROFILES = {
+    "sqlite defaults": DEFAULT_PROFILE,
+    "wal only": replace(DEFAULT_PROFILE, journal_mode="wal"),
+    "performance": PERFORMANCE_PROFILE,
+}
+
+
+def _store(repository: DocumentRepository, record: DocumentRecord) -> None:
+    with repository.unit_of_work() as uow:
+        document = uow.add_document(
+            record.file_metadata,
+            record.classification,
+            record.text_content,
+        )
+        if record.extraction is not None:
+            uow.add_extraction(document, record.extraction)
+
+
+def _time_writers(
+    writers: list[threading.Thread],
+    readers: list[threading.Thread],
+    done: threading.Event,
+) -> float:
+    """Run the writers to completion with the readers running alongside."""
+    for thread in readers:
+        thread.start()
+    start = time.perf_counter()
+    for thread in writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    seconds = time.perf_counter() - start
+    done.set()
+    for thread in readers:
+        thread.join()
+    return seconds
+
+
+def _run(
+    profile: SQLiteProfile,
+    records: list[DocumentRecord],
+    writers: int,
+    readers: int,
+) -> dict[str, float]:
+    """Ingest records with writer threads while reader threads query."""
+    latencies: list[float] = []
+    reads = [0] * readers
+    errors = [0]
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def write(part: list[DocumentRecord]) -> None:
+        repository = DocumentRepository()
+        for record in part:
+            start = time.perf_counter()
+            try:
+                _store(repository, record)
+            except DatabaseError:
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    def read(index: int) -> None:
+        repository = DocumentRepository()
+        while not done.is_set():
+            try:
+                repository.count_documents()
+                repository.list_documents(limit=20)
+                repository.get_document_by_hash(f"{index:064x}")
+            except DatabaseError:
+                with lock:
+                    errors[0] += 1
+                continue
+            reads[index] += 3
+
+    with tempfile.TemporaryDirectory() as directory:
+        init_database(str(Path(directory) / "bench.db"), profile)
+        reader_threads = [
+            threading.Thread(target=read, args=(index,)) for index in range(readers)
+        ]
+        writer_threads = [
+            threading.Thread(target=write, args=(records[index::writers],))
+            for index in range(writers)
+        ]
+        seconds = _time_writers(writer_threads, reader_threads, done)
+
+    latencies.sort()
+    return {
+        "docs_per_second": len(latencies) / seconds,
+        "median_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+        "reads_per_second": sum(reads) / seconds,
+        "errors": errors[0],
+    }
+
+
+def main() -> None:
+    """Run the ingestion and read workload under each profile."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=2)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.documents)
+    sys.stdout.write(
+        f"{args.documents} documents, {args.writers} writers, {args.readers} readers\n",
+    )
+    for name, profile in PROFILES.items():
+        result = _run(profile, records, args.writers, args.readers)
+        sys.stdout.write(
+            f"{name:<16} {result['docs_per_second']:8.0f} docs/s  "
+            f"median {result['median_ms']:6.1f}ms  p95 {result['p95_ms']:6.1f}ms  "
+            f"{result['reads_per_second']:8.0f} reads/s  "
+            f"{result['errors']:.0f} errors\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
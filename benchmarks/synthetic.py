@@ -0,0 +1,129 @@
+"""Synthetic test documents for benchmarks and tests."""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _content_stream(lines: Sequence[str]) -> bytes:
+    """Return a page content stream drawing lines top to bottom."""
+    commands = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+    commands += [f"({_escape(line)}) Tj T*" for line in lines]
+    commands.append("ET")
+    return "\n".join(commands).encode("latin-1")
+
+
+def write_text_pdf(path: str | Path, pages: Sequence[Sequence[str]]) -> Path:
+    """Write a minimal PDF with one text page per entry of pages."""
+    page_count = len(pages)
+    font_id = 3
+    first_page_id = 4
+    # Object ids: 1 catalog, 2 page tree, 3 font, then (page, content) pairs
+    kids = " ".join(f"{first_page_id + 2 * i} 0 R" for i in range(page_count))
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for index, lines in enumerate(pages):
+        content_id = first_page_id + 2 * index + 1
+        objects.append(
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+                f"/Contents {content_id} 0 R >>"
+            ).encode(),
+        )
+        stream = _content_stream(lines)
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream",
+        )
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    output += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+
+    path = Path(path)
+    path.write_bytes(bytes(output))
+    return path
+
+
+def statement_page(number: int, lines: int = 50) -> list[str]:
+    """Return the lines of a bank-statement-like page."""
+    return [f"Kontoauszug Seite {number}"] + [
+        f"{(i % 28) + 1:02d}.03.2024 Lastschrift Referenz {number:04d}-{i:03d} "
+        f"{(number * 37 + i * 13) % 1000},{i % 100:02d} EUR"
+        for i in range(lines)
+    ]
+
+
+def receipt_lines(number: int, lines: int = 18) -> list[str]:
+    """Return the lines of a receipt-like document."""
+    items = [
+        f"Artikel {number:03d}-{i:02d}  "
+        f"{(number * 7 + i * 3) % 50 + 1},{i * 7 % 100:02d} EUR"
+        for i in range(lines)
+    ]
+    return ["Quittung", f"Beleg Nr. {number:05d}", *items, "Summe 123,45 EUR"]
+
+
+def phone_photo(
+    lines: list[str],
+    size: tuple[int, int] = (1200, 1600),
+    seed: int = 0,
+    *,
+    shade: bool = False,
+    exif_orientation: int | None = None,
+) -> bytes:
+    """
+    Render lines like a slightly rotated, noisy phone photo; returns JPEG bytes.
+
+    Text scales with size (4032x3024 mimics a 12-megapixel camera). shade adds
+    uneven lighting; exif_orientation (3, 6 or 8) stores the pixels turned
+    with an EXIF tag saying how to rotate them upright, like a portrait shot.
+    """
+    import io
+    import random
+
+    from PIL import ExifTags, Image, ImageDraw, ImageFilter, ImageFont
+
+    rng = random.Random(seed)  # noqa: S311
+    scale = size[0] / 1200
+    image = Image.new("RGB", size, (232, 228, 220))
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=round(36 * scale))
+    for row, line in enumerate(lines):
+        position = (round(120 * scale), round((140 + row * 60) * scale))
+        draw.text(position, line, fill=(30, 30, 35), font=font)
+    if shade:
+        # Darken towards one corner, like a photo taken under a lamp
+        gradient = Image.linear_gradient("L").rotate(45).resize(size)
+        dark = Image.new("RGB", size, (110, 105, 100))
+        image = Image.composite(dark, image, gradient.point(lambda v: v * 3 // 5))
+    image = image.rotate(rng.uniform(-2.0, 2.0), fillcolor=(200, 196, 190))
+    image = image.filter(ImageFilter.GaussianBlur(radius=0.8 * scale))
+    exif = Image.Exif()
+    if exif_orientation is not None:
+        # Store the pixels so that the EXIF orientation turns them upright
+        stored = {
+            3: Image.Transpose.ROTATE_180,
+            6: Image.Transpose.ROTATE_90,
+            8: Image.Transpose.ROTATE_270,
+        }
+        image = image.transpose(stored[exif_orientation])
+        exif[ExifTags.Base.Orientation] = exif_orientation
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=85, exif=exif)
+    return buffer.getvalue()
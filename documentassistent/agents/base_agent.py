@@ -1,12 +1,14 @@
 """Base agent class with shared initialization and validation logic."""
 
+import inspect
 from collections.abc import Callable
 from functools import wraps
 from typing import Any, TypeVar, cast
 
+from documentassistent.agents.input_policy import InputPolicy
 from documentassistent.exceptions import StateValidationError
 from documentassistent.llm.base_llm import BaseLLM
-from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
+from documentassistent.llm.llm_factory import LLMFactory, config_from_settings
 from documentassistent.structure.state import BaseWorkflowState
 from load_config import load_config
 
@@ -18,6 +20,26 @@ StateT = TypeVar("StateT", bound=BaseWorkflowState)
 def validate_state(func: Callable) -> Callable:
     """Decorator to validate state before method execution."""
 
+    def check(self: BaseAgent, state: BaseWorkflowState | None) -> None:
+        if state is None:
+            msg = "state must not be None"
+            self.logger.error(msg)
+            raise StateValidationError(msg)
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(
+            self: BaseAgent,
+            state: BaseWorkflowState,
+            *args: Any,
+            **kwargs: Any,
+        ) -> BaseWorkflowState:
+            check(self, state)
+            return cast("BaseWorkflowState", await func(self, state, *args, **kwargs))
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(
         self: BaseAgent,
@@ -25,10 +47,7 @@ def validate_state(func: Callable) -> Callable:
         *args: Any,
         **kwargs: Any,
     ) -> BaseWorkflowState:
-        if state is None:
-            msg = "state must not be None"
-            self.logger.error(msg)
-            raise StateValidationError(msg)
+        check(self, state)
         return cast("BaseWorkflowState", func(self, state, *args, **kwargs))
 
     return wrapper
@@ -42,10 +61,12 @@ class BaseAgent:
         agent_name: str,
         logger: Any,
         llm: BaseLLM | None = None,
+        input_policy: InputPolicy | None = None,
     ) -> None:
         """Initialize the agent with LLM configuration."""
         self.logger = logger
         self.llm: BaseLLM = llm if llm is not None else self._create_default_llm()
+        self.input_policy = input_policy or InputPolicy()
         self.logger.info(
             "{} initialized with LLM: {}",
             agent_name,
@@ -54,20 +75,19 @@ class BaseAgent:
 
     def _create_default_llm(self) -> BaseLLM:
         """Create default LLM from configuration."""
-        # Get provider from config, fallback to 'ollama' for backward compatibility
-        provider = CONFIG.get("llm", {}).get("provider", "ollama")
-        model = CONFIG.get("llm", {}).get(
-            "model",
-            CONFIG.get(provider, {}).get("model"),
-        )
+        return LLMFactory.create_llm(config_from_settings(CONFIG))
 
-        config: ConfigDict = {
-            "llm": {
-                "type": provider,
-                "model": model,
-            },
-        }
-        return LLMFactory.create_llm(config)
+    def _llm_state(self, state: StateT) -> StateT:
+        """Return the state to send to the LLM, with the text the policy allows."""
+        text = self.input_policy.apply(state.text)
+        if text is state.text:
+            return state
+        self.logger.debug(
+            "Sending {} of {} characters to the LLM",
+            len(text),
+            len(state.text),
+        )
+        return state.model_copy(update={"text": text})
 
     def _convert_state(
         self,
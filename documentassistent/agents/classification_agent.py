@@ -1,4 +1,6 @@
 from documentassistent.agents.base_agent import BaseAgent, validate_state
+from documentassistent.agents.input_policy import InputPolicy
+from documentassistent.agents.rule_classifier import RuleBasedClassifier
 from documentassistent.llm.base_llm import BaseLLM
 from documentassistent.structure.pydantic_llm_calls.classification_call import (
     Classification,
@@ -17,16 +19,52 @@ class ClassificationAgent(BaseAgent):
     Agent for document classification using LLMFactory and custom prompt/structure.
 
     This agent uses a factory to instantiate the LLM, a custom prompt, and a
-    Pydantic structure for classification tasks.
+    Pydantic structure for classification tasks. An optional rule-based
+    pre-classifier answers clear-cut documents without calling the LLM, and
+    an excerpt input policy keeps long documents from being sent in full.
     """
 
-    def __init__(self, llm: BaseLLM | None = None) -> None:
-        super().__init__(agent_name="ClassificationAgent", logger=logger, llm=llm)
+    def __init__(
+        self,
+        llm: BaseLLM | None = None,
+        pre_classifier: RuleBasedClassifier | None = None,
+        input_policy: InputPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            agent_name="ClassificationAgent",
+            logger=logger,
+            llm=llm,
+            input_policy=input_policy,
+        )
+        self.pre_classifier = pre_classifier
+
+    def _fast_path(self, state: ClassificationState) -> Classification | None:
+        """Return the earlier or pre-classifier's decision, or None to ask the LLM."""
+        # Already classified from the first pages while the rest was read
+        if state.classification_result is not None:
+            return state.classification_result
+        if self.pre_classifier is None:
+            return None
+        return self.pre_classifier.classify(state.text)
 
     @validate_state
     def classify(self, state: BaseWorkflowState) -> ClassificationState:
         """Classify the input text and return a Classification result."""
         state = self._convert_state(state, ClassificationState)
-        result = self.llm.call(state, pydantic_object=Classification)
+        result = self._fast_path(state) or self.llm.call(
+            self._llm_state(state),
+            pydantic_object=Classification,
+        )
+        logger.debug("Classification result: {}", result)
+        return state.model_copy(update={"classification_result": result})
+
+    @validate_state
+    async def aclassify(self, state: BaseWorkflowState) -> ClassificationState:
+        """Classify the input text asynchronously."""
+        state = self._convert_state(state, ClassificationState)
+        result = self._fast_path(state) or await self.llm.acall(
+            self._llm_state(state),
+            pydantic_object=Classification,
+        )
         logger.debug("Classification result: {}", result)
         return state.model_copy(update={"classification_result": result})
@@ -0,0 +1,97 @@
+"""Policies for how much of a document's text an agent sends to the LLM."""
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from documentassistent.agents.rule_classifier import DEFAULT_RULES
+from documentassistent.utils.tokens import DEFAULT_ENCODING, count_tokens
+
+FULL = "full"
+EXCERPT = "excerpt"
+
+# Marks text left out between the parts of an excerpt
+GAP = "[...]"
+# Rough characters per token, used to cut a single overlong line
+_CHARS_PER_TOKEN = 4
+
+
+def _take(lines: list[str], budget: int, encoding: str) -> list[str]:
+    """Return leading lines that fit into budget tokens, cutting the last one."""
+    taken = []
+    for line in lines:
+        tokens = count_tokens(line, encoding)
+        if tokens > budget:
+            if budget > 0:
+                taken.append(line[: budget * _CHARS_PER_TOKEN])
+            break
+        taken.append(line)
+        budget -= tokens
+    return taken
+
+
+@dataclass(frozen=True)
+class InputPolicy:
+    """
+    Which part of a document's text an agent sends to the LLM.
+
+    "full" sends everything. "excerpt" keeps texts within max_tokens as they
+    are and otherwise sends the start (usually the first page with sender and
+    title), the end (totals, signatures) and, in between, the lines matching
+    keywords, which default to the classification rule patterns.
+
+    max_pages, where a caller reads pages as a stream (main.py), is how many
+    pages are read before the agent runs; None waits for the whole document.
+    """
+
+    mode: str = FULL
+    max_tokens: int = 800
+    head_share: float = 0.5
+    tail_share: float = 0.25
+    keywords: tuple[str, ...] | None = None
+    encoding: str = DEFAULT_ENCODING
+    max_pages: int | None = None
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any], agent: str) -> "InputPolicy":
+        """Create the policy of agent from `input_policy`, full text if unset."""
+        options = dict(settings.get("input_policy", {}).get(agent) or {})
+        if options.get("keywords") is not None:
+            options["keywords"] = tuple(options["keywords"])
+        return cls(**options)
+
+    @cached_property
+    def _keyword_pattern(self) -> re.Pattern[str]:
+        patterns = self.keywords
+        if patterns is None:
+            patterns = tuple(
+                pattern for rules in DEFAULT_RULES.values() for pattern, _ in rules
+            )
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+    def apply(self, text: str) -> str:
+        """Return the text to send to the LLM."""
+        if self.mode == FULL or count_tokens(text, self.encoding) <= self.max_tokens:
+            return text
+
+        lines = text.splitlines()
+        head = _take(lines, int(self.max_tokens * self.head_share), self.encoding)
+        rest = lines[len(head) :]
+        tail = _take(
+            rest[::-1],
+            int(self.max_tokens * self.tail_share),
+            self.encoding,
+        )[::-1]
+        middle = rest[: len(rest) - len(tail)]
+
+        used = sum(count_tokens(line, self.encoding) for line in head + tail)
+        keyword_lines = _take(
+            [line for line in middle if self._keyword_pattern.search(line)],
+            self.max_tokens - used,
+            self.encoding,
+        )
+        parts = [*head, GAP]
+        if keyword_lines:
+            parts += [*keyword_lines, GAP]
+        return "\n".join(parts + tail)
@@ -1,4 +1,5 @@
 from documentassistent.agents.base_agent import BaseAgent, validate_state
+from documentassistent.agents.input_policy import InputPolicy
 from documentassistent.llm.base_llm import BaseLLM
 from documentassistent.structure.pydantic_llm_calls.invoice_call import (
     InvoiceExtraction,
@@ -20,13 +21,39 @@ class InvoiceAgent(BaseAgent):
     Pydantic structure for invoice extraction tasks.
     """
 
-    def __init__(self, llm: BaseLLM | None = None) -> None:
-        super().__init__(agent_name="InvoiceAgent", logger=logger, llm=llm)
+    def __init__(
+        self,
+        llm: BaseLLM | None = None,
+        input_policy: InputPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            agent_name="InvoiceAgent",
+            logger=logger,
+            llm=llm,
+            input_policy=input_policy,
+        )
 
     @validate_state
     def extract_invoice(self, state: BaseWorkflowState) -> InvoiceExtractionState:
         """Extract invoice information from the input text."""
         state = self._convert_state(state, InvoiceExtractionState)
-        result = self.llm.call(state, pydantic_object=InvoiceExtraction)
+        result = self.llm.call(
+            self._llm_state(state),
+            pydantic_object=InvoiceExtraction,
+        )
+        logger.debug("Invoice extraction result: {}", result)
+        return state.model_copy(update={"invoice_extraction_result": result})
+
+    @validate_state
+    async def aextract_invoice(
+        self,
+        state: BaseWorkflowState,
+    ) -> InvoiceExtractionState:
+        """Extract invoice information from the input text asynchronously."""
+        state = self._convert_state(state, InvoiceExtractionState)
+        result = await self.llm.acall(
+            self._llm_state(state),
+            pydantic_object=InvoiceExtraction,
+        )
         logger.debug("Invoice extraction result: {}", result)
         return state.model_copy(update={"invoice_extraction_result": result})
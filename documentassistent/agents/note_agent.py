@@ -1,4 +1,5 @@
 from documentassistent.agents.base_agent import BaseAgent, validate_state
+from documentassistent.agents.input_policy import InputPolicy
 from documentassistent.llm.base_llm import BaseLLM
 from documentassistent.structure.pydantic_llm_calls.note_call import NoteExtraction
 from documentassistent.structure.state import BaseWorkflowState, NoteExtractionState
@@ -13,13 +14,33 @@ logger = setup_logger(
 class NoteAgent(BaseAgent):
     """Agent for extracting notes using LLMFactory."""
 
-    def __init__(self, llm: BaseLLM | None = None) -> None:
-        super().__init__(agent_name="NoteAgent", logger=logger, llm=llm)
+    def __init__(
+        self,
+        llm: BaseLLM | None = None,
+        input_policy: InputPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            agent_name="NoteAgent",
+            logger=logger,
+            llm=llm,
+            input_policy=input_policy,
+        )
 
     @validate_state
     def extract_note(self, state: BaseWorkflowState) -> NoteExtractionState:
         """Extract notes from the given text using the configured LLM."""
         state = self._convert_state(state, NoteExtractionState)
-        result = self.llm.call(state, pydantic_object=NoteExtraction)
+        result = self.llm.call(self._llm_state(state), pydantic_object=NoteExtraction)
+        logger.debug("Note extraction result: {}", result)
+        return state.model_copy(update={"note_extraction_result": result})
+
+    @validate_state
+    async def aextract_note(self, state: BaseWorkflowState) -> NoteExtractionState:
+        """Extract notes from the given text asynchronously."""
+        state = self._convert_state(state, NoteExtractionState)
+        result = await self.llm.acall(
+            self._llm_state(state),
+            pydantic_object=NoteExtraction,
+        )
         logger.debug("Note extraction result: {}", result)
         return state.model_copy(update={"note_extraction_result": result})
@@ -1,4 +1,5 @@
 from documentassistent.agents.base_agent import BaseAgent, validate_state
+from documentassistent.agents.input_policy import InputPolicy
 from documentassistent.llm.base_llm import BaseLLM
 from documentassistent.structure.pydantic_llm_calls.result_call import ResultExtraction
 from documentassistent.structure.state import BaseWorkflowState, ResultExtractionState
@@ -13,13 +14,36 @@ logger = setup_logger(
 class ResultAgent(BaseAgent):
     """Agent for extracting medical test results using LLMFactory."""
 
-    def __init__(self, llm: BaseLLM | None = None) -> None:
-        super().__init__(agent_name="ResultAgent", logger=logger, llm=llm)
+    def __init__(
+        self,
+        llm: BaseLLM | None = None,
+        input_policy: InputPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            agent_name="ResultAgent",
+            logger=logger,
+            llm=llm,
+            input_policy=input_policy,
+        )
 
     @validate_state
     def extract_result(self, state: BaseWorkflowState) -> ResultExtractionState:
         """Extract medical test results from the given text using the configured LLM."""
         state = self._convert_state(state, ResultExtractionState)
-        result = self.llm.call(state, pydantic_object=ResultExtraction)
+        result = self.llm.call(self._llm_state(state), pydantic_object=ResultExtraction)
+        logger.debug("Result extraction result: {}", result)
+        return state.model_copy(update={"result_extraction_result": result})
+
+    @validate_state
+    async def aextract_result(
+        self,
+        state: BaseWorkflowState,
+    ) -> ResultExtractionState:
+        """Extract medical test results from the given text asynchronously."""
+        state = self._convert_state(state, ResultExtractionState)
+        result = await self.llm.acall(
+            self._llm_state(state),
+            pydantic_object=ResultExtraction,
+        )
         logger.debug("Result extraction result: {}", result)
         return state.model_copy(update={"result_extraction_result": result})
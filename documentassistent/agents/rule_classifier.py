@@ -0,0 +1,217 @@
+"""Keyword/regex pre-classifier that answers obvious documents without the LLM."""
+
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from documentassistent.storage.models import Document
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(
+    name="RuleClassifier",
+    log_file="logs/rule_classifier.log",
+)
+
+# Start of the confidence explanation of every fast path decision
+FAST_PATH_EXPLANATION = "Rule-based fast path"
+
+_AMOUNT = r"\d+[.,]\d{2}\s*(?:€|eur\b)|(?:€|eur)\s*\d+[.,]\d{2}"
+_DATE = r"\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b|\b\d{4}-\d{2}-\d{2}\b"
+
+# (pattern, weight) per document type; patterns are matched case-insensitively
+DEFAULT_RULES: dict[DocumentType, list[tuple[str, float]]] = {
+    DocumentType.INVOICE: [
+        (r"\brechnung(?:snummer|sdatum|sbetrag)?\b", 3.0),
+        (r"\b(?:invoice|receipt|quittung|kassenbon|beleg)\b", 3.0),
+        (r"\b(?:summe|gesamtbetrag|gesamt|total|betrag|zu zahlen)\b", 2.0),
+        (r"\b(?:mwst|ust|umsatzsteuer|mehrwertsteuer|vat)\b", 2.0),
+        (r"\b(?:iban|bic|zahlbar|überweisung)\b", 1.5),
+        (_AMOUNT, 2.0),
+        (_DATE, 0.5),
+    ],
+    DocumentType.RESULT: [
+        (r"\b(?:befund|laborbefund|laborwerte|laborbericht)\b", 3.0),
+        (r"\b(?:referenzbereich|normbereich|reference range|normal range)\b", 3.0),
+        (r"\b(?:test results?|lab results?|untersuchungsergebnis)\b", 2.5),
+        (r"\b(?:mg/dl|mmol/l|g/dl|µmol/l|u/l|/µl|/nl)\b", 2.0),
+        (r"\b(?:hämoglobin|haemoglobin|leukozyten|cholesterin|glukose|tsh)\b", 1.5),
+    ],
+    DocumentType.NOTE: [
+        (r"\b(?:notiz|note|memo|todo|to-do|erinnerung|reminder)\b", 2.5),
+        (r"\b(?:nicht vergessen|don't forget|remember to)\b", 2.5),
+    ],
+}
+
+
+@dataclass
+class FastPathStats:
+    """Counts of documents the pre-classifier decided versus deferred."""
+
+    attempts: int = 0
+    decided: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, *, decided: bool) -> None:
+        """Count one attempt."""
+        with self._lock:
+            self.attempts += 1
+            self.decided += int(decided)
+
+    @property
+    def llm_calls_avoided(self) -> float:
+        """Fraction of classifications that skipped the LLM."""
+        return self.decided / self.attempts if self.attempts else 0.0
+
+
+@dataclass(frozen=True)
+class AgreementReport:
+    """How the pre-classifier compares with stored (LLM) labels."""
+
+    total: int
+    decided: int
+    agreed: int
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of documents the pre-classifier would have decided."""
+        return self.decided / self.total if self.total else 0.0
+
+    @property
+    def agreement(self) -> float:
+        """Fraction of decided documents that match the stored label."""
+        return self.agreed / self.decided if self.decided else 0.0
+
+
+class RuleBasedClassifier:
+    """Score keyword rules per type and decide only clear-cut documents."""
+
+    def __init__(
+        self,
+        rules: dict[DocumentType, list[tuple[str, float]]] | None = None,
+        min_score: float = 6.0,
+        margin: float = 3.0,
+    ) -> None:
+        self.rules = {
+            label: [
+                (re.compile(pattern, re.IGNORECASE), weight)
+                for pattern, weight in patterns
+            ]
+            for label, patterns in (rules or DEFAULT_RULES).items()
+        }
+        self.min_score = min_score
+        self.margin = margin
+        self.stats = FastPathStats()
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any]) -> "RuleBasedClassifier | None":
+        """Create the classifier from config.yaml settings, or None if disabled."""
+        fast_path = settings.get("classification", {}).get("fast_path", {})
+        if not fast_path.get("enabled", False):
+            return None
+        return cls(
+            min_score=fast_path.get("min_score", 6.0),
+            margin=fast_path.get("margin", 3.0),
+        )
+
+    def score(self, text: str) -> dict[DocumentType, float]:
+        """Return the summed weight of matching rules per document type."""
+        return {
+            label: sum(weight for pattern, weight in patterns if pattern.search(text))
+            for label, patterns in self.rules.items()
+        }
+
+    def predict(self, text: str) -> Classification | None:
+        """Return a HIGH-confidence Classification, or None to defer to the LLM."""
+        scores = self.score(text)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        (label, best), (_, runner_up) = ranked[0], ranked[1]
+        if best < self.min_score or best - runner_up < self.margin:
+            return None
+        return Classification(
+            label=label,
+            confidence=Confidence(
+                level=ConfidenceLevel.HIGH,
+                explanation=(
+                    f"{FAST_PATH_EXPLANATION}: {label.value} scored {best:.1f}, "
+                    f"next best {runner_up:.1f}"
+                ),
+            ),
+        )
+
+    def classify(self, text: str) -> Classification | None:
+        """Predict and record whether the LLM call could be skipped."""
+        result = self.predict(text)
+        self.stats.record(decided=result is not None)
+        if result is not None:
+            logger.debug("Fast path classified document as {}", result.label.value)
+        return result
+
+    def log_summary(self) -> None:
+        """Log how many classifications skipped the LLM."""
+        logger.info(
+            "Fast path summary: {} of {} documents classified without the LLM "
+            "({:.1%} LLM calls avoided)",
+            self.stats.decided,
+            self.stats.attempts,
+            self.stats.llm_calls_avoided,
+        )
+
+    def evaluate(self, corpus: Iterable[tuple[str, DocumentType]]) -> AgreementReport:
+        """Compare predictions with known labels, e.g. stored LLM results."""
+        total = decided = agreed = 0
+        for text, label in corpus:
+            total += 1
+            result = self.predict(text)
+            if result is not None:
+                decided += 1
+                agreed += int(result.label == label)
+        return AgreementReport(total=total, decided=decided, agreed=agreed)
+
+
+def llm_labelled(documents: Iterable[Document]) -> Iterator[tuple[str, DocumentType]]:
+    """
+    Yield text and label of the stored documents the LLM classified.
+
+    Documents the fast path classified are skipped: comparing the rules with
+    their own decisions would inflate the agreement.
+    """
+    for document in documents:
+        explanation = document.classification_confidence_explanation or ""
+        if not explanation.startswith(FAST_PATH_EXPLANATION):
+            yield document.text_content or "", document.classification_label  # type: ignore[misc]
+
+
+if __name__ == "__main__":
+    # Evaluate the rules against the labels already stored in SQLite
+    from documentassistent.storage import (
+        DocumentRepository,
+        SQLiteProfile,
+        init_database,
+    )
+    from load_config import load_config
+
+    config = load_config("config.yaml")
+    init_database(
+        config["database"]["path"],
+        SQLiteProfile.from_settings(config),
+    )
+    documents = DocumentRepository().list_all()
+    report = RuleBasedClassifier().evaluate(llm_labelled(documents))
+    logger.info(
+        "Fast path on {} of {} stored documents classified by the LLM: "
+        "{:.1%} LLM calls avoided, {:.1%} agreement with the LLM",
+        report.total,
+        len(documents),
+        report.coverage,
+        report.agreement,
+    )
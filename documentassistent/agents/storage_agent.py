@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -10,15 +11,17 @@ if TYPE_CHECKING:
 
     from documentassistent.structure.state import BaseWorkflowState
 
-from documentassistent.exceptions import FileWriteError
-from documentassistent.storage.repository import DocumentRepository, FileMetadata
+from documentassistent.exceptions import DatabaseError
+from documentassistent.storage.repository import DocumentRepository
+from documentassistent.storage.unit_of_work import Extraction, FileMetadata
 from documentassistent.structure.pydantic_llm_calls.classification_call import (
     DocumentType,
 )
 from documentassistent.utils.file_manager import (
     compute_file_hash,
     get_file_size,
-    rename_file_with_id,
+    move_file,
+    renamed_file_path,
 )
 from documentassistent.utils.logger import setup_logger
 
@@ -39,25 +42,21 @@ class StorageAgent:
         self,
         state: BaseWorkflowState,
         classification_label: DocumentType,
-        document_id: int,
-    ) -> tuple[str, str]:
-        """Get date and type for filename from extraction result."""
+    ) -> tuple[Extraction | None, str, str]:
+        """Get the extraction result and the date and type for the filename."""
         extraction_config = {
             DocumentType.INVOICE: {
                 "attr": "invoice_extraction_result",
-                "save_method": self.repository.save_invoice_extraction,
                 "get_info": lambda e: (e.date, e.type.value),
                 "default": ("unknown", "invoice"),
             },
             DocumentType.NOTE: {
                 "attr": "note_extraction_result",
-                "save_method": self.repository.save_note_extraction,
                 "get_info": lambda e: (e.date or "unknown", "note"),
                 "default": ("unknown", "note"),
             },
             DocumentType.RESULT: {
                 "attr": "result_extraction_result",
-                "save_method": self.repository.save_result_extraction,
                 "get_info": lambda _: ("unknown", "result"),
                 "default": ("unknown", "result"),
             },
@@ -69,23 +68,28 @@ class StorageAgent:
                 "Unknown classification label",
                 extra={"label": classification_label},
             )
-            return "unknown", "unknown"
+            return None, "unknown", "unknown"
 
         attr_name = cast("str", config["attr"])
-        save_method = cast("Callable[[int, Any], None]", config["save_method"])
         get_info = cast("Callable[[Any], tuple[str, str]]", config["get_info"])
         default = cast("tuple[str, str]", config["default"])
 
         extraction = getattr(state, attr_name)
         if extraction:
-            save_method(document_id, extraction)
-            return get_info(extraction)
+            return extraction, *get_info(extraction)
 
         logger.warning("No extraction result found", extra={"attr": attr_name})
-        return default
+        return None, *default
 
     def store_results(self, state: BaseWorkflowState) -> BaseWorkflowState:
-        """Store document and extraction results, rename file with document ID."""
+        """
+        Store document and extraction results, rename file with document ID.
+
+        The document row, its extraction and the renamed path are written in
+        one transaction. The file is moved just before the commit: if the
+        move fails nothing is stored, if the commit fails the file is moved
+        back.
+        """
         if not state.file_path:
             logger.warning("No file_path in state, skipping storage")
             return state
@@ -96,63 +100,70 @@ class StorageAgent:
             return state
 
         file_path = state.file_path
-        file_hash = compute_file_hash(file_path)
-        file_size = get_file_size(file_path)
-        file_type = Path(file_path).suffix.lower().lstrip(".")
-
-        existing_doc = self.repository.get_document_by_hash(file_hash)
-        if existing_doc:
-            logger.info(
-                "Document already exists",
-                extra={
-                    "document_id": existing_doc.id,
-                    "file_path": file_path,
-                },
-            )
-            return state.model_copy(update={"document_id": existing_doc.id})
-
+        file_hash = state.file_hash or compute_file_hash(file_path)
         file_metadata = FileMetadata(
             path=file_path,
             hash=file_hash,
-            size=file_size,
-            type=file_type,
-        )
-
-        document_id = self.repository.save_document(
-            file_metadata=file_metadata,
-            classification=classification_result,
-            text_content=state.text,
-        )
-
-        date_for_filename, type_for_filename = self._get_extraction_info(
-            state,
-            classification_result.label,
-            document_id,
+            size=get_file_size(file_path),
+            type=Path(file_path).suffix.lower().lstrip("."),
         )
 
+        moved_to: str | None = None
         try:
-            renamed_path = rename_file_with_id(
-                original_path=file_path,
-                document_id=document_id,
-                doc_type=type_for_filename,
-                date=date_for_filename,
-                file_hash=file_hash,
-            )
-            self.repository.update_renamed_path(document_id, renamed_path)
-
-            logger.success(
-                "Document stored and renamed",
-                extra={
-                    "document_id": document_id,
-                    "renamed_path": renamed_path,
-                },
-            )
-        except OSError as e:
-            msg = f"Failed to rename file for document {document_id}"
-            logger.exception(
-                "Failed to rename file, document saved but path not updated",
-                extra={"document_id": document_id},
-            )
-            raise FileWriteError(msg) from e
-
+            with self.repository.unit_of_work() as uow:
+                existing_doc = uow.get_document_by_hash(file_hash)
+                if existing_doc:
+                    logger.info(
+                        "Document already exists",
+                        extra={
+                            "document_id": existing_doc.id,
+                            "file_path": file_path,
+                        },
+                    )
+                    return state.model_copy(update={"document_id": existing_doc.id})
+
+                document = uow.add_document(
+                    file_metadata=file_metadata,
+                    classification=classification_result,
+                    text_content=(
+                        state.text
+                        if state.original_text is None
+                        else state.original_text
+                    ),
+                )
+                document_id = cast("int", document.id)
+
+                extraction, date_for_filename, type_for_filename = (
+                    self._get_extraction_info(state, classification_result.label)
+                )
+                if extraction is not None:
+                    uow.add_extraction(document, extraction)
+
+                renamed_path = renamed_file_path(
+                    original_path=file_path,
+                    document_id=document_id,
+                    doc_type=type_for_filename,
+                    date=date_for_filename,
+                    file_hash=file_hash,
+                )
+                uow.set_renamed_path(document, renamed_path)
+                move_file(file_path, renamed_path, document_id)
+                moved_to = renamed_path
+        except DatabaseError:
+            if moved_to is not None:
+                logger.exception(
+                    "Commit failed, moving file back",
+                    extra={"document_id": document_id},
+                )
+                move_file(moved_to, file_path, document_id)
+            raise
+
+        logger.success(
+            "Document stored and renamed",
+            extra={"document_id": document_id, "renamed_path": renamed_path},
+        )
         return state.model_copy(update={"document_id": document_id})
+
+    async def astore_results(self, state: BaseWorkflowState) -> BaseWorkflowState:
+        """Store results in a worker thread so the event loop is not blocked."""
+        return await asyncio.to_thread(self.store_results, state)
@@ -0,0 +1,320 @@
+"""Batch ingestion engine with per-stage worker pools and bounded queues."""
+
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from documentassistent.agents.rule_classifier import RuleBasedClassifier
+from documentassistent.agents.storage_agent import StorageAgent
+from documentassistent.input_engineering.dedup_gate import DedupGate, DedupStats
+from documentassistent.input_engineering.input_reader import DocumentReader
+from documentassistent.input_engineering.reader_registry import (
+    IMAGE_FORMATS,
+    ReaderRegistry,
+    detect_format,
+)
+from documentassistent.input_engineering.text_normalizer import TextNormalizer
+from documentassistent.llm.base_llm import BaseLLM
+from documentassistent.llm.json_repair import repair_stats
+from documentassistent.llm.llm_factory import LLMFactory, config_from_settings
+from documentassistent.pipeline import create_extraction_pipeline
+from documentassistent.structure.state import ClassificationState, Document
+from documentassistent.utils.logger import setup_logger
+from load_config import load_config
+
+logger = setup_logger(
+    name="BatchEngine",
+    log_file="logs/batch.log",
+)
+
+CONFIG = load_config("config.yaml")
+
+_STOP = object()
+
+# Registry of the current read worker process, set once by the pool initializer
+_worker_readers: ReaderRegistry | None = None
+
+
+def _init_read_worker(readers: ReaderRegistry) -> None:
+    """Keep the registry in the worker, so its readers are reused across files."""
+    global _worker_readers  # noqa: PLW0603
+    _worker_readers = readers
+
+
+def _read_in_worker(path: str) -> Document:
+    """Read a file with the registry of this worker process."""
+    if _worker_readers is None:
+        msg = "Read worker was started without _init_read_worker"
+        raise RuntimeError(msg)
+    return _worker_readers.read(path)
+
+
+def _create_read_pool(readers: ReaderRegistry, max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers each hold their own reader registry.
+
+    The registry is sent to each worker once when it starts instead of with
+    every file, and the readers it builds (and their OCR engines) stay alive
+    for all files the worker reads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_read_worker,
+        initargs=(readers,),
+    )
+
+
+@dataclass(frozen=True)
+class BatchWorkers:
+    """Worker counts and queue bounds for each stage of the batch engine."""
+
+    readers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    llm: int = 4
+    queue_size: int = 16
+
+
+@dataclass
+class BatchReport:
+    """Summary of a batch run."""
+
+    stored: dict[str, int] = field(default_factory=dict)
+    skipped: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+    dedup: DedupStats = field(default_factory=DedupStats)
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class _Job:
+    """A file travelling through the stages of the engine."""
+
+    path: str
+    file_hash: str
+    started_at: float
+    document: "Future[Document] | None" = None
+    state: Any = None
+
+
+class _BatchRun:
+    """State and stage workers of a single batch run."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        workers: BatchWorkers,
+        *,
+        extraction_pipeline: Any,
+        storage_agent: StorageAgent,
+        dedup_gate: DedupGate,
+        read: Callable[[str], Document],
+        image_reader: DocumentReader | None,
+        normalizer: TextNormalizer | None,
+    ) -> None:
+        self.workers = workers
+        self.read = read
+        self.image_reader = image_reader
+        self.normalizer = normalizer
+        self.extraction_pipeline = extraction_pipeline
+        self.storage_agent = storage_agent
+        self.gate = dedup_gate
+        self.report = BatchReport(dedup=dedup_gate.stats)
+        self._report_lock = threading.Lock()
+        self._read_queue: queue.Queue[Any] = queue.Queue(maxsize=workers.queue_size)
+        self._write_queue: queue.Queue[Any] = queue.Queue(maxsize=workers.queue_size)
+
+    def _fail(self, job: _Job, error: Exception) -> None:
+        """Record a failed file with the error that stopped it."""
+        logger.opt(exception=error).error("Failed to process {}", job.path)
+        with self._report_lock:
+            self.report.failed[job.path] = str(error)
+
+    def _llm_worker(self) -> None:
+        """Classify and extract documents as soon as they have been read."""
+        while (job := self._read_queue.get()) is not _STOP:
+            try:
+                assert job.document is not None
+                document = job.document.result()
+                text = (
+                    self.normalizer.normalize(document).text
+                    if self.normalizer
+                    else document.content
+                )
+                state = ClassificationState(
+                    text=text,
+                    original_text=document.content,
+                    file_path=str(Path(job.path).absolute()),
+                    file_hash=job.file_hash,
+                )
+                job.state = self.extraction_pipeline.invoke(state)
+            except Exception as e:  # noqa: BLE001
+                self._fail(job, e)
+                continue
+            self._write_queue.put(job)
+
+    def _writer(self) -> None:
+        """Store results one at a time so the database sees a single writer."""
+        while (job := self._write_queue.get()) is not _STOP:
+            try:
+                result = self.storage_agent.store_results(job.state)
+            except Exception as e:  # noqa: BLE001
+                self._fail(job, e)
+                continue
+            self.gate.record_processed(time.perf_counter() - job.started_at)
+            with self._report_lock:
+                if result.document_id is None:
+                    self.report.failed[job.path] = "Document was not stored"
+                else:
+                    self.report.stored[job.path] = result.document_id
+
+    def _feed(
+        self,
+        paths: Iterable[Path | str],
+        executor: Executor,
+        image_executor: Executor,
+    ) -> None:
+        """Dedup each file and submit the new ones for reading."""
+        for path in map(str, paths):
+            job = _Job(path=path, file_hash="", started_at=time.perf_counter())
+            try:
+                dedup = self.gate.check(path)
+            except OSError as e:
+                self._fail(job, e)
+                continue
+            if dedup.document_id is not None:
+                with self._report_lock:
+                    self.report.skipped[path] = dedup.document_id
+                continue
+            job.file_hash = dedup.file_hash
+            if self.image_reader is not None and detect_format(path) in IMAGE_FORMATS:
+                job.document = image_executor.submit(self.image_reader.read, path)
+            else:
+                job.document = executor.submit(self.read, path)
+            # Blocks when the LLM stage is behind, which throttles reading
+            self._read_queue.put(job)
+
+    def run(self, paths: Iterable[Path | str], executor: Executor) -> BatchReport:
+        """Run all stages until every file has been stored, skipped or failed."""
+        llm_threads = [
+            threading.Thread(target=self._llm_worker, name=f"batch-llm-{i}")
+            for i in range(self.workers.llm)
+        ]
+        writer_thread = threading.Thread(target=self._writer, name="batch-writer")
+        for thread in [*llm_threads, writer_thread]:
+            thread.start()
+
+        # Image reads only wait for the OCR pool, so threads are enough
+        image_executor = ThreadPoolExecutor(
+            max_workers=self.workers.readers,
+            thread_name_prefix="batch-image",
+        )
+        try:
+            self._feed(paths, executor, image_executor)
+        finally:
+            for _ in llm_threads:
+                self._read_queue.put(_STOP)
+            for thread in llm_threads:
+                thread.join()
+            self._write_queue.put(_STOP)
+            writer_thread.join()
+            image_executor.shutdown()
+        return self.report
+
+
+def process_directory(  # noqa: PLR0913
+    paths: Iterable[Path | str],
+    workers: BatchWorkers | None = None,
+    *,
+    extraction_pipeline: Any = None,
+    storage_agent: StorageAgent | None = None,
+    dedup_gate: DedupGate | None = None,
+    read_executor: Executor | None = None,
+    readers: ReaderRegistry | None = None,
+    image_reader: DocumentReader | None = None,
+    normalizer: TextNormalizer | None = None,
+    llm: BaseLLM | None = None,
+    pre_classifier: RuleBasedClassifier | None = None,
+) -> BatchReport:
+    """
+    Process many documents concurrently: read -> classify/extract -> store.
+
+    Reading and OCR run in a process pool, LLM calls run in a thread pool and
+    all database writes go through a single writer thread. Bounded queues
+    between the stages keep fast stages from running ahead of slow ones.
+
+    Args:
+        paths: Files to process. Directories are not expanded.
+        workers: Worker counts and queue bounds. If None, uses defaults.
+        extraction_pipeline: Classify -> extract runnable. If None, creates default.
+        storage_agent: Agent used by the writer thread. If None, creates default.
+        dedup_gate: Gate used to skip stored files. If None, creates default.
+        read_executor: Executor for reading files, called with readers.read (a
+            thread pool shares the registry). If None, uses a process pool
+            whose workers each keep their own registry.
+        readers: Readers by file format. If None, uses the default readers.
+        image_reader: Reader for image files, called in threads of this process
+            instead of the read executor, e.g. one that OCRs in an
+            OCRWorkerPool. If None, images are read like other files.
+        normalizer: Cleans up text before the LLM. If None, text is used as read.
+        llm: LLM of the default extraction pipeline, whose statistics are logged
+            at the end. If None and no pipeline is given, creates it from config.
+        pre_classifier: Fast path of the default extraction pipeline, whose LLM
+            calls avoided are logged at the end. If None and no pipeline is
+            given, creates it from config (if enabled there).
+
+    Returns:
+        BatchReport with stored, skipped and failed files.
+    """
+    workers = workers or BatchWorkers()
+    repair_stats.reset()
+    readers = readers or ReaderRegistry.default()
+    if extraction_pipeline is None:
+        llm = llm or LLMFactory.create_llm(config_from_settings(CONFIG))
+        pre_classifier = pre_classifier or RuleBasedClassifier.from_settings(CONFIG)
+        extraction_pipeline = create_extraction_pipeline(
+            llm=llm,
+            pre_classifier=pre_classifier,
+        )
+    batch_run = _BatchRun(
+        workers=workers,
+        extraction_pipeline=extraction_pipeline,
+        storage_agent=storage_agent or StorageAgent(),
+        dedup_gate=dedup_gate or DedupGate(),
+        read=readers.read if read_executor is not None else _read_in_worker,
+        image_reader=image_reader,
+        normalizer=normalizer,
+    )
+
+    start = time.perf_counter()
+    if read_executor is not None:
+        report = batch_run.run(paths, read_executor)
+    else:
+        with _create_read_pool(readers, workers.readers) as executor:
+            report = batch_run.run(paths, executor)
+    report.elapsed_seconds = time.perf_counter() - start
+
+    logger.info(
+        "Batch finished in {:.1f}s: {} stored, {} skipped, {} failed",
+        report.elapsed_seconds,
+        len(report.stored),
+        len(report.skipped),
+        len(report.failed),
+    )
+    batch_run.gate.log_summary()
+    if normalizer is not None:
+        normalizer.log_summary()
+    if pre_classifier is not None:
+        pre_classifier.log_summary()
+    if llm is not None:
+        llm.log_summary()
+    repair_stats.log_summary()
+    return report
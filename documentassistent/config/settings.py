@@ -10,10 +10,106 @@ from pydantic import ValidationError as PydanticValidationError
 from documentassistent.exceptions import ConfigurationError
 
 
+class LLMCacheConfig(BaseModel):
+    """Configuration for the persistent LLM response cache."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Serve identical requests from the cache",
+    )
+    path: str = Field(
+        default="data/llm_cache.db",
+        description="SQLite file holding cached responses",
+    )
+    max_entries: int = Field(
+        default=10_000,
+        gt=0,
+        description="Maximum cached responses before LRU eviction",
+    )
+    ttl_seconds: float | None = Field(
+        default=None,
+        gt=0,
+        description="Time to live of an entry (None = never expires)",
+    )
+
+
+class LatencyConfig(BaseModel):
+    """Synthetic latency applied by the replay provider."""
+
+    kind: Literal["fixed", "lognormal", "recorded"] = Field(
+        default="fixed",
+        description="Latency distribution",
+    )
+    seconds: float = Field(default=0.0, ge=0.0, description="Fixed delay")
+    median: float = Field(default=1.0, gt=0.0, description="Lognormal median")
+    sigma: float = Field(default=0.5, ge=0.0, description="Lognormal spread")
+    scale: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Factor applied to recorded timings",
+    )
+    seed: int | None = Field(default=None, description="Random seed")
+
+
+class ReplayConfig(BaseModel):
+    """Configuration for the offline replay provider."""
+
+    path: str = Field(
+        default="data/llm_recordings.jsonl",
+        description="JSONL file with recorded responses",
+    )
+    latency: LatencyConfig = Field(default_factory=LatencyConfig)
+
+
+class RecordConfig(BaseModel):
+    """Configuration for recording real responses for later replay."""
+
+    enabled: bool = Field(default=False, description="Record every LLM response")
+    path: str = Field(
+        default="data/llm_recordings.jsonl",
+        description="JSONL file recordings are appended to",
+    )
+
+
+class CascadeConfig(BaseModel):
+    """Configuration for the small-to-large model cascade."""
+
+    enabled: bool = Field(default=False, description="Escalate through models")
+    models: list[str] = Field(
+        default_factory=lambda: ["gemma:2b", "gemma:7b"],
+        description="Models of the configured provider, smallest first",
+    )
+    escalate_on: list[Literal["low", "medium", "high"]] = Field(
+        default=["low", "medium"],
+        description="Confidence levels that are re-run on the next model",
+    )
+
+
+class ChunkingConfig(BaseModel):
+    """Configuration for map-reduce extraction of long texts."""
+
+    enabled: bool = Field(default=True, description="Extract long texts in chunks")
+    max_tokens: int | None = Field(
+        default=None,
+        gt=0,
+        description="Upper bound of tokens per chunk (None = what fits in num_ctx)",
+    )
+    overlap_tokens: int = Field(
+        default=200,
+        ge=0,
+        description="Tokens repeated from the end of the previous chunk",
+    )
+    max_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Chunks extracted at the same time",
+    )
+
+
 class LLMConfig(BaseModel):
     """Configuration for LLM providers."""
 
-    provider: Literal["ollama", "openai"] = Field(
+    provider: Literal["ollama", "openai", "replay"] = Field(
         default="ollama",
         description="LLM provider to use",
     )
@@ -30,8 +126,22 @@ class LLMConfig(BaseModel):
     max_tokens: int = Field(
         default=2000,
         gt=0,
-        description="Maximum tokens to generate",
+        description="Maximum tokens to generate, kept free of the context window",
     )
+    num_ctx: int | None = Field(
+        default=8192,
+        gt=0,
+        description="Context window in tokens (None = model default)",
+    )
+    structured_output: bool | None = Field(
+        default=None,
+        description="Use schema-constrained decoding (None = provider default)",
+    )
+    cache: LLMCacheConfig = Field(default_factory=LLMCacheConfig)
+    record: RecordConfig = Field(default_factory=RecordConfig)
+    replay: ReplayConfig = Field(default_factory=ReplayConfig)
+    cascade: CascadeConfig = Field(default_factory=CascadeConfig)
+    chunking: ChunkingConfig = Field(default_factory=ChunkingConfig)
 
 
 class PathsConfig(BaseModel):
@@ -45,6 +155,186 @@ class PathsConfig(BaseModel):
     )
 
 
+class ExtractionCacheConfig(BaseModel):
+    """Configuration for the on-disk extracted-text cache."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Reuse extracted text/OCR output for identical files",
+    )
+    path: str = Field(
+        default="data/extraction_cache",
+        description="Cache directory",
+    )
+    max_megabytes: float = Field(
+        default=512,
+        gt=0,
+        description="Least recently used entries are evicted beyond this size",
+    )
+
+
+class PreprocessConfig(BaseModel):
+    """Configuration for image preprocessing before OCR."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Preprocess images before OCR",
+    )
+    exif_rotate: bool = Field(
+        default=True,
+        description="Rotate images upright according to their EXIF orientation",
+    )
+    target_dpi: int | None = Field(
+        default=300,
+        gt=0,
+        description="Downscale to this DPI for an A4 page (None = keep size)",
+    )
+    grayscale: bool = Field(default=True, description="Convert to grayscale")
+    binarize: bool = Field(
+        default=True,
+        description="Adaptive (local mean) black/white thresholding",
+    )
+    block_size: int = Field(
+        default=31,
+        gt=1,
+        description="Neighbourhood size in pixels for the adaptive threshold",
+    )
+    offset: float = Field(
+        default=10.0,
+        description="Pixels darker than the local mean minus this become black",
+    )
+    deskew: bool = Field(default=False, description="Straighten skewed text lines")
+    max_skew_degrees: float = Field(
+        default=5.0,
+        gt=0,
+        description="Largest skew angle searched when deskewing",
+    )
+
+
+class OCRPoolConfig(BaseModel):
+    """Configuration for the pool of OCR worker processes used for images."""
+
+    pool_workers: int | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Processes OCRing the images of a batch run, each keeping its engine "
+            "loaded (None = OCR in the read workers)"
+        ),
+    )
+
+
+class ReadingConfig(BaseModel):
+    """Configuration for document readers."""
+
+    pdf_workers: int | None = Field(
+        default=None,
+        gt=0,
+        description="Processes extracting pages of one large PDF (None = serial)",
+    )
+    pdf_parallel_min_pages: int = Field(
+        default=64,
+        gt=0,
+        description="Minimum page count before a PDF is read in parallel",
+    )
+    ocr_scanned_pages: bool = Field(
+        default=True,
+        description="OCR PDF pages whose text layer is empty or garbage",
+    )
+    ocr_workers: int | None = Field(
+        default=None,
+        gt=0,
+        description="Processes OCRing scanned pages of one PDF (None = serial)",
+    )
+    min_text_chars: int = Field(
+        default=20,
+        ge=0,
+        description="Visible characters a page needs to count as having text",
+    )
+    ocr_engine: Literal["auto", "tesserocr", "pytesseract"] = Field(
+        default="auto",
+        description="OCR engine; auto prefers tesserocr (model stays loaded)",
+    )
+    ocr_language: str | None = Field(
+        default=None,
+        description="Tesseract language(s), e.g. 'deu+eng' (None = tesseract default)",
+    )
+    ocr: OCRPoolConfig = Field(default_factory=OCRPoolConfig)
+    cache: ExtractionCacheConfig = Field(default_factory=ExtractionCacheConfig)
+    preprocess: PreprocessConfig = Field(default_factory=PreprocessConfig)
+
+
+class NormalizationConfig(BaseModel):
+    """Configuration for text normalization before the LLM calls."""
+
+    enabled: bool = Field(default=True, description="Normalize text before the LLM")
+    strip_repeated_lines: bool = Field(
+        default=True,
+        description="Keep page headers/footers repeated across pages only once",
+    )
+    join_hyphenation: bool = Field(
+        default=True,
+        description="Re-join words hyphenated at line breaks",
+    )
+    drop_noise_lines: bool = Field(
+        default=True,
+        description="Drop lines without digits and with hardly any letters",
+    )
+    min_alnum: int = Field(
+        default=2,
+        ge=0,
+        description="Letters/digits a line needs to be kept",
+    )
+    repeat_ratio: float = Field(
+        default=0.5,
+        gt=0,
+        le=1,
+        description="Fraction of pages a header/footer line must appear on",
+    )
+    edge_depth: int = Field(
+        default=3,
+        ge=1,
+        description="Lines at the top and bottom of a page checked for repeats",
+    )
+    encoding: str = Field(
+        default="cl100k_base",
+        description="tiktoken encoding for token counts ('estimate' = no tokenizer)",
+    )
+
+
+class SQLiteConfig(BaseModel):
+    """Pragmas applied to every SQLite connection, and the pool size."""
+
+    journal_mode: Literal["wal", "delete", "truncate", "persist", "memory"] = Field(
+        default="wal",
+        description="WAL lets readers run while a document is written",
+    )
+    synchronous: Literal["off", "normal", "full", "extra"] = Field(
+        default="normal",
+        description="With WAL, normal only syncs at checkpoints",
+    )
+    cache_size_kib: int = Field(default=65536, gt=0, description="Page cache size")
+    mmap_size: int = Field(
+        default=268435456,
+        ge=0,
+        description="Bytes of the database file read through mmap, 0 = off",
+    )
+    temp_store: Literal["default", "file", "memory"] = Field(
+        default="memory",
+        description="Where temporary tables and indexes are kept",
+    )
+    busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="How long a writer waits for a lock before failing",
+    )
+    pool_size: int = Field(
+        default=8,
+        gt=0,
+        description="Pooled connections, at least the number of worker threads",
+    )
+
+
 class DatabaseConfig(BaseModel):
     """Configuration for database."""
 
@@ -52,6 +342,98 @@ class DatabaseConfig(BaseModel):
         default="data/extractions.db",
         description="SQLite database path",
     )
+    sqlite: SQLiteConfig = Field(default_factory=SQLiteConfig)
+
+
+class BatchConfig(BaseModel):
+    """Configuration for batch directory ingestion."""
+
+    read_workers: int | None = Field(
+        default=None,
+        gt=0,
+        description="Processes for PDF parsing and OCR (defaults to CPU count)",
+    )
+    llm_workers: int = Field(
+        default=4,
+        gt=0,
+        description="Threads issuing concurrent LLM calls",
+    )
+    queue_size: int = Field(
+        default=16,
+        gt=0,
+        description="Maximum number of documents waiting between stages",
+    )
+
+
+class FastPathConfig(BaseModel):
+    """Configuration for the rule-based pre-classifier."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Classify clear-cut documents without calling the LLM",
+    )
+    min_score: float = Field(
+        default=6.0,
+        gt=0.0,
+        description="Minimum rule score of the winning document type",
+    )
+    margin: float = Field(
+        default=3.0,
+        ge=0.0,
+        description="Minimum score lead over the runner-up type",
+    )
+
+
+class ClassificationConfig(BaseModel):
+    """Configuration for document classification."""
+
+    fast_path: FastPathConfig = Field(default_factory=FastPathConfig)
+
+
+class InputPolicyConfig(BaseModel):
+    """Which part of a document's text an agent sends to the LLM."""
+
+    mode: Literal["full", "excerpt"] = Field(
+        default="full",
+        description="full = whole text; excerpt = start, end and keyword lines",
+    )
+    max_tokens: int = Field(
+        default=800,
+        gt=0,
+        description="Token budget of an excerpt; shorter texts are sent as is",
+    )
+    head_share: float = Field(
+        default=0.5,
+        ge=0,
+        le=1,
+        description="Share of the budget for the start of the text",
+    )
+    tail_share: float = Field(
+        default=0.25,
+        ge=0,
+        le=1,
+        description="Share of the budget for the end of the text",
+    )
+    keywords: list[str] | None = Field(
+        default=None,
+        description="Regexes of lines kept from the middle (None = rule patterns)",
+    )
+    max_pages: int | None = Field(
+        default=None,
+        gt=0,
+        description="Pages read before the agent runs in main.py (None = all)",
+    )
+
+
+class AgentInputPolicies(BaseModel):
+    """Input policy per agent."""
+
+    classification: InputPolicyConfig = Field(
+        default_factory=lambda: InputPolicyConfig(mode="excerpt"),
+    )
+    invoice: InputPolicyConfig = Field(default_factory=InputPolicyConfig)
+    note: InputPolicyConfig = Field(default_factory=InputPolicyConfig)
+    result: InputPolicyConfig = Field(default_factory=InputPolicyConfig)
 
 
 class GraphRAGConfig(BaseModel):
@@ -100,7 +482,14 @@ class AppConfig(BaseModel):
 
     llm: LLMConfig = Field(default_factory=LLMConfig)
     paths: PathsConfig = Field(default_factory=PathsConfig)
+    reading: ReadingConfig = Field(default_factory=ReadingConfig)
+    normalization: NormalizationConfig = Field(default_factory=NormalizationConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    batch: BatchConfig = Field(default_factory=BatchConfig)
+    classification: ClassificationConfig = Field(
+        default_factory=ClassificationConfig,
+    )
+    input_policy: AgentInputPolicies = Field(default_factory=AgentInputPolicies)
     graphrag: GraphRAGConfig = Field(default_factory=GraphRAGConfig)
     api: APIConfig = Field(default_factory=APIConfig)
 
@@ -1,14 +1,17 @@
 from enum import Enum
 from typing import Any
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph
 
 from documentassistent.agents.classification_agent import ClassificationAgent
+from documentassistent.agents.input_policy import InputPolicy
 from documentassistent.agents.invoice_agent import InvoiceAgent
 from documentassistent.agents.note_agent import NoteAgent
 from documentassistent.agents.result_agent import ResultAgent
+from documentassistent.agents.rule_classifier import RuleBasedClassifier
 from documentassistent.agents.storage_agent import StorageAgent
-from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
+from documentassistent.llm.llm_factory import LLMFactory, config_from_settings
 from documentassistent.structure.state import ClassificationState
 from documentassistent.utils.logger import setup_logger
 from load_config import load_config
@@ -53,6 +56,7 @@ def create_graph(
     Example:
         # Production usage with defaults
         graph = create_graph()
+        result = await graph.ainvoke(state)  # async nodes, no thread per doc
 
         # Testing with mock agents
         graph = create_graph(
@@ -70,49 +74,74 @@ def create_graph(
         or result_agent is None
     ):
         # Create LLM once for all agents that need it (dependency injection)
-        provider = CONFIG.get("llm", {}).get("provider", "ollama")
-        model = CONFIG.get("llm", {}).get(
-            "model",
-            CONFIG.get(provider, {}).get("model"),
-        )
-        config: ConfigDict = {
-            "llm": {
-                "type": provider,
-                "model": model,
-            },
-        }
+        config = config_from_settings(CONFIG)
         llm = LLMFactory.create_llm(config)
         logger.info(
             "Created shared LLM instance",
-            extra={"type": provider, "model": model},
+            extra={"type": config["llm"]["type"], "model": config["llm"]["model"]},
         )
 
         # Create default agents for any that weren't provided
         if classification_agent is None:
-            classification_agent = ClassificationAgent(llm=llm)
+            classification_agent = ClassificationAgent(
+                llm=llm,
+                pre_classifier=RuleBasedClassifier.from_settings(CONFIG),
+                input_policy=InputPolicy.from_settings(CONFIG, "classification"),
+            )
         if invoice_agent is None:
-            invoice_agent = InvoiceAgent(llm=llm)
+            invoice_agent = InvoiceAgent(
+                llm=llm,
+                input_policy=InputPolicy.from_settings(CONFIG, "invoice"),
+            )
         if note_agent is None:
-            note_agent = NoteAgent(llm=llm)
+            note_agent = NoteAgent(
+                llm=llm,
+                input_policy=InputPolicy.from_settings(CONFIG, "note"),
+            )
         if result_agent is None:
-            result_agent = ResultAgent(llm=llm)
+            result_agent = ResultAgent(
+                llm=llm,
+                input_policy=InputPolicy.from_settings(CONFIG, "result"),
+            )
 
     if storage_agent is None:
         storage_agent = StorageAgent()
 
     builder = StateGraph(ClassificationState)
 
+    # Each node has a sync and an async implementation (graph.invoke/ainvoke)
     builder.add_node(
         AgentNames.CLASSIFICATION.value,
-        classification_agent.classify,
+        RunnableLambda(
+            classification_agent.classify,
+            afunc=classification_agent.aclassify,
+        ),
     )
     builder.add_node(
         AgentNames.INVOICE.value,
-        invoice_agent.extract_invoice,
+        RunnableLambda(
+            invoice_agent.extract_invoice,
+            afunc=invoice_agent.aextract_invoice,
+        ),
+    )
+    builder.add_node(
+        AgentNames.NOTE.value,
+        RunnableLambda(note_agent.extract_note, afunc=note_agent.aextract_note),
+    )
+    builder.add_node(
+        AgentNames.RESULT.value,
+        RunnableLambda(
+            result_agent.extract_result,
+            afunc=result_agent.aextract_result,
+        ),
+    )
+    builder.add_node(
+        AgentNames.STORAGE.value,
+        RunnableLambda(
+            storage_agent.store_results,
+            afunc=storage_agent.astore_results,
+        ),
     )
-    builder.add_node(AgentNames.NOTE.value, note_agent.extract_note)
-    builder.add_node(AgentNames.RESULT.value, result_agent.extract_result)
-    builder.add_node(AgentNames.STORAGE.value, storage_agent.store_results)
 
     builder.set_entry_point(AgentNames.CLASSIFICATION.value)
 
@@ -0,0 +1,96 @@
+"""Deduplication gate that skips files already stored before any reading happens."""
+
+import time
+from dataclasses import dataclass
+
+from documentassistent.storage.repository import DocumentRepository
+from documentassistent.utils.file_manager import compute_file_hash
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(
+    name="DedupGate",
+    log_file="logs/dedup_gate.log",
+)
+
+
+@dataclass(frozen=True)
+class DedupResult:
+    """Outcome of checking a single file against the database."""
+
+    file_hash: str
+    document_id: int | None = None
+
+    @property
+    def is_duplicate(self) -> bool:
+        """Return True if the file is already stored."""
+        return self.document_id is not None
+
+
+@dataclass
+class DedupStats:
+    """Counters collected by the dedup gate during a run."""
+
+    checked: int = 0
+    skipped: int = 0
+    processed: int = 0
+    hashing_seconds: float = 0.0
+    processing_seconds: float = 0.0
+
+    @property
+    def average_processing_seconds(self) -> float:
+        """Average time spent reading and processing a new file."""
+        if self.processed == 0:
+            return 0.0
+        return self.processing_seconds / self.processed
+
+    @property
+    def estimated_seconds_saved(self) -> float:
+        """Estimate time saved by skipping duplicates, net of hashing cost."""
+        average_hashing = self.hashing_seconds / self.checked if self.checked else 0.0
+        saved = self.skipped * (self.average_processing_seconds - average_hashing)
+        return max(saved, 0.0)
+
+
+class DedupGate:
+    """Hash files up front and short-circuit those already in the database."""
+
+    def __init__(self, repository: DocumentRepository | None = None) -> None:
+        self.repository = repository or DocumentRepository()
+        self.stats = DedupStats()
+
+    def check(self, path: str) -> DedupResult:
+        """Hash the file and look it up, without reading its content."""
+        start = time.perf_counter()
+        file_hash = compute_file_hash(path)
+        existing_doc = self.repository.get_document_by_hash(file_hash)
+        self.stats.hashing_seconds += time.perf_counter() - start
+        self.stats.checked += 1
+
+        if existing_doc is None:
+            return DedupResult(file_hash=file_hash)
+
+        self.stats.skipped += 1
+        document_id: int = existing_doc.id  # type: ignore[assignment]
+        logger.info(
+            "Skipping already stored file {} (document ID {})",
+            path,
+            document_id,
+        )
+        return DedupResult(file_hash=file_hash, document_id=document_id)
+
+    def record_processed(self, seconds: float) -> None:
+        """Record the time it took to fully process a new file."""
+        self.stats.processed += 1
+        self.stats.processing_seconds += seconds
+
+    def log_summary(self) -> None:
+        """Log how many files were skipped and the estimated time saved."""
+        logger.info(
+            "Dedup summary: {} checked, {} skipped, {} processed, "
+            "~{:.1f}s saved (hashing took {:.2f}s)",
+            self.stats.checked,
+            self.stats.skipped,
+            self.stats.processed,
+            self.stats.estimated_seconds_saved,
+            self.stats.hashing_seconds,
+        )
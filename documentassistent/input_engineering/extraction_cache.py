@@ -0,0 +1,137 @@
+"""Content-addressed on-disk cache of extracted document text."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from documentassistent.structure.state import Document
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="ExtractionCache", log_file="logs/extraction_cache.log")
+
+DEFAULT_CACHE_DIR = "data/extraction_cache"
+
+
+class ExtractionCache:
+    """
+    Extracted Documents stored as JSON files named by file hash and reader config.
+
+    Entries are written atomically, so several reader processes can share one
+    directory. The least recently used entries are evicted once the directory
+    grows beyond max_bytes. Each instance keeps a running estimate of the
+    directory size and only scans it once the estimate passes max_bytes or
+    every scan_interval puts, which also picks up other processes' writes.
+    The cache holds no open handles and is picklable, so readers carrying it
+    can be sent to a process pool.
+    """
+
+    SUFFIX = ".json"
+    scan_interval = 100
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Size at the last scan plus this instance's writes since then
+        self._estimated_bytes: int | None = None
+        self._puts_since_scan = 0
+
+    @staticmethod
+    def key(file_hash: str, settings: dict[str, Any]) -> str:
+        """Combine the file's SHA-256 with everything that affects the output."""
+        fingerprint = json.dumps(settings, sort_keys=True, default=str)
+        settings_hash = hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+        return f"{file_hash}-{settings_hash}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Document | None:
+        """Return the cached Document for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            payload = path.read_text(encoding="utf-8")
+            # Refresh the access time that eviction orders by
+            now = time.time()
+            os.utime(path, (now, now))
+            document = Document.model_validate_json(payload)
+        except FileNotFoundError:
+            # Never stored, or evicted by another process meanwhile
+            return None
+        except (OSError, ValidationError):
+            logger.warning("Dropping unreadable extraction cache entry {}", key)
+            path.unlink(missing_ok=True)
+            return None
+        logger.debug("Extraction cache hit {}", key)
+        return document
+
+    def put(self, key: str, document: Document) -> None:
+        """Store document under key and evict old entries beyond max_bytes."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = document.model_dump_json().encode()
+        with tempfile.NamedTemporaryFile(
+            "wb",
+            dir=path.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            file.write(payload)
+        Path(file.name).replace(path)
+        self._puts_since_scan += 1
+        if self._estimated_bytes is not None:
+            self._estimated_bytes += len(payload)
+        if (
+            self._estimated_bytes is None
+            or self._estimated_bytes > self.max_bytes
+            or self._puts_since_scan >= self.scan_interval
+        ):
+            self.evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """Return (last access, size, path) of all entries."""
+        entries = []
+        for path in self.directory.glob(f"*/*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Return the total size of all entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Remove least recently used entries until under max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        self._estimated_bytes = total
+        self._puts_since_scan = 0
+        if evicted:
+            logger.info("Evicted {} extraction cache entries", evicted)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+        self._estimated_bytes = 0
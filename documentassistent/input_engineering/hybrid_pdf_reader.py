@@ -0,0 +1,188 @@
+"""PDF reader that OCRs only the pages without a usable text layer."""
+
+import io
+import re
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+from documentassistent.exceptions import FileReadError
+from documentassistent.input_engineering.extraction_cache import ExtractionCache
+from documentassistent.input_engineering.input_reader import PDFReader
+from documentassistent.input_engineering.ocr_engine import (
+    AUTO,
+    engine_fingerprint,
+    get_engine,
+)
+from documentassistent.structure.state import Document
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="HybridPDFReader", log_file="logs/hybrid_pdf_reader.log")
+
+TEXT = "text"
+OCR = "ocr"
+EMPTY = "empty"
+
+# Unmapped glyphs as emitted by text extraction, e.g. "(cid:42)"
+_CID_GLYPH = re.compile(r"\(cid:\d+\)")
+_READABLE_PUNCTUATION = frozenset(".,;:-+*/()%€$&'\"!?#@_")
+
+
+def has_text_layer(text: str, min_chars: int = 20, min_readable: float = 0.6) -> bool:
+    """Return True if text looks like a real text layer, not empty or garbage."""
+    visible = [char for char in _CID_GLYPH.sub("", text) if not char.isspace()]
+    if len(visible) < min_chars:
+        return False
+    readable = sum(char.isalnum() or char in _READABLE_PUNCTUATION for char in visible)
+    return readable / len(visible) >= min_readable
+
+
+def _ocr_images(page: Any, engine: str = AUTO, lang: str | None = None) -> str:
+    """OCR the images embedded in a PDF page (the scan of a scanned page)."""
+    from PIL import Image
+
+    ocr = get_engine(engine, lang)
+    texts = []
+    for embedded in page.images:
+        with Image.open(io.BytesIO(embedded.data)) as image:
+            texts.append(ocr.recognize(image))
+    return "\n".join(texts)
+
+
+def _ocr_page(
+    path: str,
+    index: int,
+    engine: str = AUTO,
+    lang: str | None = None,
+) -> str:
+    """OCR one page; returns "" when the page cannot be OCRed."""
+    import PyPDF2
+
+    try:
+        with Path(path).open("rb") as file:
+            return _ocr_images(PyPDF2.PdfReader(file).pages[index], engine, lang)
+    except (OSError, RuntimeError, ValueError) as e:
+        logger.warning("OCR failed for page {} of {}: {}", index + 1, path, e)
+        return ""
+
+
+class HybridPDFReader(PDFReader):
+    """
+    Read the text layer where there is one and OCR only the remaining pages.
+
+    Pages whose extracted text is empty or garbage are OCRed from their
+    embedded images, in a process pool when ocr_workers > 1, and merged back
+    in page order. metadata["pages"] records the method used per page.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        workers: int | None = None,
+        parallel_min_pages: int = 64,
+        *,
+        ocr_workers: int | None = None,
+        min_text_chars: int = 20,
+        ocr_language: str | None = None,
+        ocr_engine: str = AUTO,
+        cache: ExtractionCache | None = None,
+    ) -> None:
+        super().__init__(
+            workers=workers,
+            parallel_min_pages=parallel_min_pages,
+            cache=cache,
+        )
+        self.ocr_workers = ocr_workers
+        self.min_text_chars = min_text_chars
+        self.ocr_language = ocr_language
+        self.ocr_engine = ocr_engine
+
+    def cache_settings(self) -> dict[str, Any]:
+        """Return the reader and OCR configuration that affects the text."""
+        engine, version = engine_fingerprint(self.ocr_engine, self.ocr_language)
+        return {
+            **super().cache_settings(),
+            "engine": engine,
+            "tesseract": version,
+            "lang": self.ocr_language,
+            "min_text_chars": self.min_text_chars,
+        }
+
+    def _needs_ocr(self, text: str) -> bool:
+        return not has_text_layer(text, self.min_text_chars)
+
+    def _ocr_pages(self, path: str, indices: list[int]) -> list[str]:
+        """OCR the given pages, in parallel if configured, keeping their order."""
+        if (self.ocr_workers or 1) > 1 and len(indices) > 1:
+            with ProcessPoolExecutor(max_workers=self.ocr_workers) as executor:
+                return list(
+                    executor.map(
+                        _ocr_page,
+                        repeat(path),
+                        indices,
+                        repeat(self.ocr_engine),
+                        repeat(self.ocr_language),
+                    ),
+                )
+        return [
+            _ocr_page(path, index, self.ocr_engine, self.ocr_language)
+            for index in indices
+        ]
+
+    def _read(self, path: str) -> Document:
+        """Read a PDF, OCRing only the pages without a usable text layer."""
+        document = super()._read(path)
+        pages = list(document.pages)
+        missing = [index for index, text in enumerate(pages) if self._needs_ocr(text)]
+        methods = [TEXT] * len(pages)
+        for index, text in zip(missing, self._ocr_pages(path, missing), strict=True):
+            # Keep a short text layer if OCR found nothing better
+            if text.strip():
+                pages[index] = text
+                methods[index] = OCR
+            elif not pages[index].strip():
+                methods[index] = EMPTY
+        if missing:
+            logger.info(
+                "OCRed {} of {} pages of {}",
+                methods.count(OCR),
+                len(pages),
+                path,
+            )
+        return Document(
+            content="".join(pages),
+            pages=pages,
+            metadata={
+                **(document.metadata or {}),
+                "pages": [
+                    {"page": number, "method": method}
+                    for number, method in enumerate(methods, start=1)
+                ],
+                "ocr_pages": methods.count(OCR),
+            },
+        )
+
+    def _iter_pages(self, path: str) -> Generator[str, None, None]:
+        """Yield page texts, OCRing pages without a text layer as they come."""
+        import PyPDF2
+
+        file_path = self._check_exists(path)
+        try:
+            with file_path.open("rb") as file:
+                for index, page in enumerate(PyPDF2.PdfReader(file).pages):
+                    text = page.extract_text() or ""
+                    if self._needs_ocr(text):
+                        text = (
+                            _ocr_page(
+                                str(file_path),
+                                index,
+                                self.ocr_engine,
+                                self.ocr_language,
+                            )
+                            or text
+                        )
+                    yield text
+        except Exception as e:
+            msg = f"Failed to read PDF file: {file_path}"
+            raise FileReadError(msg) from e
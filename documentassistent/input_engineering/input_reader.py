@@ -1,66 +1,370 @@
 from abc import ABC, abstractmethod
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from itertools import chain, repeat
 from pathlib import Path
+from typing import Any, Self
 
 from documentassistent.exceptions import (
     FileReadError,
     ThisFileNotFoundError,
 )
+from documentassistent.input_engineering.extraction_cache import ExtractionCache
+from documentassistent.input_engineering.ocr_engine import (
+    AUTO,
+    OCRWorkerPool,
+    engine_fingerprint,
+    get_engine,
+    open_image,
+)
+from documentassistent.input_engineering.preprocessing import (
+    PreprocessConfig,
+    preprocess,
+)
 from documentassistent.structure.state import Document
+from documentassistent.utils.file_manager import compute_file_hash
 
 
 class DocumentReader(ABC):
-    """Abstract base class for document readers."""
+    """
+    Abstract base class for document readers.
+
+    read() serves repeated reads of the same file content from the optional
+    extraction cache and only runs the actual extraction in _read() on a miss.
+    """
+
+    cache: ExtractionCache | None = None
 
     @abstractmethod
+    def _read(self, path: str) -> Document:
+        """Extract the document from the given file path."""
+
+    def cache_settings(self) -> dict[str, Any]:
+        """Return the reader configuration that affects the extracted text."""
+        return {"reader": type(self).__name__}
+
+    def _cache_key(self, path: str) -> str | None:
+        """Return the cache key for path, or None if caching does not apply."""
+        if self.cache is None:
+            return None
+        try:
+            file_hash = compute_file_hash(path)
+        except OSError:
+            # Let _read() raise its usual error for missing files
+            return None
+        return self.cache.key(file_hash, self.cache_settings())
+
+    def _cached(self, path: str, key: str | None) -> Document | None:
+        """Return the cached Document for key with its source set to path."""
+        if key is None or self.cache is None:
+            return None
+        document = self.cache.get(key)
+        if document is not None:
+            # The same content may have been cached under another file name
+            document.metadata = {**(document.metadata or {}), "source": path}
+        return document
+
     def read(self, path: str) -> Document:
-        """Read a document from the given file path."""
+        """Read a document from the given file path, using the cache if set."""
+        key = self._cache_key(path)
+        cached = self._cached(path, key)
+        if cached is not None:
+            return cached
+        document = self._read(path)
+        # Empty output usually means OCR failed; retry next time instead
+        if key is not None and self.cache is not None and document.content.strip():
+            self.cache.put(key, document)
+        return document
+
+    def _iter_pages(self, path: str) -> Iterator[str]:
+        """Yield the page texts of path; subclasses extract them one by one."""
+        return iter(self._read(path).pages)
+
+    def iter_pages(self, path: str) -> Iterator[str]:
+        """
+        Yield the document's page texts as they are extracted.
+
+        Cached documents are served from the cache. Once all pages have been
+        read they are cached like a read() result, so reading the file again
+        is a cache hit.
+        """
+        key = self._cache_key(path)
+        cached = self._cached(path, key)
+        if cached is not None:
+            return iter(cached.pages)
+        if key is None:
+            return self._iter_pages(path)
+        return self._cache_pages(path, key, self._iter_pages(path))
+
+    def _cache_pages(
+        self,
+        path: str,
+        key: str,
+        pages: Iterator[str],
+    ) -> Generator[str, None, None]:
+        """Pass pages through and cache the document once they are all read."""
+        read = []
+        for page in pages:
+            read.append(page)
+            yield page
+        document = Document(
+            content="".join(read),
+            pages=read,
+            metadata={"source": path},
+        )
+        if self.cache is not None and document.content.strip():
+            self.cache.put(key, document)
+
+
+class PageStream:
+    """
+    Lazily consumed page iterator that keeps the pages produced so far.
+
+    Lets a caller start on the first pages (e.g. classification) and only
+    pull the remaining pages when the full text is needed.
+    """
+
+    def __init__(self, pages: Iterable[str]) -> None:
+        self._source = iter(pages)
+        self._pages: list[str] = []
+        self.exhausted = False
+
+    def __enter__(self) -> Self:
+        """Return the stream; it is closed when the block exits."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the stream."""
+        self.close()
+
+    def _pull(self) -> bool:
+        """Read one more page; return False once the source is exhausted."""
+        if self.exhausted:
+            return False
+        try:
+            self._pages.append(next(self._source))
+        except StopIteration:
+            self.exhausted = True
+            return False
+        return True
+
+    @property
+    def pages(self) -> list[str]:
+        """Pages produced so far."""
+        return list(self._pages)
+
+    def head(self, count: int) -> list[str]:
+        """Return the first count pages, reading no more than necessary."""
+        while len(self._pages) < count and self._pull():
+            pass
+        return self._pages[:count]
+
+    def read_all(self) -> list[str]:
+        """Read the remaining pages and return all of them."""
+        while self._pull():
+            pass
+        return list(self._pages)
+
+    def text(self, pages: int | None = None) -> str:
+        """Return the text of the first pages pages, or of the whole document."""
+        return "".join(self.read_all() if pages is None else self.head(pages))
+
+    def close(self) -> None:
+        """Stop reading and release the underlying file."""
+        close = getattr(self._source, "close", None)
+        if close is not None:
+            close()
+        self.exhausted = True
+
+
+def split_page_range(page_count: int, parts: int) -> list[tuple[int, int]]:
+    """Split pages [0, page_count) into at most parts contiguous ranges."""
+    parts = max(1, min(parts, page_count))
+    size, remainder = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for index in range(parts):
+        stop = start + size + (1 if index < remainder else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> list[str]:
+    """Extract the text of pages [start, stop) in a worker process."""
+    import PyPDF2
+
+    with Path(path).open("rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        return [
+            reader.pages[index].extract_text() or "" for index in range(start, stop)
+        ]
 
 
 class PDFReader(DocumentReader):
-    """Reads PDF files and extracts their text content into Document objects."""
+    """
+    Reads PDF files and extracts their text content into Document objects.
 
-    def read(self, path: str) -> Document:
-        """Read a PDF file and extract its text content into a Document object."""
+    With workers > 1, PDFs of at least parallel_min_pages pages are split into
+    page ranges that are extracted in a process pool and reassembled in order.
+    """
+
+    # Ranges per worker, so one slow range does not leave the others idle
+    RANGES_PER_WORKER = 2
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        parallel_min_pages: int = 64,
+        cache: ExtractionCache | None = None,
+    ) -> None:
+        self.workers = workers
+        self.parallel_min_pages = parallel_min_pages
+        self.cache = cache
+
+    def cache_settings(self) -> dict[str, Any]:
+        """Return the reader configuration that affects the extracted text."""
         import PyPDF2
 
+        return {**super().cache_settings(), "pypdf2": PyPDF2.__version__}
+
+    def _read_parallel(self, path: str, page_count: int) -> list[str]:
+        """Extract page ranges in a process pool, keeping page order."""
+        workers = self.workers or 1
+        ranges = split_page_range(page_count, workers * self.RANGES_PER_WORKER)
+        starts, stops = zip(*ranges, strict=True)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() yields results in submission order, i.e. page order
+            results = executor.map(_extract_page_range, repeat(path), starts, stops)
+            return list(chain.from_iterable(results))
+
+    @staticmethod
+    def _check_exists(path: str) -> Path:
         file_path = Path(path)
         if not file_path.exists():
             msg = f"PDF file not found: {path}"
             raise ThisFileNotFoundError(msg)
+        return file_path
 
+    def _iter_pages(self, path: str) -> Generator[str, None, None]:
+        """Yield the text of each page as soon as it is extracted."""
+        import PyPDF2
+
+        file_path = self._check_exists(path)
         try:
-            content = ""
+            with file_path.open("rb") as file:
+                for page in PyPDF2.PdfReader(file).pages:
+                    yield page.extract_text() or ""
+        except Exception as e:
+            msg = f"Failed to read PDF file: {file_path}"
+            raise FileReadError(msg) from e
+
+    def _read(self, path: str) -> Document:
+        """Read a PDF file and extract its text content into a Document object."""
+        import PyPDF2
+
+        file_path = self._check_exists(path)
+
+        try:
+            pages: list[str] | None = None
             with file_path.open("rb") as file:
                 reader = PyPDF2.PdfReader(file)
-                for page in reader.pages:
-                    content += page.extract_text() or ""
-            return Document(content=content, metadata={"source": path, "type": "pdf"})
+                page_count = len(reader.pages)
+                parallel = (self.workers or 1) > 1 and (
+                    page_count >= self.parallel_min_pages
+                )
+                if not parallel:
+                    pages = [page.extract_text() or "" for page in reader.pages]
+            if pages is None:
+                pages = self._read_parallel(path, page_count)
+            return Document(
+                content="".join(pages),
+                pages=pages,
+                metadata={"source": path, "type": "pdf", "page_count": page_count},
+            )
         except Exception as e:
             msg = f"Failed to read PDF file: {path}"
             raise FileReadError(msg) from e
 
 
 class ImageReader(DocumentReader):
-    """Reads image files and extracts their text content into Document objects."""
+    """
+    Reads image files and extracts their text content into Document objects.
 
-    def read(self, path: str) -> Document:
-        """Read an image file and extract its text content into a Document object."""
-        import pytesseract
-        from PIL import Image
+    OCR runs in-process on this process's long-lived engine, or, with an
+    ocr_pool, in the pool's worker processes with the image sent in memory.
+    A reader with a pool cannot be sent to other processes. With a
+    preprocess_config each frame is rotated, scaled and binarized before OCR.
+    """
+
+    def __init__(
+        self,
+        lang: str | None = None,
+        cache: ExtractionCache | None = None,
+        ocr_engine: str = AUTO,
+        ocr_pool: OCRWorkerPool | None = None,
+        preprocess_config: PreprocessConfig | None = None,
+    ) -> None:
+        self.lang = lang
+        self.cache = cache
+        self.ocr_engine = ocr_pool.engine if ocr_pool else ocr_engine
+        self.ocr_pool = ocr_pool
+        self.preprocess_config = (
+            ocr_pool.preprocess_config if ocr_pool else preprocess_config
+        )
 
+    def cache_settings(self) -> dict[str, Any]:
+        """Return the OCR configuration that affects the extracted text."""
+        engine, version = engine_fingerprint(self.ocr_engine, self.lang)
+        return {
+            **super().cache_settings(),
+            "engine": engine,
+            "tesseract": version,
+            "lang": self.lang,
+            "preprocess": (
+                asdict(self.preprocess_config) if self.preprocess_config else None
+            ),
+        }
+
+    @staticmethod
+    def _check_exists(path: str) -> Path:
         file_path = Path(path)
         if not file_path.exists():
             msg = f"Image file not found: {path}"
             raise ThisFileNotFoundError(msg)
+        return file_path
 
+    def _iter_pages(self, path: str) -> Generator[str, None, None]:
+        """OCR and yield one frame at a time (multi-page TIFFs have several)."""
+        file_path = self._check_exists(path)
         try:
-            image = Image.open(path)
-            content = pytesseract.image_to_string(image)
-            return Document(content=content, metadata={"source": path, "type": "image"})
+            if self.ocr_pool is not None:
+                yield from self.ocr_pool.recognize(file_path.read_bytes())
+                return
+            engine = get_engine(self.ocr_engine, self.lang)
+            with open_image(file_path) as image:
+                for frame in range(getattr(image, "n_frames", 1)):
+                    image.seek(frame)
+                    if self.preprocess_config is None:
+                        yield engine.recognize(image)
+                    else:
+                        yield engine.recognize(
+                            preprocess(image, self.preprocess_config),
+                        )
         except Exception as e:
-            msg = f"Failed to read image file: {path}"
+            msg = f"Failed to read image file: {file_path}"
             raise FileReadError(msg) from e
 
+    def _read(self, path: str) -> Document:
+        """Read an image file and extract its text content into a Document object."""
+        pages = list(self._iter_pages(path))
+        return Document(
+            content="".join(pages),
+            pages=pages,
+            metadata={"source": path, "type": "image"},
+        )
+
 
 if __name__ == "__main__":
     from pathlib import Path
@@ -0,0 +1,234 @@
+"""OCR engines and a pool of long-lived OCR worker processes."""
+
+import io
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from documentassistent.exceptions import ConfigurationError
+from documentassistent.input_engineering.preprocessing import (
+    PreprocessConfig,
+    preprocess,
+)
+from documentassistent.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = setup_logger(name="OCREngine", log_file="logs/ocr_engine.log")
+
+AUTO = "auto"
+PYTESSERACT = "pytesseract"
+TESSEROCR = "tesserocr"
+
+
+class OCREngine(ABC):
+    """Recognizes text in PIL images."""
+
+    name: str
+
+    def __init__(self, lang: str | None = None) -> None:
+        self.lang = lang
+
+    @abstractmethod
+    def recognize(self, image: Any) -> str:
+        """Return the text found in a PIL image."""
+
+    @abstractmethod
+    def version(self) -> str:
+        """Return the tesseract version, which affects the output."""
+
+
+class PytesseractEngine(OCREngine):
+    """Runs the tesseract CLI once per image (reloads language data each call)."""
+
+    name = PYTESSERACT
+
+    def recognize(self, image: Any) -> str:
+        """Return the text found in a PIL image."""
+        import pytesseract
+
+        return str(pytesseract.image_to_string(image, lang=self.lang))
+
+    def version(self) -> str:
+        """Return the tesseract version, or "unavailable" if not installed."""
+        import pytesseract
+
+        try:
+            return str(pytesseract.get_tesseract_version())
+        except (OSError, RuntimeError):
+            return "unavailable"
+
+
+class TesserocrEngine(OCREngine):
+    """Keeps one libtesseract instance loaded and feeds it images in memory."""
+
+    name = TESSEROCR
+
+    def __init__(self, lang: str | None = None) -> None:
+        import tesserocr
+
+        super().__init__(lang)
+        self._api = tesserocr.PyTessBaseAPI(lang=lang or "eng")
+        # The API object holds per-image state and is not thread-safe
+        self._lock = threading.Lock()
+
+    def recognize(self, image: Any) -> str:
+        """Return the text found in a PIL image."""
+        with self._lock:
+            self._api.SetImage(image)
+            return str(self._api.GetUTF8Text())
+
+    def version(self) -> str:
+        """Return the linked libtesseract version."""
+        import tesserocr
+
+        return str(tesserocr.tesseract_version()).split()[1]
+
+
+@cache
+def get_engine(name: str = AUTO, lang: str | None = None) -> OCREngine:
+    """
+    Return this process's engine for name and lang, creating it once.
+
+    "auto" prefers tesserocr, which keeps the model loaded between images,
+    and falls back to pytesseract when tesserocr is not installed.
+    """
+    if name not in {AUTO, PYTESSERACT, TESSEROCR}:
+        msg = f"Unknown OCR engine: {name!r}"
+        raise ConfigurationError(msg)
+    if name in {AUTO, TESSEROCR}:
+        try:
+            return TesserocrEngine(lang)
+        except ImportError:
+            if name == TESSEROCR:
+                raise
+            logger.info("tesserocr not installed, using pytesseract")
+    return PytesseractEngine(lang)
+
+
+@cache
+def engine_fingerprint(name: str = AUTO, lang: str | None = None) -> tuple[str, str]:
+    """
+    Return the engine name and tesseract version for cache keys, looked up once.
+
+    Asking tesseract for its version starts a subprocess with pytesseract, so
+    it is done once per process, not per document. If the engine cannot be
+    created, ("<name>", "unavailable") is returned so PDFs with a text layer
+    can still be read and cached; OCR reports the error if it is needed.
+    """
+    try:
+        engine = get_engine(name, lang)
+    except (ImportError, OSError, RuntimeError) as e:
+        logger.warning("OCR engine {} is unavailable: {}", name, e)
+        return name, "unavailable"
+    return engine.name, engine.version()
+
+
+@cache
+def _register_heif_opener() -> None:
+    """Let PIL open HEIC photos if the optional pillow-heif plugin is installed."""
+    try:
+        from pillow_heif import register_heif_opener
+    except ImportError:
+        logger.debug("pillow-heif not installed, HEIC images cannot be opened")
+        return
+    register_heif_opener()
+
+
+def open_image(source: str | Path | io.BytesIO) -> "Image.Image":
+    """Open an image file or buffer with PIL, importing PIL on first use."""
+    from PIL import Image
+
+    _register_heif_opener()
+    return Image.open(source)
+
+
+def recognize_image_bytes(
+    data: bytes,
+    engine: str = AUTO,
+    lang: str | None = None,
+    preprocess_config: PreprocessConfig | None = None,
+) -> list[str]:
+    """OCR an encoded image held in memory, one text per frame."""
+    ocr = get_engine(engine, lang)
+    texts = []
+    with open_image(io.BytesIO(data)) as image:
+        for frame in range(getattr(image, "n_frames", 1)):
+            image.seek(frame)
+            if preprocess_config is None:
+                texts.append(ocr.recognize(image))
+            else:
+                texts.append(ocr.recognize(preprocess(image, preprocess_config)))
+    return texts
+
+
+def _warm_up(engine: str, lang: str | None) -> None:
+    """Load the engine once when a worker process starts."""
+    get_engine(engine, lang)
+
+
+class OCRWorkerPool:
+    """
+    Long-lived OCR worker processes, each keeping its own engine loaded.
+
+    Images are sent as encoded bytes, so nothing touches the disk on the way
+    in; with tesserocr nothing does on the way out either.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        engine: str = AUTO,
+        lang: str | None = None,
+        preprocess_config: PreprocessConfig | None = None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.lang = lang
+        self.preprocess_config = preprocess_config
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_warm_up,
+            initargs=(engine, lang),
+        )
+
+    def __enter__(self) -> Self:
+        """Return the pool; it is shut down when the block exits."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Shut down the worker processes."""
+        self.close()
+
+    def recognize(self, data: bytes) -> list[str]:
+        """OCR one encoded image, one text per frame."""
+        return self._executor.submit(
+            recognize_image_bytes,
+            data,
+            self.engine,
+            self.lang,
+            self.preprocess_config,
+        ).result()
+
+    def recognize_many(self, images: Iterable[bytes]) -> list[list[str]]:
+        """OCR many encoded images in parallel, keeping their order."""
+        images = list(images)
+        return list(
+            self._executor.map(
+                recognize_image_bytes,
+                images,
+                [self.engine] * len(images),
+                [self.lang] * len(images),
+                [self.preprocess_config] * len(images),
+            ),
+        )
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
@@ -0,0 +1,101 @@
+"""Build document readers from the `reading` section of config.yaml."""
+
+from functools import partial
+from typing import Any
+
+from documentassistent.input_engineering.extraction_cache import (
+    DEFAULT_CACHE_DIR,
+    ExtractionCache,
+)
+from documentassistent.input_engineering.hybrid_pdf_reader import HybridPDFReader
+from documentassistent.input_engineering.input_reader import ImageReader, PDFReader
+from documentassistent.input_engineering.ocr_engine import AUTO, OCRWorkerPool
+from documentassistent.input_engineering.preprocessing import PreprocessConfig
+from documentassistent.input_engineering.reader_registry import (
+    IMAGE_FORMATS,
+    PDF,
+    ReaderRegistry,
+)
+
+
+def create_extraction_cache(settings: dict[str, Any]) -> ExtractionCache | None:
+    """Create the extracted-text cache, or None if it is disabled."""
+    cache_settings = settings.get("reading", {}).get("cache", {})
+    if not cache_settings.get("enabled", False):
+        return None
+    return ExtractionCache(
+        directory=cache_settings.get("path", DEFAULT_CACHE_DIR),
+        max_bytes=int(cache_settings.get("max_megabytes", 512) * 1024 * 1024),
+    )
+
+
+def create_pdf_reader(
+    settings: dict[str, Any],
+    cache: ExtractionCache | None = None,
+) -> PDFReader:
+    """Create the configured PDF reader."""
+    reading = settings.get("reading", {})
+    options: dict[str, Any] = {
+        "workers": reading.get("pdf_workers"),
+        "parallel_min_pages": reading.get("pdf_parallel_min_pages", 64),
+        "cache": cache,
+    }
+    if not reading.get("ocr_scanned_pages", True):
+        return PDFReader(**options)
+    return HybridPDFReader(
+        **options,
+        ocr_workers=reading.get("ocr_workers"),
+        min_text_chars=reading.get("min_text_chars", 20),
+        ocr_language=reading.get("ocr_language"),
+        ocr_engine=reading.get("ocr_engine", AUTO),
+    )
+
+
+def create_ocr_pool(settings: dict[str, Any]) -> OCRWorkerPool | None:
+    """Create the pool of OCR worker processes for images, or None if disabled."""
+    reading = settings.get("reading", {})
+    workers = reading.get("ocr", {}).get("pool_workers")
+    if not workers:
+        return None
+    return OCRWorkerPool(
+        workers=workers,
+        engine=reading.get("ocr_engine", AUTO),
+        lang=reading.get("ocr_language"),
+        preprocess_config=PreprocessConfig.from_settings(settings),
+    )
+
+
+def create_image_reader(
+    settings: dict[str, Any],
+    cache: ExtractionCache | None = None,
+    ocr_pool: OCRWorkerPool | None = None,
+) -> ImageReader:
+    """Create the configured image (OCR) reader, OCRing in ocr_pool if given."""
+    reading = settings.get("reading", {})
+    return ImageReader(
+        lang=reading.get("ocr_language"),
+        cache=cache,
+        ocr_engine=reading.get("ocr_engine", AUTO),
+        ocr_pool=ocr_pool,
+        preprocess_config=PreprocessConfig.from_settings(settings),
+    )
+
+
+def create_reader_registry(
+    settings: dict[str, Any],
+    cache: ExtractionCache | None = None,
+    ocr_pool: OCRWorkerPool | None = None,
+) -> ReaderRegistry:
+    """
+    Create a registry of the configured readers, each built on first use.
+
+    A registry with an ocr_pool cannot be sent to other processes.
+    """
+    registry = ReaderRegistry()
+    registry.register(PDF, partial(create_pdf_reader, settings, cache))
+    for name in IMAGE_FORMATS:
+        registry.register(
+            name,
+            partial(create_image_reader, settings, cache, ocr_pool),
+        )
+    return registry
@@ -0,0 +1,134 @@
+"""Pick the document reader for a file by its content signature."""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from documentassistent.exceptions import UnsupportedFileTypeError
+from documentassistent.input_engineering.hybrid_pdf_reader import HybridPDFReader
+from documentassistent.input_engineering.input_reader import (
+    DocumentReader,
+    ImageReader,
+    PageStream,
+)
+from documentassistent.structure.state import Document
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="ReaderRegistry", log_file="logs/reader_registry.log")
+
+PDF = "pdf"
+JPEG = "jpeg"
+PNG = "png"
+TIFF = "tiff"
+HEIC = "heic"
+IMAGE_FORMATS = (JPEG, PNG, TIFF, HEIC)
+
+# Bytes read from the start of a file to detect its format
+HEADER_BYTES = 1024
+
+
+@dataclass(frozen=True)
+class FileFormat:
+    """A file format recognized by a signature at the start of the file."""
+
+    name: str
+    signature: re.Pattern[bytes]
+    suffixes: frozenset[str]
+
+
+FORMATS = (
+    # The PDF header may follow up to 1 KiB of junk, which readers accept
+    FileFormat(PDF, re.compile(rb"[\s\S]{0,1018}%PDF-"), frozenset({".pdf"})),
+    FileFormat(JPEG, re.compile(rb"\xff\xd8\xff"), frozenset({".jpg", ".jpeg"})),
+    FileFormat(PNG, re.compile(rb"\x89PNG\r\n\x1a\n"), frozenset({".png"})),
+    FileFormat(TIFF, re.compile(rb"II\*\x00|MM\x00\*"), frozenset({".tif", ".tiff"})),
+    FileFormat(
+        HEIC,
+        re.compile(rb"[\s\S]{4}ftyp(?:heic|heix|heim|heis|hevc|hevx|mif1|msf1)"),
+        frozenset({".heic", ".heif"}),
+    ),
+)
+
+
+def detect_format(path: str | Path) -> str | None:
+    """
+    Return the format name of a file, or None if it is not recognized.
+
+    The signature decides; the suffix is only used when the content matches
+    no known signature (or the file cannot be read).
+    """
+    path = Path(path)
+    try:
+        with path.open("rb") as file:
+            header = file.read(HEADER_BYTES)
+    except OSError:
+        header = b""
+    suffix = path.suffix.lower()
+    for file_format in FORMATS:
+        if file_format.signature.match(header):
+            if suffix and suffix not in file_format.suffixes:
+                logger.info("{} is a {} file", path, file_format.name)
+            return file_format.name
+    for file_format in FORMATS:
+        if suffix in file_format.suffixes:
+            return file_format.name
+    return None
+
+
+class ReaderRegistry:
+    """
+    Maps file formats to readers and dispatches each file to its reader.
+
+    Readers are registered as factories and only created when the first file
+    of their format arrives, and readers import their heavy dependencies
+    (PyPDF2, PIL, tesseract) only when they read. A process that only ever
+    sees PDFs therefore never loads the image stack. Registries built from
+    picklable factories (classes, functools.partial) can be sent to a
+    process pool.
+    """
+
+    def __init__(self) -> None:
+        self._factories: dict[str, Callable[[], DocumentReader]] = {}
+        self._readers: dict[str, DocumentReader] = {}
+
+    @classmethod
+    def default(cls) -> "ReaderRegistry":
+        """Return a registry with the default PDF and image readers."""
+        registry = cls()
+        registry.register(PDF, HybridPDFReader)
+        for name in IMAGE_FORMATS:
+            registry.register(name, ImageReader)
+        return registry
+
+    def register(self, name: str, factory: Callable[[], DocumentReader]) -> None:
+        """Use readers created by factory for files of format name."""
+        self._factories[name] = factory
+        self._readers.pop(name, None)
+
+    @property
+    def formats(self) -> frozenset[str]:
+        """Return the names of all registered formats."""
+        return frozenset(self._factories)
+
+    def supports(self, path: str | Path) -> bool:
+        """Return True if a reader is registered for the file's format."""
+        return detect_format(path) in self._factories
+
+    def reader_for(self, path: str | Path) -> DocumentReader:
+        """Return the reader for the file, creating it on first use."""
+        name = detect_format(path)
+        if name is None or name not in self._factories:
+            msg = f"Unsupported file type: {name or Path(path).suffix!r} ({path})"
+            raise UnsupportedFileTypeError(msg)
+        if name not in self._readers:
+            self._readers[name] = self._factories[name]()
+        return self._readers[name]
+
+    def read(self, path: str) -> Document:
+        """Read the file with the reader for its format."""
+        return self.reader_for(path).read(path)
+
+    def stream(self, path: str) -> PageStream:
+        """Open the file as a lazily read PageStream."""
+        return PageStream(self.reader_for(path).iter_pages(path))
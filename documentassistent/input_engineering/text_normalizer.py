@@ -0,0 +1,209 @@
+"""Normalize extracted text before it is sent to the LLM."""
+
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from documentassistent.structure.state import Document
+from documentassistent.utils.logger import setup_logger
+from documentassistent.utils.tokens import DEFAULT_ENCODING, count_tokens
+
+logger = setup_logger(name="TextNormalizer", log_file="logs/text_normalizer.log")
+
+_SPACES = re.compile(r"[ \t\f\v\u00a0]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+# A word broken at the line end, continued in lower case on the next line
+_HYPHENATED = re.compile(r"([^\W\d_])-\n([^\W\d_A-ZÄÖÜ])")
+# Only explicit page labels: a bare number at a page edge may be a table value
+_PAGE_NUMBER = re.compile(
+    r"(?:seite|page)\s*\d+\s*(?:(?:von|of|/)\s*\d+)?",
+    re.IGNORECASE,
+)
+_DIGIT = re.compile(r"\d")
+_LETTER = re.compile(r"[^\W\d_]")
+# Lines where fewer visible characters are letters or digits are noise
+_MIN_ALNUM_RATIO = 0.3
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """Normalized text of one document and what normalization saved."""
+
+    text: str
+    tokens_before: int
+    tokens_after: int
+    removed_lines: int = 0
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of the original tokens that were removed."""
+        if self.tokens_before == 0:
+            return 0.0
+        return 1 - self.tokens_after / self.tokens_before
+
+
+@dataclass
+class NormalizationStats:
+    """Token counts before and after normalization over a run."""
+
+    documents: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, result: NormalizedText) -> None:
+        """Add one document's token counts."""
+        with self._lock:
+            self.documents += 1
+            self.tokens_before += result.tokens_before
+            self.tokens_after += result.tokens_after
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of all original tokens that were removed."""
+        if self.tokens_before == 0:
+            return 0.0
+        return 1 - self.tokens_after / self.tokens_before
+
+
+def _collapse_whitespace(line: str) -> str:
+    return _SPACES.sub(" ", line).strip()
+
+
+def _is_noise(line: str, min_alnum: int) -> bool:
+    """
+    Return True for lines with too few letters/digits to carry information.
+
+    Lines with a digit are never noise: "7", "< 5" or a quantity "3" may be
+    a value in a table.
+    """
+    if _DIGIT.search(line):
+        return False
+    alnum = sum(char.isalnum() for char in line)
+    return alnum < min_alnum or alnum < _MIN_ALNUM_RATIO * len(line.replace(" ", ""))
+
+
+def _edge_lines(lines: list[str], depth: int) -> set[str]:
+    """Return the first and last depth non-empty lines of a page."""
+    content = [line for line in lines if line]
+    return set(content[:depth] + content[-depth:])
+
+
+class TextNormalizer:
+    """
+    Shrink extracted text without losing content the LLM needs.
+
+    Collapses whitespace, keeps page headers and footers that repeat across
+    pages only once, removes "Seite 2 von 5" page labels, re-joins words
+    hyphenated at line breaks and drops lines without digits and with hardly
+    any letters (OCR noise, rules). Token counts before and after are logged
+    per document. The result is meant for the LLM only; the original text is
+    what gets stored.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        strip_repeated_lines: bool = True,
+        join_hyphenation: bool = True,
+        drop_noise_lines: bool = True,
+        min_alnum: int = 2,
+        repeat_ratio: float = 0.5,
+        edge_depth: int = 3,
+        encoding: str = DEFAULT_ENCODING,
+    ) -> None:
+        self.strip_repeated_lines = strip_repeated_lines
+        self.join_hyphenation = join_hyphenation
+        self.drop_noise_lines = drop_noise_lines
+        self.min_alnum = min_alnum
+        self.repeat_ratio = repeat_ratio
+        self.edge_depth = edge_depth
+        self.encoding = encoding
+        self.stats = NormalizationStats()
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any]) -> "TextNormalizer | None":
+        """Create the normalizer from config.yaml settings, or None if disabled."""
+        options = dict(settings.get("normalization", {}))
+        if not options.pop("enabled", False):
+            return None
+        return cls(**options)
+
+    def _repeated_lines(self, pages: list[list[str]]) -> set[str]:
+        """Return header/footer lines found on enough pages."""
+        # Headers name something; lines without letters are values, not headers
+        counts = Counter(
+            line
+            for lines in pages
+            for line in _edge_lines(lines, self.edge_depth)
+            if _LETTER.search(line)
+        )
+        threshold = max(2, self.repeat_ratio * len(pages))
+        return {line for line, count in counts.items() if count >= threshold}
+
+    def normalize_pages(self, pages: list[str]) -> tuple[str, int]:
+        """Return the normalized text of the pages and the number of lines removed."""
+        page_lines = [
+            [_collapse_whitespace(line) for line in page.splitlines()] for page in pages
+        ]
+        repeated = (
+            self._repeated_lines(page_lines) if self.strip_repeated_lines else set()
+        )
+        seen: set[str] = set()
+        removed = 0
+        kept_pages = []
+        for lines in page_lines:
+            edges = _edge_lines(lines, self.edge_depth) if len(pages) > 1 else set()
+            kept = []
+            for line in lines:
+                if line in edges and _PAGE_NUMBER.fullmatch(line):
+                    removed += 1
+                    continue
+                if line in repeated:
+                    # Keep the first occurrence, it may name the sender
+                    if line in seen:
+                        removed += 1
+                        continue
+                    seen.add(line)
+                if line and self.drop_noise_lines and _is_noise(line, self.min_alnum):
+                    removed += 1
+                    continue
+                kept.append(line)
+            kept_pages.append("\n".join(kept).strip())
+
+        text = "\n\n".join(page for page in kept_pages if page)
+        if self.join_hyphenation:
+            text = _HYPHENATED.sub(r"\1\2", text)
+        return _BLANK_LINES.sub("\n\n", text), removed
+
+    def normalize(self, document: Document) -> NormalizedText:
+        """Normalize a document's text and log the token counts before and after."""
+        text, removed = self.normalize_pages(document.pages or [document.content])
+        result = NormalizedText(
+            text=text,
+            tokens_before=count_tokens(document.content, self.encoding),
+            tokens_after=count_tokens(text, self.encoding),
+            removed_lines=removed,
+        )
+        self.stats.record(result)
+        logger.info(
+            "Normalized {}: {} -> {} tokens (-{:.0%}), {} lines removed",
+            (document.metadata or {}).get("source", "document"),
+            result.tokens_before,
+            result.tokens_after,
+            result.saved_ratio,
+            removed,
+        )
+        return result
+
+    def log_summary(self) -> None:
+        """Log the tokens saved over all normalized documents."""
+        logger.info(
+            "Normalization summary: {} documents, {} -> {} tokens (-{:.0%})",
+            self.stats.documents,
+            self.stats.tokens_before,
+            self.stats.tokens_after,
+            self.stats.saved_ratio,
+        )
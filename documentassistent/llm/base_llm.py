@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 from documentassistent.structure.pydantic_llm_calls.invoice_call import DocumentType
@@ -21,3 +22,19 @@ class BaseLLM(ABC):
         logger.debug("call() method invoked with state: %s", state)
         error_message = "Subclasses must implement call method"
         raise NotImplementedError(error_message)
+
+    async def acall(
+        self,
+        state: BaseWorkflowState,
+        pydantic_object: type,
+    ) -> DocumentType:
+        """Async variant of call(); runs call() in a worker thread by default."""
+        return await asyncio.to_thread(self.call, state, pydantic_object)
+
+    def render_prompt(self, state: BaseWorkflowState, pydantic_object: type) -> str:  # noqa: ARG002
+        """Return the prompt call() sends for state, e.g. to fit the context window."""
+        return getattr(state, "prompt", "").replace("{text}", state.text)
+
+    def log_summary(self) -> None:
+        """Log the statistics of this LLM and the LLMs it wraps, if it keeps any."""
+        logger.debug("{} keeps no statistics", type(self).__name__)
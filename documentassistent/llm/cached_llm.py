@@ -0,0 +1,85 @@
+from typing import Any
+
+from pydantic import ValidationError
+
+from documentassistent.llm.base_llm import BaseLLM
+from documentassistent.llm.response_cache import ResponseCache, cache_key
+from documentassistent.prompts.prompt_collection import get_prompt_version
+from documentassistent.structure.state import BaseWorkflowState
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="CachedLLM", log_file="logs/cached_llm.log")
+
+
+class CachedLLM(BaseLLM):
+    """LLM wrapper that serves repeated requests from a persistent cache."""
+
+    def __init__(self, llm: BaseLLM, cache: ResponseCache, provider: str) -> None:
+        super().__init__(model=llm.model)
+        self.llm = llm
+        self.cache = cache
+        self.provider = provider
+
+    def _key(self, state: BaseWorkflowState, pydantic_object: type) -> str:
+        """Build the cache key for the state's prompt, schema and text."""
+        prompt = getattr(state, "prompt", "")
+        return cache_key(
+            provider=self.provider,
+            model=self.model,
+            prompt_version=get_prompt_version(prompt),
+            schema_name=pydantic_object.__name__,
+            text=state.text,
+        )
+
+    def _lookup(self, key: str, pydantic_object: type) -> Any:
+        """Return the validated cached response, or None on a miss."""
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+        try:
+            response = pydantic_object.model_validate_json(payload)  # type: ignore[attr-defined]
+        except ValidationError:
+            # Stored by an older version of the schema
+            logger.warning("Dropping stale cached {}", pydantic_object.__name__)
+            self.cache.invalidate(key)
+            return None
+        logger.debug("Cache hit for {}", pydantic_object.__name__)
+        return response
+
+    def _store(self, key: str, pydantic_object: type, response: Any) -> None:
+        """Store a validated response."""
+        self.cache.put(key, pydantic_object.__name__, response.model_dump_json())
+
+    def call(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Return a cached response or call the wrapped LLM and cache its result."""
+        key = self._key(state, pydantic_object)
+        cached = self._lookup(key, pydantic_object)
+        if cached is not None:
+            return cached
+        response = self.llm.call(state, pydantic_object)
+        self._store(key, pydantic_object, response)
+        return response
+
+    async def acall(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Async variant of call()."""
+        key = self._key(state, pydantic_object)
+        cached = self._lookup(key, pydantic_object)
+        if cached is not None:
+            return cached
+        response = await self.llm.acall(state, pydantic_object)
+        self._store(key, pydantic_object, response)
+        return response
+
+    def log_summary(self) -> None:
+        """Log the cache hit rate, then the wrapped LLM's statistics."""
+        stats = self.cache.stats
+        logger.info(
+            "Response cache summary: {} hits, {} misses ({:.0%} hit rate), "
+            "{} evicted, {} expired",
+            stats.hits,
+            stats.misses,
+            stats.hit_rate,
+            stats.evictions,
+            stats.expirations,
+        )
+        self.llm.log_summary()
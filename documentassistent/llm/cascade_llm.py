@@ -0,0 +1,203 @@
+"""Model cascade: answer with a small model and escalate only when unsure."""
+
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.exceptions import OutputParserException
+from pydantic import ValidationError as PydanticValidationError
+
+from documentassistent.exceptions import LLMError
+from documentassistent.llm.base_llm import BaseLLM
+from documentassistent.structure.pydantic_llm_calls.confidence import ConfidenceLevel
+from documentassistent.structure.state import BaseWorkflowState
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="CascadeLLM", log_file="logs/cascade_llm.log")
+
+# Errors that mean the tier could not produce a valid response
+_TIER_FAILURES = (LLMError, OutputParserException, PydanticValidationError)
+
+DEFAULT_ESCALATE_ON = frozenset({ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM})
+
+
+@dataclass
+class TierStats:
+    """Calls, latency and outcomes of one cascade tier."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    escalated_low_confidence: int = 0
+    escalated_failure: int = 0
+
+    @property
+    def escalations(self) -> int:
+        """Number of calls that were passed on to the next tier."""
+        return self.escalated_low_confidence + self.escalated_failure
+
+    @property
+    def escalation_rate(self) -> float:
+        """Fraction of this tier's calls that were escalated."""
+        return self.escalations / self.calls if self.calls else 0.0
+
+    @property
+    def average_seconds(self) -> float:
+        """Mean latency of this tier."""
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class CascadeStats:
+    """Thread-safe per-tier statistics of a CascadeLLM."""
+
+    def __init__(self, models: Sequence[str | None]) -> None:
+        self.models = list(models)
+        self.tiers = [TierStats() for _ in models]
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        tier: int,
+        seconds: float,
+        *,
+        low_confidence: bool = False,
+        failed: bool = False,
+    ) -> None:
+        """Record one call to tier and whether it was escalated."""
+        with self._lock:
+            stats = self.tiers[tier]
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.escalated_low_confidence += int(low_confidence)
+            stats.escalated_failure += int(failed)
+
+    def log_summary(self) -> None:
+        """Log latency and escalation rate per tier."""
+        with self._lock:
+            for model, stats in zip(self.models, self.tiers, strict=True):
+                logger.info(
+                    "Tier {}: {} calls, {:.2f}s average, {:.1%} escalated "
+                    "({} low confidence, {} failed)",
+                    model,
+                    stats.calls,
+                    stats.average_seconds,
+                    stats.escalation_rate,
+                    stats.escalated_low_confidence,
+                    stats.escalated_failure,
+                )
+
+
+class CascadeLLM(BaseLLM):
+    """
+    Try LLM tiers from small to large until one answers confidently.
+
+    A response is escalated to the next tier when it fails validation or
+    carries a confidence level in escalate_on. Schemas without a confidence
+    field are escalated only on failure. The last tier's answer is final;
+    if it fails, the best earlier answer is returned instead.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[BaseLLM],
+        escalate_on: frozenset[ConfidenceLevel] = DEFAULT_ESCALATE_ON,
+    ) -> None:
+        if not tiers:
+            msg = "CascadeLLM needs at least one tier"
+            raise LLMError(msg)
+        super().__init__(model="+".join(tier.model or "" for tier in tiers))
+        self.tiers = list(tiers)
+        self.escalate_on = escalate_on
+        self.stats = CascadeStats([tier.model for tier in tiers])
+
+    def render_prompt(self, state: BaseWorkflowState, pydantic_object: type) -> str:
+        """Return the last tier's prompt for state, which every escalation reaches."""
+        return self.tiers[-1].render_prompt(state, pydantic_object)
+
+    def log_summary(self) -> None:
+        """Log latency and escalation rate per tier, then the tiers' statistics."""
+        self.stats.log_summary()
+        for tier in self.tiers:
+            tier.log_summary()
+
+    def _is_unsure(self, response: Any) -> bool:
+        """Return True if the response reports a confidence worth escalating."""
+        confidence = getattr(response, "confidence", None)
+        return confidence is not None and confidence.level in self.escalate_on
+
+    def _accept(
+        self,
+        tier: int,
+        started: float,
+        response: Any,
+        error: Exception | None,
+    ) -> bool:
+        """Record the tier outcome and decide whether its answer is final."""
+        seconds = time.perf_counter() - started
+        is_last = tier == len(self.tiers) - 1
+        if error is not None:
+            self.stats.record(tier, seconds, failed=not is_last)
+            logger.debug(
+                "Tier {} failed ({})",
+                self.tiers[tier].model,
+                type(error).__name__,
+            )
+            return False
+        if not is_last and self._is_unsure(response):
+            self.stats.record(tier, seconds, low_confidence=True)
+            logger.debug(
+                "Tier {} answered with {} confidence, escalating",
+                self.tiers[tier].model,
+                response.confidence.level.value,
+            )
+            return False
+        self.stats.record(tier, seconds)
+        return True
+
+    @staticmethod
+    def _fallback(fallback: Any, error: Exception | None) -> Any:
+        """Return an earlier tier's answer after the last tier failed."""
+        if fallback is None:
+            if error is not None:
+                raise error
+            msg = "Cascade finished without a response"
+            raise LLMError(msg)
+        logger.warning("Last tier failed, using a lower tier's answer")
+        return fallback
+
+    def call(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Call the tiers in order and return the first confident response."""
+        fallback: Any = None
+        error: Exception | None = None
+        for tier, llm in enumerate(self.tiers):
+            started = time.perf_counter()
+            response: Any = None
+            error = None
+            try:
+                response = llm.call(state, pydantic_object)
+            except _TIER_FAILURES as e:
+                error = e
+            if self._accept(tier, started, response, error):
+                return response
+            if error is None:
+                fallback = response
+        return self._fallback(fallback, error)
+
+    async def acall(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Async variant of call()."""
+        fallback: Any = None
+        error: Exception | None = None
+        for tier, llm in enumerate(self.tiers):
+            started = time.perf_counter()
+            response: Any = None
+            error = None
+            try:
+                response = await llm.acall(state, pydantic_object)
+            except _TIER_FAILURES as e:
+                error = e
+            if self._accept(tier, started, response, error):
+                return response
+            if error is None:
+                fallback = response
+        return self._fallback(fallback, error)
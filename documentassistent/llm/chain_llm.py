@@ -1,16 +1,19 @@
-from typing import TYPE_CHECKING, Any
+import json
+import threading
+from typing import TYPE_CHECKING, Any, cast
 
-from langchain.output_parsers import (
-    OutputFixingParser,
-    PydanticOutputParser,
-)
+from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import PromptTemplate
 
 if TYPE_CHECKING:
-    from langchain.schema.runnable import RunnableSequence
+    from langchain.schema.runnable import Runnable, RunnableSequence
 
 from documentassistent.exceptions import LLMError, LLMResponseError
 from documentassistent.llm.base_llm import BaseLLM
+from documentassistent.llm.json_repair import (
+    LocalRepairFixingParser,
+    LocalRepairParser,
+)
 from documentassistent.structure.state import State
 from documentassistent.utils.langfuse_handler import LangfuseHandler
 from documentassistent.utils.logger import setup_logger
@@ -20,63 +23,185 @@ logger = setup_logger(name="ChainLLM", log_file="logs/chain_llm.log")
 langfuse = LangfuseHandler()
 
 
+def schema_description(pydantic_object: type) -> str:
+    """
+    Describe the output schema for the prompt in structured output mode.
+
+    Constrained decoding enforces the structure but does not show the field
+    descriptions (e.g. what each document category means) to the model, so
+    they are still appended to the prompt, like the format instructions are.
+    """
+    schema = {
+        key: value
+        for key, value in pydantic_object.model_json_schema().items()  # type: ignore[attr-defined]
+        if key not in ("title", "type")
+    }
+    return (
+        "The answer is JSON following this schema; the descriptions explain "
+        "each field:\n```\n" + json.dumps(schema, ensure_ascii=False) + "\n```"
+    )
+
+
+def prompt_template(
+    prompt: str,
+    pydantic_object: type,
+    *,
+    structured_output: bool,
+) -> PromptTemplate:
+    """Return the prompt with format instructions or schema description appended."""
+    if structured_output:
+        return PromptTemplate.from_template(
+            prompt + "\n{schema_description}",
+            partial_variables={
+                "schema_description": schema_description(pydantic_object),
+            },
+        )
+    pydantic_parser: PydanticOutputParser = PydanticOutputParser(
+        pydantic_object=pydantic_object,
+    )
+    return PromptTemplate(
+        template=prompt + "\n{format_instructions}",
+        input_variables=[],
+        partial_variables={
+            "format_instructions": pydantic_parser.get_format_instructions(),
+        },
+    )
+
+
 class ChainLLM(BaseLLM):
     """Base class for LLM chains."""
 
     def __init__(self, model: str | None = None) -> None:
-        self.model = model
-        super().__init__()
+        super().__init__(model=model)
         self.llm: Any = None
-        self.chain: RunnableSequence[dict[str, str], Any] | None = None
-        self._current_pydantic_type: type | None = None
+        # Use the provider's schema-constrained decoding instead of format
+        # instructions in the prompt (chosen per provider by LLMFactory)
+        self.structured_output = False
+        # Chains are immutable once built, so one per (prompt, schema) is shared
+        # by all callers; the lock only guards building and inserting them.
+        self._chains: dict[tuple[str, type], RunnableSequence[dict[str, str], Any]] = {}
+        self._chains_lock = threading.Lock()
 
-    def create_chain(self, prompt: str, pydantic_object: type) -> None:
+    def create_chain(
+        self,
+        prompt: str,
+        pydantic_object: type,
+    ) -> "RunnableSequence[dict[str, str], Any]":
         """Create a chain for the LLM with the given prompt and pydantic object."""
         if not self.llm:
             msg = "LLM not initialized"
             raise LLMError(msg)
 
+        if self.structured_output:
+            return self._create_structured_chain(prompt, pydantic_object)
+
         try:
             pydantic_parser: PydanticOutputParser = PydanticOutputParser(
                 pydantic_object=pydantic_object,
             )
-            output_parser = OutputFixingParser.from_llm(
-                parser=pydantic_parser,
+            # Repair malformed JSON locally; only call the LLM fixer if that fails
+            output_parser = LocalRepairFixingParser.from_llm(
+                parser=LocalRepairParser(parser=pydantic_parser),
                 llm=self.llm,
             )
-            full_prompt = PromptTemplate(
-                template=prompt + "\n{format_instructions}",
-                input_variables=[],
-                partial_variables={
-                    "format_instructions": output_parser.get_format_instructions(),
-                },
+            full_prompt = prompt_template(
+                prompt,
+                pydantic_object,
+                structured_output=False,
+            )
+            chain: RunnableSequence[dict[str, str], Any] = (
+                full_prompt | self.llm | output_parser
             )
-            self.chain = full_prompt | self.llm | output_parser
             logger.debug("Chain created with prompt", extra={"prompt": full_prompt})
         except Exception as e:
             msg = f"Chain creation failed: {e!s}"
             logger.exception(msg)
             raise LLMError(msg) from e
+        return chain
+
+    def _structured_model(self, pydantic_object: type) -> "Runnable[Any, Any]":  # noqa: ARG002
+        """Return a runnable that produces pydantic_object via constrained decoding."""
+        msg = f"{type(self).__name__} does not support structured output"
+        raise LLMError(msg)
+
+    def _create_structured_chain(
+        self,
+        prompt: str,
+        pydantic_object: type,
+    ) -> "RunnableSequence[dict[str, str], Any]":
+        """Create a chain that passes the schema to the provider for decoding."""
+        try:
+            full_prompt = prompt_template(
+                prompt,
+                pydantic_object,
+                structured_output=True,
+            )
+            chain = cast(
+                "RunnableSequence[dict[str, str], Any]",
+                full_prompt | self._structured_model(pydantic_object),
+            )
+            logger.debug(
+                "Structured output chain created",
+                extra={"schema": pydantic_object.__name__},
+            )
+        except LLMError:
+            raise
+        except Exception as e:
+            msg = f"Chain creation failed: {e!s}"
+            logger.exception(msg)
+            raise LLMError(msg) from e
+        return chain
+
+    def get_chain(
+        self,
+        prompt: str,
+        pydantic_object: type,
+    ) -> "RunnableSequence[dict[str, str], Any]":
+        """Return the cached chain for (prompt, pydantic_object), building it once."""
+        key = (prompt, pydantic_object)
+        chain = self._chains.get(key)
+        if chain is None:
+            with self._chains_lock:
+                chain = self._chains.get(key)
+                if chain is None:
+                    chain = self.create_chain(prompt, pydantic_object)
+                    self._chains[key] = chain
+        return chain
+
+    def render_prompt(self, state: State, pydantic_object: type) -> str:  # type: ignore[override]
+        """Return the prompt with format instructions or schema description."""
+        chain = self.get_chain(state.prompt, pydantic_object)
+        return cast("PromptTemplate", chain.first).format(text=state.text)
+
+    @staticmethod
+    def _check_response(response: Any, pydantic_object: type) -> Any:
+        """Ensure the chain returned an instance of the expected pydantic type."""
+        if not isinstance(response, pydantic_object):
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise LLMResponseError(msg)
+        return response
 
     @langfuse.trace()
     def call(self, state: State, pydantic_object: type, **kwargs: Any) -> Any:
         """Call the LLM with a prompt, state, and pydantic object."""
-        # Recreate chain if pydantic_object changed or chain doesn't exist
-        if not self.chain or self._current_pydantic_type != pydantic_object:
-            self.create_chain(state.prompt, pydantic_object)
-            self._current_pydantic_type = pydantic_object
-            if not self.chain:
-                msg = "Chain creation failed to initialize chain"
-                raise LLMError(msg)
+        chain = self.get_chain(state.prompt, pydantic_object)
 
         logger.debug("Calling chain with state", extra={"state": state})
-        response = self.chain.invoke(
+        response = chain.invoke(
             {"text": state.text},
             **kwargs,
         )
-        if not isinstance(response, pydantic_object):
-            msg = f"Unexpected response type: {type(response)}"
-            logger.error(msg)
-            raise LLMResponseError(msg)
+        return self._check_response(response, pydantic_object)
 
-        return response
+    @langfuse.trace()
+    async def acall(self, state: State, pydantic_object: type, **kwargs: Any) -> Any:
+        """Call the LLM asynchronously without blocking the event loop."""
+        chain = self.get_chain(state.prompt, pydantic_object)
+
+        logger.debug("Calling chain asynchronously with state", extra={"state": state})
+        response = await chain.ainvoke(
+            {"text": state.text},
+            **kwargs,
+        )
+        return self._check_response(response, pydantic_object)
@@ -0,0 +1,281 @@
+"""Map-reduce extraction for texts longer than the model's context window."""
+
+import asyncio
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar, cast
+
+from documentassistent.exceptions import ConfigurationError
+from documentassistent.llm.base_llm import BaseLLM
+from documentassistent.structure.pydantic_llm_calls.invoice_call import (
+    InvoiceExtraction,
+    InvoiceTypeEnum,
+)
+from documentassistent.structure.pydantic_llm_calls.note_call import NoteExtraction
+from documentassistent.structure.pydantic_llm_calls.result_call import (
+    ResultExtraction,
+    TestResult,
+)
+from documentassistent.structure.state import BaseWorkflowState
+from documentassistent.utils.logger import setup_logger
+from documentassistent.utils.tokens import DEFAULT_ENCODING, count_tokens
+
+logger = setup_logger(name="ChunkedLLM", log_file="logs/chunked_llm.log")
+
+T = TypeVar("T")
+
+
+def _split_long_line(line: str, max_tokens: int, encoding: str) -> list[str]:
+    """Split a line that alone exceeds max_tokens at word boundaries."""
+    pieces: list[str] = []
+    current: list[str] = []
+    for word in line.split(" "):
+        if current and count_tokens(" ".join([*current, word]), encoding) > max_tokens:
+            pieces.append(" ".join(current))
+            current = []
+        current.append(word)
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def split_text(
+    text: str,
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    encoding: str = DEFAULT_ENCODING,
+) -> list[str]:
+    """
+    Split text at line breaks into chunks of at most max_tokens tokens.
+
+    Each chunk repeats the last lines of the previous one, up to
+    overlap_tokens, so rows cut at a chunk border appear whole in one chunk.
+    """
+    lines: list[tuple[str, int]] = []
+    for line in text.splitlines():
+        tokens = count_tokens(line, encoding)
+        if tokens <= max_tokens:
+            lines.append((line, tokens))
+        else:
+            lines.extend(
+                (piece, count_tokens(piece, encoding))
+                for piece in _split_long_line(line, max_tokens, encoding)
+            )
+
+    chunks: list[str] = []
+    current: list[tuple[str, int]] = []
+    size = 0
+    fresh = False  # current holds lines not yet emitted in a chunk
+    for line, tokens in lines:
+        if current and size + tokens > max_tokens:
+            chunks.append("\n".join(part for part, _ in current))
+            overlap: list[tuple[str, int]] = []
+            kept = 0
+            for previous in reversed(current):
+                if kept + previous[1] > overlap_tokens:
+                    break
+                overlap.insert(0, previous)
+                kept += previous[1]
+            # Overlap must leave room for the next line
+            while overlap and kept + tokens > max_tokens:
+                kept -= overlap.pop(0)[1]
+            current, size, fresh = overlap, kept, False
+        current.append((line, tokens))
+        size += tokens
+        fresh = True
+    if fresh:
+        chunks.append("\n".join(part for part, _ in current))
+    return chunks or [text]
+
+
+def _first(values: Iterable[T | None]) -> T | None:
+    """Return the first value that is not None or empty."""
+    return next((value for value in values if value), None)
+
+
+def _unique(items: Iterable[T], key: Callable[[T], Hashable]) -> list[T]:
+    """Return items in order, dropping repeats (rows seen in two overlapping chunks)."""
+    seen: set[Hashable] = set()
+    unique = []
+    for item in items:
+        item_key = key(item)
+        if item_key not in seen:
+            seen.add(item_key)
+            unique.append(item)
+    return unique
+
+
+def _norm(value: str | None) -> str:
+    return " ".join((value or "").split()).casefold()
+
+
+def _join_text(values: Iterable[str | None], separator: str = "\n") -> str | None:
+    """Join the distinct non-empty texts, or None if there are none."""
+    parts = _unique((value for value in values if value), key=_norm)
+    return separator.join(parts) if parts else None
+
+
+def merge_results(parts: list[ResultExtraction]) -> ResultExtraction:
+    """Merge lab results extracted from chunks, keeping each test row once."""
+
+    def row_key(row: TestResult) -> Hashable:
+        return (_norm(row.test_name), _norm(row.value), _norm(row.unit), row.date)
+
+    return ResultExtraction(
+        patient_name=_first(part.patient_name for part in parts),
+        test_results=_unique(
+            (row for part in parts for row in part.test_results),
+            key=row_key,
+        ),
+        overall_notes=_join_text(part.overall_notes for part in parts),
+    )
+
+
+def merge_notes(parts: list[NoteExtraction]) -> NoteExtraction:
+    """Merge notes extracted from chunks into one note."""
+    tags = [tag for part in parts for tag in part.tags or []]
+    return NoteExtraction(
+        author=_first(part.author for part in parts),
+        date=_first(part.date for part in parts),
+        content=_join_text((part.content for part in parts), "\n\n") or "",
+        tags=_unique(tags, key=_norm) if any(part.tags for part in parts) else None,
+    )
+
+
+def merge_invoices(parts: list[InvoiceExtraction]) -> InvoiceExtraction:
+    """
+    Merge invoices extracted from chunks.
+
+    The total is the largest amount found, since chunks without the summary
+    only see single positions.
+    """
+    invoice_type = _first(
+        part.type for part in parts if part.type != InvoiceTypeEnum.OTHER
+    )
+    return InvoiceExtraction(
+        type=invoice_type or InvoiceTypeEnum.OTHER,
+        price=max(part.price for part in parts),
+        date=_first(part.date for part in parts) or "",
+        description=_first(part.description for part in parts) or "",
+        notes=_join_text(part.notes for part in parts),
+        logs=_unique(
+            (log for part in parts for log in part.logs),
+            key=lambda log: (_norm(log.log), log.date),
+        ),
+    )
+
+
+# How to combine the partial results of each extraction schema
+MERGERS: dict[type, Callable[[list[Any]], Any]] = {
+    ResultExtraction: merge_results,
+    NoteExtraction: merge_notes,
+    InvoiceExtraction: merge_invoices,
+}
+
+
+class ChunkedLLM(BaseLLM):
+    """
+    LLM wrapper that extracts from long texts chunk by chunk.
+
+    Texts that fit, and schemas without a merger (e.g. classification), go
+    to the wrapped LLM unchanged. Longer texts are split into overlapping
+    chunks that are extracted concurrently and merged. With num_ctx, a chunk
+    gets what is left of the model's context window after the rendered
+    prompt and the output_tokens reserved for the answer; max_tokens, if set,
+    caps it further.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        llm: BaseLLM,
+        max_tokens: int | None = 3000,
+        overlap_tokens: int = 200,
+        max_concurrency: int = 4,
+        encoding: str = DEFAULT_ENCODING,
+        *,
+        num_ctx: int | None = None,
+        output_tokens: int = 0,
+    ) -> None:
+        if max_tokens is None and num_ctx is None:
+            msg = "ChunkedLLM needs max_tokens or num_ctx"
+            raise ConfigurationError(msg)
+        super().__init__(model=llm.model)
+        self.llm = llm
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.max_concurrency = max_concurrency
+        self.encoding = encoding
+        self.num_ctx = num_ctx
+        self.output_tokens = output_tokens
+
+    def text_budget(self, state: BaseWorkflowState, pydantic_object: type) -> int:
+        """Return how many tokens of text one call to the wrapped LLM can take."""
+        if self.num_ctx is None:
+            return cast("int", self.max_tokens)
+        prompt = self.llm.render_prompt(
+            state.model_copy(update={"text": ""}),
+            pydantic_object,
+        )
+        budget = self.num_ctx - count_tokens(prompt, self.encoding) - self.output_tokens
+        if budget <= 0:
+            msg = (
+                f"num_ctx {self.num_ctx} leaves no room for text after the "
+                f"{pydantic_object.__name__} prompt and {self.output_tokens} "
+                "output tokens"
+            )
+            raise ConfigurationError(msg)
+        return budget if self.max_tokens is None else min(budget, self.max_tokens)
+
+    def _chunk_states(
+        self,
+        state: BaseWorkflowState,
+        pydantic_object: type,
+    ) -> list[BaseWorkflowState] | None:
+        """Return one state per chunk, or None to send the state as it is."""
+        if pydantic_object not in MERGERS:
+            return None
+        tokens = count_tokens(state.text, self.encoding)
+        budget = self.text_budget(state, pydantic_object)
+        if tokens <= budget:
+            return None
+        chunks = split_text(state.text, budget, self.overlap_tokens, self.encoding)
+        logger.info(
+            "Extracting {} from {} tokens in {} chunks of up to {} tokens",
+            pydantic_object.__name__,
+            tokens,
+            len(chunks),
+            budget,
+        )
+        return [state.model_copy(update={"text": chunk}) for chunk in chunks]
+
+    def call(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Call the wrapped LLM once, or once per chunk and merge the results."""
+        states = self._chunk_states(state, pydantic_object)
+        if states is None:
+            return self.llm.call(state, pydantic_object)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            parts = list(
+                executor.map(
+                    lambda chunk: self.llm.call(chunk, pydantic_object),
+                    states,
+                ),
+            )
+        return MERGERS[pydantic_object](parts)
+
+    async def acall(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Async variant of call(); chunks are awaited concurrently."""
+        states = self._chunk_states(state, pydantic_object)
+        if states is None:
+            return await self.llm.acall(state, pydantic_object)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract(chunk: BaseWorkflowState) -> Any:
+            async with semaphore:
+                return await self.llm.acall(chunk, pydantic_object)
+
+        parts = await asyncio.gather(*(extract(chunk) for chunk in states))
+        return MERGERS[pydantic_object](list(parts))
+
+    def log_summary(self) -> None:
+        """Log the wrapped LLM's statistics."""
+        self.llm.log_summary()
@@ -0,0 +1,266 @@
+"""Deterministic local repair of malformed JSON responses before LLM fixing."""
+
+import json
+import re
+import threading
+import types
+from collections import defaultdict
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Union, get_args, get_origin
+
+from langchain.output_parsers import OutputFixingParser
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import BaseOutputParser, PydanticOutputParser
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="JSONRepair", log_file="logs/json_repair.log")
+
+_CODE_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)```", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "„": '"'})
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class RepairStats:
+    """Thread-safe counters of parse outcomes per schema."""
+
+    PARSED = "parsed"
+    REPAIRED = "repaired"
+    LLM_FALLBACK = "llm_fallback"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = defaultdict(
+            lambda: dict.fromkeys(
+                (self.PARSED, self.REPAIRED, self.LLM_FALLBACK),
+                0,
+            ),
+        )
+
+    def record(self, schema_name: str, outcome: str) -> None:
+        """Count one parse outcome for schema_name."""
+        with self._lock:
+            self._counts[schema_name][outcome] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Return a copy of all counters, keyed by schema name."""
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._counts.items()}
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._counts.clear()
+
+    def log_summary(self) -> None:
+        """Log per schema how many LLM fixer round-trips local repair saved."""
+        for schema_name, counts in sorted(self.snapshot().items()):
+            logger.info(
+                "JSON repair summary for {}: {} parsed, {} repaired locally "
+                "(LLM round-trips saved), {} sent to the LLM fixer",
+                schema_name,
+                counts[self.PARSED],
+                counts[self.REPAIRED],
+                counts[self.LLM_FALLBACK],
+            )
+
+
+# Shared by all parsers of the process; reset() starts a new count
+repair_stats = RepairStats()
+
+# Off while the LLM fixer's corrected output is parsed, which is not a new response
+_record_outcomes: ContextVar[bool] = ContextVar("record_outcomes", default=True)
+
+
+def strip_code_fences(text: str) -> str:
+    """Return the content of the first markdown code fence, or the text as is."""
+    match = _CODE_FENCE.search(text)
+    return match.group(1) if match else text
+
+
+def _scan(text: str, start: int) -> tuple[int, list[str]]:
+    """Scan from an opening brace; return end index and still-open brackets."""
+    stack: list[str] = []
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(char)
+        elif char in _CLOSERS.values() and stack:
+            stack.pop()
+            if not stack:
+                return index + 1, []
+    return len(text), stack
+
+
+def extract_json_object(text: str) -> str | None:
+    """Return the largest {...} block, closing brackets left open at the end."""
+    best: str | None = None
+    start = text.find("{")
+    while start != -1:
+        end, still_open = _scan(text, start)
+        candidate = text[start:end].rstrip().rstrip(",")
+        candidate += "".join(_CLOSERS[char] for char in reversed(still_open))
+        if best is None or len(candidate) > len(best):
+            best = candidate
+        start = text.find("{", end)
+    return best
+
+
+def fix_json_syntax(text: str) -> str:
+    """Fix trailing commas, smart quotes and Python literals outside strings."""
+    text = text.translate(_SMART_QUOTES)
+    # Only touch the parts between quoted strings, never string contents
+    parts = re.split(r'("(?:[^"\\]|\\.)*")', text)
+    for index in range(0, len(parts), 2):
+        part = _TRAILING_COMMA.sub(r"\1", parts[index])
+        parts[index] = re.sub(
+            r"\b(True|False|None)\b",
+            lambda match: _PYTHON_LITERALS[match.group(1)],
+            part,
+        )
+    return "".join(parts)
+
+
+def _normalize_enum_value(value: str) -> str:
+    return re.sub(r"[\s\-]+", "_", value.strip().lower())
+
+
+def _coerce(value: Any, annotation: Any) -> Any:
+    """Coerce value towards annotation (enums, nested models, lists, optionals)."""
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        for arg in get_args(annotation):
+            if arg is not type(None):
+                value = _coerce(value, arg)
+        return value
+    if origin is list and isinstance(value, list):
+        (item_type,) = get_args(annotation) or (Any,)
+        return [_coerce(item, item_type) for item in value]
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        if isinstance(value, str):
+            normalized = _normalize_enum_value(value)
+            for member in annotation:
+                if normalized in (
+                    _normalize_enum_value(str(member.value)),
+                    member.name.lower(),
+                ):
+                    return member.value
+        return value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return coerce_enums(value, annotation)
+    return value
+
+
+def coerce_enums(data: Any, model: type[BaseModel]) -> Any:
+    """Map enum values like "High" or "Receipt from doctor" to their members."""
+    if not isinstance(data, dict):
+        return data
+    coerced = dict(data)
+    for name, field in model.model_fields.items():
+        if name in coerced:
+            coerced[name] = _coerce(coerced[name], field.annotation)
+    return coerced
+
+
+def repair_json(text: str, model: type[BaseModel]) -> dict[str, Any] | None:
+    """Repair a malformed response into a dict for model, or None if impossible."""
+    candidate = extract_json_object(strip_code_fences(text))
+    if candidate is None:
+        return None
+    try:
+        data = json.loads(fix_json_syntax(candidate))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    return dict(coerce_enums(data, model))
+
+
+class LocalRepairParser(BaseOutputParser[Any]):
+    """Pydantic parser that tries a local repair before giving up."""
+
+    parser: PydanticOutputParser
+
+    @property
+    def _type(self) -> str:
+        return "local_repair"
+
+    def get_format_instructions(self) -> str:
+        """Return the wrapped parser's format instructions."""
+        return self.parser.get_format_instructions()
+
+    def parse(self, text: str) -> Any:
+        """Parse text, repairing common JSON mistakes locally when needed."""
+        model = self.parser.pydantic_object
+        schema_name = model.__name__
+        try:
+            result = self.parser.parse(text)
+        except OutputParserException:
+            repaired = repair_json(text, model)
+            if repaired is not None:
+                try:
+                    result = model.model_validate(repaired)
+                except PydanticValidationError:
+                    pass
+                else:
+                    self._record(schema_name, RepairStats.REPAIRED)
+                    logger.debug("Repaired {} response locally", schema_name)
+                    return result
+            self._record(schema_name, RepairStats.LLM_FALLBACK)
+            logger.debug("Local repair failed for {}, using LLM fixer", schema_name)
+            raise
+        self._record(schema_name, RepairStats.PARSED)
+        return result
+
+    @staticmethod
+    def _record(schema_name: str, outcome: str) -> None:
+        if _record_outcomes.get():
+            repair_stats.record(schema_name, outcome)
+
+
+class LocalRepairFixingParser(OutputFixingParser[Any]):
+    """
+    OutputFixingParser that counts one repair outcome per LLM response.
+
+    The response is parsed once with outcomes recorded; only if that fails
+    does the LLM fixer run, and its corrected outputs are parsed by the same
+    LocalRepairParser without being counted again.
+    """
+
+    def parse(self, completion: str) -> Any:
+        """Parse completion, falling back to the LLM fixer if needed."""
+        try:
+            return self.parser.parse(completion)
+        except OutputParserException:
+            token = _record_outcomes.set(False)
+            try:
+                return super().parse(completion)
+            finally:
+                _record_outcomes.reset(token)
+
+    async def aparse(self, completion: str) -> Any:
+        """Async variant of parse()."""
+        try:
+            return await self.parser.aparse(completion)
+        except OutputParserException:
+            token = _record_outcomes.set(False)
+            try:
+                return await super().aparse(completion)
+            finally:
+                _record_outcomes.reset(token)
@@ -1,19 +1,67 @@
-from typing import ClassVar, TypedDict
+from typing import Any, ClassVar, NotRequired, TypedDict
 
 from documentassistent.exceptions import UnsupportedProviderError
 from documentassistent.llm.base_llm import BaseLLM
+from documentassistent.llm.cached_llm import CachedLLM
+from documentassistent.llm.cascade_llm import DEFAULT_ESCALATE_ON, CascadeLLM
+from documentassistent.llm.chain_llm import ChainLLM
+from documentassistent.llm.chunked_llm import ChunkedLLM
 from documentassistent.llm.ollama_llm import OllamaLLMCall
 from documentassistent.llm.openai_llm import OpenAILLM
+from documentassistent.llm.replay_llm import RecordingLLM, ReplayConfig, ReplayLLM
+from documentassistent.llm.response_cache import ResponseCache
+from documentassistent.structure.pydantic_llm_calls.confidence import ConfidenceLevel
 from documentassistent.utils.logger import setup_logger
 
 logger = setup_logger(name="LLMFactory", log_file="logs/llm_factory.log")
 
 
+class CacheConfig(TypedDict):
+    """Configuration for the persistent LLM response cache."""
+
+    enabled: bool
+    path: NotRequired[str]
+    max_entries: NotRequired[int]
+    ttl_seconds: NotRequired[float | None]
+
+
+class RecordConfig(TypedDict):
+    """Configuration for recording real responses for later replay."""
+
+    enabled: bool
+    path: NotRequired[str]
+
+
+class CascadeConfig(TypedDict):
+    """Configuration for the small-to-large model cascade."""
+
+    enabled: bool
+    models: NotRequired[list[str]]
+    escalate_on: NotRequired[list[str]]
+
+
+class ChunkingConfig(TypedDict):
+    """Configuration for map-reduce extraction of long texts."""
+
+    enabled: bool
+    max_tokens: NotRequired[int | None]
+    overlap_tokens: NotRequired[int]
+    max_concurrency: NotRequired[int]
+
+
 class LLMConfig(TypedDict):
     """Configuration for the LLM."""
 
     type: str
     model: str | None
+    max_tokens: NotRequired[int]
+    num_ctx: NotRequired[int | None]
+    structured_output: NotRequired[bool | None]
+    cache: NotRequired[CacheConfig]
+    record: NotRequired[RecordConfig]
+    replay: NotRequired[ReplayConfig]
+    cascade: NotRequired[CascadeConfig]
+    chunking: NotRequired[ChunkingConfig]
 
 
 class ConfigDict(TypedDict):
@@ -22,14 +70,76 @@ class ConfigDict(TypedDict):
     llm: LLMConfig
 
 
+def config_from_settings(settings: dict[str, Any]) -> ConfigDict:
+    """Build a factory ConfigDict from the loaded config.yaml settings."""
+    llm_settings = settings.get("llm", {})
+    # Get provider from config, fallback to 'ollama' for backward compatibility
+    provider = llm_settings.get("provider", "ollama")
+    model = llm_settings.get("model", settings.get(provider, {}).get("model"))
+
+    llm_config: LLMConfig = {"type": provider, "model": model}
+    if "max_tokens" in llm_settings:
+        llm_config["max_tokens"] = llm_settings["max_tokens"]
+    if "num_ctx" in llm_settings:
+        llm_config["num_ctx"] = llm_settings["num_ctx"]
+    if "structured_output" in llm_settings:
+        llm_config["structured_output"] = llm_settings["structured_output"]
+    if "cache" in llm_settings:
+        llm_config["cache"] = llm_settings["cache"]
+    if "record" in llm_settings:
+        llm_config["record"] = llm_settings["record"]
+    if "replay" in llm_settings:
+        llm_config["replay"] = llm_settings["replay"]
+    if "cascade" in llm_settings:
+        llm_config["cascade"] = llm_settings["cascade"]
+    if "chunking" in llm_settings:
+        llm_config["chunking"] = llm_settings["chunking"]
+    return {"llm": llm_config}
+
+
 class LLMFactory:
     """Factory class to create LLM instances based on configuration."""
 
     _llm_classes: ClassVar[dict[str, type[BaseLLM]]] = {
         "ollama": OllamaLLMCall,
         "openai": OpenAILLM,
+        "replay": ReplayLLM,
     }
 
+    # Providers that constrain decoding to a JSON schema by default. OpenAI
+    # only supports it on newer models (not the gpt-4 default), so it is
+    # enabled there with llm.structured_output: true. Replay renders prompts
+    # like the default Ollama provider that recordings are usually made with
+    _structured_output_providers: ClassVar[frozenset[str]] = frozenset(
+        {"ollama", "replay"},
+    )
+
+    @classmethod
+    def _create_base(
+        cls,
+        llm_class: type[BaseLLM],
+        config: ConfigDict,
+        model: str | None,
+    ) -> BaseLLM:
+        """Create a single provider instance for model."""
+        llm: BaseLLM
+        if llm_class is ReplayLLM:
+            llm = ReplayLLM.from_config(model, config["llm"].get("replay", {}))
+        else:
+            options: dict[str, Any] = {"model": model} if model else {}
+            if llm_class is OllamaLLMCall:
+                options["num_ctx"] = config["llm"].get("num_ctx")
+            llm = llm_class(**options)
+
+        structured_output = config["llm"].get("structured_output")
+        if structured_output is None:
+            structured_output = (
+                config["llm"]["type"] in cls._structured_output_providers
+            )
+        if isinstance(llm, (ChainLLM, ReplayLLM)):
+            llm.structured_output = structured_output
+        return llm
+
     @classmethod
     def create_llm(cls, config: ConfigDict) -> BaseLLM:
         """Create an LLM instance based on the config."""
@@ -41,9 +151,54 @@ class LLMFactory:
             logger.error(msg)
             raise UnsupportedProviderError(msg)
 
-        # Create instance with optional model parameter
-        model = config["llm"].get("model")
-        llm = llm_class(model=model) if model else llm_class()
+        llm: BaseLLM
+        cascade_config = config["llm"].get("cascade")
+        if cascade_config and cascade_config.get("enabled"):
+            models: list[str | None] = list(cascade_config.get("models", []))
+            llm = CascadeLLM(
+                tiers=[
+                    cls._create_base(llm_class, config, model)
+                    for model in models or [config["llm"].get("model")]
+                ],
+                escalate_on=frozenset(
+                    ConfidenceLevel(level)
+                    for level in cascade_config.get(
+                        "escalate_on",
+                        [level.value for level in DEFAULT_ESCALATE_ON],
+                    )
+                ),
+            )
+        else:
+            llm = cls._create_base(llm_class, config, config["llm"].get("model"))
+
+        record_config = config["llm"].get("record")
+        if record_config and record_config.get("enabled"):
+            llm = RecordingLLM(
+                llm=llm,
+                path=record_config.get("path", "data/llm_recordings.jsonl"),
+            )
+
+        # Below the cache, so the merged result is cached for the full text;
+        # above recording, so recordings hold the calls actually made
+        chunking_config = config["llm"].get("chunking")
+        if chunking_config and chunking_config.get("enabled"):
+            llm = ChunkedLLM(
+                llm=llm,
+                max_tokens=chunking_config.get("max_tokens", 3000),
+                overlap_tokens=chunking_config.get("overlap_tokens", 200),
+                max_concurrency=chunking_config.get("max_concurrency", 4),
+                num_ctx=config["llm"].get("num_ctx"),
+                output_tokens=config["llm"].get("max_tokens", 0),
+            )
+
+        cache_config = config["llm"].get("cache")
+        if cache_config and cache_config.get("enabled"):
+            cache = ResponseCache(
+                path=cache_config.get("path", "data/llm_cache.db"),
+                max_entries=cache_config.get("max_entries", 10_000),
+                ttl_seconds=cache_config.get("ttl_seconds"),
+            )
+            llm = CachedLLM(llm=llm, cache=cache, provider=llm_type)
 
         logger.info("Created LLM instance", extra={"type": llm_type})
         return llm
@@ -1,6 +1,11 @@
+from typing import Any, cast
+
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.runnables import Runnable
 from langchain_ollama import OllamaLLM
 
 from documentassistent.llm.chain_llm import ChainLLM
+from documentassistent.llm.json_repair import LocalRepairParser
 from documentassistent.utils.logger import setup_logger
 
 logger = setup_logger(name="OllamaLLM", log_file="logs/ollama_llm.log")
@@ -9,7 +14,19 @@ logger = setup_logger(name="OllamaLLM", log_file="logs/ollama_llm.log")
 class OllamaLLMCall(ChainLLM):
     """Ollama LLM class for interacting with Ollama models."""
 
-    def __init__(self, model: str = "gemma") -> None:
+    def __init__(self, model: str = "gemma", num_ctx: int | None = None) -> None:
         super().__init__(model=model)
-        self.llm = OllamaLLM(model=model)
-        logger.info("OllamaLLM initialized with model", extra={"model": model})
+        # None keeps the context window of the model's Modelfile
+        self.llm = OllamaLLM(model=model, num_ctx=num_ctx)
+        logger.info(
+            "OllamaLLM initialized with model",
+            extra={"model": model, "num_ctx": num_ctx},
+        )
+
+    def _structured_model(self, pydantic_object: type) -> Runnable[Any, Any]:
+        """Constrain generation with Ollama's `format` JSON schema parameter."""
+        schema = pydantic_object.model_json_schema()  # type: ignore[attr-defined]
+        parser = LocalRepairParser(
+            parser=PydanticOutputParser(pydantic_object=pydantic_object),
+        )
+        return cast("Runnable[Any, Any]", self.llm.bind(format=schema) | parser)
@@ -1,5 +1,7 @@
 import os
+from typing import Any, cast
 
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 
@@ -13,15 +15,22 @@ logger = setup_logger(name="OpenAILLM", log_file="logs/openai_llm.log")
 class OpenAILLM(ChainLLM):
     """OpenAI LLM class for interacting with OpenAI models."""
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, model: str | None = None) -> None:
+        model_name = model or os.getenv("OPENAI_MODEL") or "gpt-4"
+        super().__init__(model=model_name)
         self.api_key = os.getenv("OPENAI_API_KEY")
-        self.model = os.getenv("OPENAI_MODEL", "gpt-4")
         if not self.api_key:
             msg = "OPENAI_API_KEY not found in environment variables"
             raise MissingConfigError(msg)
         self.llm = ChatOpenAI(
             api_key=SecretStr(self.api_key),
-            model=self.model,
+            model=model_name,
         )
         logger.info("OpenAILLM initialized with model: {}", self.model)
+
+    def _structured_model(self, pydantic_object: type) -> Runnable[Any, Any]:
+        """Constrain generation with OpenAI structured outputs (JSON schema)."""
+        return cast(
+            "Runnable[Any, Any]",
+            self.llm.with_structured_output(pydantic_object, method="json_schema"),
+        )
@@ -0,0 +1,243 @@
+"""Record real LLM responses and replay them offline with synthetic latency."""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, NotRequired, TypedDict
+
+from documentassistent.exceptions import LLMResponseError
+from documentassistent.llm.base_llm import BaseLLM
+from documentassistent.llm.chain_llm import prompt_template
+from documentassistent.llm.response_cache import request_fingerprint
+from documentassistent.prompts.prompt_collection import get_prompt_version
+from documentassistent.structure.state import BaseWorkflowState
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="ReplayLLM", log_file="logs/replay_llm.log")
+
+DEFAULT_RECORDINGS_PATH = "data/llm_recordings.jsonl"
+
+
+class LatencyConfig(TypedDict):
+    """Configuration of the synthetic latency used when replaying."""
+
+    kind: str
+    seconds: NotRequired[float]
+    median: NotRequired[float]
+    sigma: NotRequired[float]
+    scale: NotRequired[float]
+    seed: NotRequired[int | None]
+
+
+class ReplayConfig(TypedDict):
+    """Configuration for the replay provider."""
+
+    path: NotRequired[str]
+    latency: NotRequired[LatencyConfig]
+
+
+def _fingerprint(state: BaseWorkflowState, pydantic_object: type) -> str:
+    """Identify a request independently of provider and model."""
+    return request_fingerprint(
+        get_prompt_version(getattr(state, "prompt", "")),
+        pydantic_object.__name__,
+        state.text,
+    )
+
+
+class LatencyModel(ABC):
+    """Distribution of synthetic response times."""
+
+    @abstractmethod
+    def sample(self, recorded_seconds: float) -> float:
+        """Return the delay to apply for a response recorded at recorded_seconds."""
+
+    @classmethod
+    def from_config(cls, config: LatencyConfig | None) -> "LatencyModel":
+        """Build a latency model from configuration."""
+        if not config:
+            return FixedLatency(0.0)
+        kind = config["kind"]
+        if kind == "fixed":
+            return FixedLatency(config.get("seconds", 0.0))
+        if kind == "lognormal":
+            return LognormalLatency(
+                median=config.get("median", 1.0),
+                sigma=config.get("sigma", 0.5),
+                seed=config.get("seed"),
+            )
+        if kind == "recorded":
+            return RecordedLatency(scale=config.get("scale", 1.0))
+        msg = f"Unknown latency kind: {kind!r}"
+        raise ValueError(msg)
+
+
+class FixedLatency(LatencyModel):
+    """The same delay for every response."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def sample(self, recorded_seconds: float) -> float:  # noqa: ARG002
+        """Return the fixed delay."""
+        return self.seconds
+
+
+class LognormalLatency(LatencyModel):
+    """Log-normally distributed delays, typical of LLM response times."""
+
+    def __init__(self, median: float, sigma: float, seed: int | None = None) -> None:
+        self.median = median
+        self.sigma = sigma
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+
+    def sample(self, recorded_seconds: float) -> float:  # noqa: ARG002
+        """Draw a delay with the configured median and spread."""
+        with self._lock:
+            return self.median * self._random.lognormvariate(0.0, self.sigma)
+
+
+class RecordedLatency(LatencyModel):
+    """Replay the timings measured while recording, optionally scaled."""
+
+    def __init__(self, scale: float = 1.0) -> None:
+        self.scale = scale
+
+    def sample(self, recorded_seconds: float) -> float:
+        """Return the recorded delay times the scale factor."""
+        return recorded_seconds * self.scale
+
+
+class RecordingLLM(BaseLLM):
+    """LLM wrapper that appends every request/response pair to a JSONL file."""
+
+    def __init__(self, llm: BaseLLM, path: str = DEFAULT_RECORDINGS_PATH) -> None:
+        super().__init__(model=llm.model)
+        self.llm = llm
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def render_prompt(self, state: BaseWorkflowState, pydantic_object: type) -> str:
+        """Return the wrapped LLM's prompt for state."""
+        return self.llm.render_prompt(state, pydantic_object)
+
+    def log_summary(self) -> None:
+        """Log the wrapped LLM's statistics."""
+        self.llm.log_summary()
+
+    def _record(
+        self,
+        state: BaseWorkflowState,
+        pydantic_object: type,
+        response: Any,
+        seconds: float,
+    ) -> None:
+        """Append a single recording."""
+        record = {
+            "key": _fingerprint(state, pydantic_object),
+            "schema": pydantic_object.__name__,
+            "model": self.model,
+            "response": response.model_dump(mode="json"),
+            "latency_seconds": seconds,
+        }
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock, self.path.open("a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+    def call(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Call the wrapped LLM and record the response and its latency."""
+        start = time.perf_counter()
+        response = self.llm.call(state, pydantic_object)
+        self._record(state, pydantic_object, response, time.perf_counter() - start)
+        return response
+
+    async def acall(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Async variant of call()."""
+        start = time.perf_counter()
+        response = await self.llm.acall(state, pydantic_object)
+        self._record(state, pydantic_object, response, time.perf_counter() - start)
+        return response
+
+
+class ReplayLLM(BaseLLM):
+    """Offline LLM that serves recorded responses with synthetic latency."""
+
+    def __init__(
+        self,
+        model: str | None = None,
+        path: str = DEFAULT_RECORDINGS_PATH,
+        latency: LatencyModel | None = None,
+    ) -> None:
+        super().__init__(model=model)
+        self.path = path
+        self.latency = latency or FixedLatency(0.0)
+        # Render prompts like the recorded provider (set by LLMFactory), so
+        # ChunkedLLM splits texts into the same chunks as when recording
+        self.structured_output = False
+        self._records: dict[str, dict[str, Any]] = {}
+
+        recordings = Path(path)
+        if recordings.exists():
+            with recordings.open(encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        record = json.loads(line)
+                        # Later recordings of the same request win
+                        self._records[record["key"]] = record
+        logger.info("Loaded {} recorded responses from {}", len(self._records), path)
+
+    @classmethod
+    def from_config(
+        cls,
+        model: str | None,
+        config: ReplayConfig,
+    ) -> "ReplayLLM":
+        """Create a replay LLM from the `llm.replay` configuration."""
+        return cls(
+            model=model,
+            path=config.get("path", DEFAULT_RECORDINGS_PATH),
+            latency=LatencyModel.from_config(config.get("latency")),
+        )
+
+    def render_prompt(self, state: BaseWorkflowState, pydantic_object: type) -> str:
+        """Return the prompt the recorded ChainLLM provider sent for state."""
+        return prompt_template(
+            getattr(state, "prompt", ""),
+            pydantic_object,
+            structured_output=self.structured_output,
+        ).format(text=state.text)
+
+    def _lookup(
+        self,
+        state: BaseWorkflowState,
+        pydantic_object: type,
+    ) -> tuple[Any, float]:
+        """Return the recorded response and the delay to apply before it."""
+        record = self._records.get(_fingerprint(state, pydantic_object))
+        if record is None:
+            msg = (
+                f"No recorded {pydantic_object.__name__} response for this text "
+                f"in {self.path}"
+            )
+            logger.error(msg)
+            raise LLMResponseError(msg)
+        response = pydantic_object.model_validate(record["response"])  # type: ignore[attr-defined]
+        return response, self.latency.sample(record.get("latency_seconds", 0.0))
+
+    def call(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Return the recorded response after a synthetic delay."""
+        response, delay = self._lookup(state, pydantic_object)
+        time.sleep(delay)
+        return response
+
+    async def acall(self, state: BaseWorkflowState, pydantic_object: type) -> Any:
+        """Return the recorded response after a non-blocking synthetic delay."""
+        response, delay = self._lookup(state, pydantic_object)
+        await asyncio.sleep(delay)
+        return response
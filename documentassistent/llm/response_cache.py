@@ -0,0 +1,167 @@
+"""Persistent SQLite cache for validated LLM responses."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="ResponseCache", log_file="logs/response_cache.log")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so OCR spacing differences hit the same entry."""
+    return " ".join(text.split())
+
+
+def request_fingerprint(prompt_version: str, schema_name: str, text: str) -> str:
+    """Identify a request by prompt version, schema and normalized text."""
+    text_hash = hashlib.sha256(normalize_text(text).encode()).hexdigest()
+    return f"{prompt_version}|{schema_name}|{text_hash}"
+
+
+def cache_key(
+    provider: str,
+    model: str | None,
+    prompt_version: str,
+    schema_name: str,
+    text: str,
+) -> str:
+    """Build the cache key for a single LLM request."""
+    fingerprint = request_fingerprint(prompt_version, schema_name, text)
+    return f"{provider}|{model or ''}|{fingerprint}"
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters of a ResponseCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of LLM responses stored in a local SQLite file."""
+
+    def __init__(
+        self,
+        path: str = "data/llm_cache.db",
+        max_entries: int = 10_000,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds or None
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, "
+            "schema_name TEXT NOT NULL, "
+            "payload TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL)",
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_responses_accessed_at "
+            "ON llm_responses (accessed_at)",
+        )
+        self._connection.commit()
+        logger.info(
+            "Response cache opened at {} (max {} entries)",
+            path,
+            max_entries,
+        )
+
+    def get(self, key: str) -> str | None:
+        """Return the cached JSON payload for key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload, created_at FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            payload, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._connection.execute(
+                    "DELETE FROM llm_responses WHERE key = ?",
+                    (key,),
+                )
+                self._connection.commit()
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            self._connection.commit()
+            self.stats.hits += 1
+            return str(payload)
+
+    def put(self, key: str, schema_name: str, payload: str) -> None:
+        """Store a JSON payload and evict least recently used entries."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, schema_name, payload, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, schema_name, payload, now, now),
+            )
+            evicted = self._connection.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            self._connection.commit()
+            self.stats.evictions += max(evicted, 0)
+
+    def invalidate(self, key: str) -> None:
+        """Delete an entry whose payload get() returned but that is unusable."""
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+            self._connection.commit()
+            # The lookup was counted as a hit, but the caller has to ask the LLM
+            self.stats.hits -= 1
+            self.stats.misses += 1
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM llm_responses",
+            ).fetchone()
+        return int(row[0])
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
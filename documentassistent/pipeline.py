@@ -1,16 +1,25 @@
 """Document processing pipeline using LangChain LCEL."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from langchain_core.runnables import RunnableBranch, RunnableLambda
+from langchain_core.runnables import Runnable, RunnableBranch, RunnableLambda
 
 from documentassistent.agents.classification_agent import ClassificationAgent
+from documentassistent.agents.input_policy import InputPolicy
 from documentassistent.agents.invoice_agent import InvoiceAgent
 from documentassistent.agents.note_agent import NoteAgent
 from documentassistent.agents.result_agent import ResultAgent
+from documentassistent.agents.rule_classifier import RuleBasedClassifier
 from documentassistent.agents.storage_agent import StorageAgent
-from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
-from documentassistent.structure.state import ClassificationState
+from documentassistent.input_engineering.input_reader import PageStream
+from documentassistent.input_engineering.text_normalizer import TextNormalizer
+from documentassistent.llm.base_llm import BaseLLM
+from documentassistent.llm.llm_factory import LLMFactory, config_from_settings
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+)
+from documentassistent.structure.state import ClassificationState, Document
 from documentassistent.utils.logger import setup_logger
 from load_config import load_config
 
@@ -21,39 +30,30 @@ logger = setup_logger(
 CONFIG = load_config("config.yaml")
 
 
-def create_pipeline(
+def create_extraction_pipeline(  # noqa: PLR0913
     classification_agent: ClassificationAgent | None = None,
     invoice_agent: InvoiceAgent | None = None,
     note_agent: NoteAgent | None = None,
     result_agent: ResultAgent | None = None,
-    storage_agent: StorageAgent | None = None,
+    *,
+    llm: BaseLLM | None = None,
+    pre_classifier: RuleBasedClassifier | None = None,
 ) -> Any:
     """
-    Create a document processing pipeline using LangChain LCEL.
+    Create the LLM part of the pipeline (classify -> extract) without storage.
 
     Args:
         classification_agent: Optional classification agent. If None, creates default.
         invoice_agent: Optional invoice extraction agent. If None, creates default.
         note_agent: Optional note extraction agent. If None, creates default.
         result_agent: Optional result extraction agent. If None, creates default.
-        storage_agent: Optional storage agent. If None, creates default.
+        llm: LLM shared by the default agents. If None, creates it from config.
+        pre_classifier: Fast path of the default classification agent. If None,
+            creates it from config (if enabled there).
 
     Returns:
-        Compiled LCEL chain ready for execution.
-
-    Example:
-        # Production usage with defaults
-        pipeline = create_pipeline()
-        result = pipeline.invoke(state)
-
-        # Testing with mock agents
-        pipeline = create_pipeline(
-            classification_agent=MockClassificationAgent(),
-            storage_agent=MockStorageAgent(),
-        )
+        LCEL chain that classifies a state and runs the matching extractor.
     """
-    logger.info("Creating LCEL pipeline... 🧩")
-
     # Create default agents if not provided
     if (
         classification_agent is None
@@ -62,35 +62,38 @@ def create_pipeline(
         or result_agent is None
     ):
         # Create LLM once for all agents that need it (dependency injection)
-        provider = CONFIG.get("llm", {}).get("provider", "ollama")
-        model = CONFIG.get("llm", {}).get(
-            "model",
-            CONFIG.get(provider, {}).get("model"),
-        )
-        config: ConfigDict = {
-            "llm": {
-                "type": provider,
-                "model": model,
-            },
-        }
-        llm = LLMFactory.create_llm(config)
-        logger.info(
-            "Created shared LLM instance",
-            extra={"type": provider, "model": model},
-        )
+        if llm is None:
+            config = config_from_settings(CONFIG)
+            llm = LLMFactory.create_llm(config)
+            logger.info(
+                "Created shared LLM instance",
+                extra={"type": config["llm"]["type"], "model": config["llm"]["model"]},
+            )
 
         # Create default agents for any that weren't provided
         if classification_agent is None:
-            classification_agent = ClassificationAgent(llm=llm)
+            classification_agent = ClassificationAgent(
+                llm=llm,
+                pre_classifier=(
+                    pre_classifier or RuleBasedClassifier.from_settings(CONFIG)
+                ),
+                input_policy=InputPolicy.from_settings(CONFIG, "classification"),
+            )
         if invoice_agent is None:
-            invoice_agent = InvoiceAgent(llm=llm)
+            invoice_agent = InvoiceAgent(
+                llm=llm,
+                input_policy=InputPolicy.from_settings(CONFIG, "invoice"),
+            )
         if note_agent is None:
-            note_agent = NoteAgent(llm=llm)
+            note_agent = NoteAgent(
+                llm=llm,
+                input_policy=InputPolicy.from_settings(CONFIG, "note"),
+            )
         if result_agent is None:
-            result_agent = ResultAgent(llm=llm)
-
-    if storage_agent is None:
-        storage_agent = StorageAgent()
+            result_agent = ResultAgent(
+                llm=llm,
+                input_policy=InputPolicy.from_settings(CONFIG, "result"),
+            )
 
     # Helper functions for type-safe branching
     def is_invoice(state: ClassificationState) -> bool:
@@ -107,12 +110,23 @@ def create_pipeline(
             and state.classification_result.label.value == "note"
         )
 
-    # Wrap agent methods as RunnableLambda
-    classification_runnable = RunnableLambda(classification_agent.classify)
-    invoice_runnable = RunnableLambda(invoice_agent.extract_invoice)
-    note_runnable = RunnableLambda(note_agent.extract_note)
-    result_runnable = RunnableLambda(result_agent.extract_result)
-    storage_runnable = RunnableLambda(storage_agent.store_results)
+    # Wrap agent methods as RunnableLambda, with async siblings for ainvoke
+    classification_runnable = RunnableLambda(
+        classification_agent.classify,
+        afunc=classification_agent.aclassify,
+    )
+    invoice_runnable = RunnableLambda(
+        invoice_agent.extract_invoice,
+        afunc=invoice_agent.aextract_invoice,
+    )
+    note_runnable = RunnableLambda(
+        note_agent.extract_note,
+        afunc=note_agent.aextract_note,
+    )
+    result_runnable = RunnableLambda(
+        result_agent.extract_result,
+        afunc=result_agent.aextract_result,
+    )
 
     # Create conditional branch for extraction based on classification
     extraction_branch: RunnableBranch[ClassificationState, ClassificationState] = (
@@ -123,13 +137,89 @@ def create_pipeline(
         )
     )
 
+    return classification_runnable | extraction_branch
+
+
+def create_pipeline(
+    classification_agent: ClassificationAgent | None = None,
+    invoice_agent: InvoiceAgent | None = None,
+    note_agent: NoteAgent | None = None,
+    result_agent: ResultAgent | None = None,
+    storage_agent: StorageAgent | None = None,
+) -> Any:
+    """
+    Create a document processing pipeline using LangChain LCEL.
+
+    Args:
+        classification_agent: Optional classification agent. If None, creates default.
+        invoice_agent: Optional invoice extraction agent. If None, creates default.
+        note_agent: Optional note extraction agent. If None, creates default.
+        result_agent: Optional result extraction agent. If None, creates default.
+        storage_agent: Optional storage agent. If None, creates default.
+
+    Returns:
+        Compiled LCEL chain ready for execution.
+
+    Example:
+        # Production usage with defaults
+        pipeline = create_pipeline()
+        result = pipeline.invoke(state)
+        result = await pipeline.ainvoke(state)  # async nodes, no thread per doc
+
+        # Testing with mock agents
+        pipeline = create_pipeline(
+            classification_agent=MockClassificationAgent(),
+            storage_agent=MockStorageAgent(),
+        )
+    """
+    logger.info("Creating LCEL pipeline... 🧩")
+
+    extraction_pipeline = create_extraction_pipeline(
+        classification_agent=classification_agent,
+        invoice_agent=invoice_agent,
+        note_agent=note_agent,
+        result_agent=result_agent,
+    )
+
+    if storage_agent is None:
+        storage_agent = StorageAgent()
+
+    storage_runnable = RunnableLambda(
+        storage_agent.store_results,
+        afunc=storage_agent.astore_results,
+    )
+
     # Create the full pipeline: classify -> extract -> store
-    pipeline = classification_runnable | extraction_branch | storage_runnable
+    pipeline = extraction_pipeline | storage_runnable
 
     logger.success("LCEL pipeline created successfully. 🎉")
     return pipeline
 
 
+def classify_while_reading(
+    classify: Runnable[ClassificationState, ClassificationState],
+    pages: PageStream,
+    max_pages: int,
+    normalizer: TextNormalizer | None = None,
+) -> tuple[Document, Classification | None]:
+    """
+    Classify the first max_pages pages while the remaining pages are read.
+
+    Classification only needs the start of a document, so its LLM call runs
+    in a thread while the rest is extracted or OCRed. Returns the whole
+    document and the classification; a state that already has the
+    classification skips the classification step of the pipeline.
+    """
+    head_pages = pages.head(max_pages)
+    head = Document(content="".join(head_pages), pages=head_pages)
+    text = normalizer.normalize(head).text if normalizer else head.content
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        classified = executor.submit(classify.invoke, ClassificationState(text=text))
+        all_pages = pages.read_all()
+        document = Document(content="".join(all_pages), pages=all_pages)
+        return document, classified.result().classification_result
+
+
 if __name__ == "__main__":
     # Example usage of the pipeline
     pipeline = create_pipeline()
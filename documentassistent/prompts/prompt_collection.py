@@ -1,9 +1,27 @@
 """Prompt collection loaded from YAML configuration files."""
 
+import hashlib
+
 from documentassistent.prompts.prompt_loader import get_prompt, load_prompt_config
 
 # Load prompts from YAML files
 CATEGORISATION_PROMPT = get_prompt("categorisation", text="{text}")
-INVOICE_EXTRACTION_PROMPT = load_prompt_config("invoice_extraction")["system"]
-NOTE_EXTRACTION_PROMPT = load_prompt_config("note_extraction")["system"]
-RESULT_EXTRACTION_PROMPT = load_prompt_config("result_extraction")["system"]
+INVOICE_EXTRACTION_PROMPT = get_prompt("invoice_extraction", text="{text}")
+NOTE_EXTRACTION_PROMPT = get_prompt("note_extraction", text="{text}")
+RESULT_EXTRACTION_PROMPT = get_prompt("result_extraction", text="{text}")
+
+# YAML `version` of each prompt, used to invalidate cached LLM responses
+PROMPT_VERSIONS: dict[str, str] = {
+    CATEGORISATION_PROMPT: load_prompt_config("categorisation")["version"],
+    INVOICE_EXTRACTION_PROMPT: load_prompt_config("invoice_extraction")["version"],
+    NOTE_EXTRACTION_PROMPT: load_prompt_config("note_extraction")["version"],
+    RESULT_EXTRACTION_PROMPT: load_prompt_config("result_extraction")["version"],
+}
+
+
+def get_prompt_version(prompt: str) -> str:
+    """Return the YAML version of a known prompt, or a content hash otherwise."""
+    version = PROMPT_VERSIONS.get(prompt)
+    if version is not None:
+        return f"v{version}"
+    return "sha256:" + hashlib.sha256(prompt.encode()).hexdigest()[:16]
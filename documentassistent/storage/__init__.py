@@ -1,6 +1,18 @@
 """Storage module for persisting document extractions to SQLite database."""
 
-from documentassistent.storage.database import get_session, init_database
-from documentassistent.storage.repository import DocumentRepository, FileMetadata
+from documentassistent.storage.database import (
+    SQLiteProfile,
+    get_session,
+    init_database,
+)
+from documentassistent.storage.repository import DocumentRepository
+from documentassistent.storage.unit_of_work import DocumentUnitOfWork, FileMetadata
 
-__all__ = ["DocumentRepository", "FileMetadata", "get_session", "init_database"]
+__all__ = [
+    "DocumentRepository",
+    "DocumentUnitOfWork",
+    "FileMetadata",
+    "SQLiteProfile",
+    "get_session",
+    "init_database",
+]
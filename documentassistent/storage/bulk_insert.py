@@ -0,0 +1,154 @@
+"""Core-level bulk inserts of documents with their extractions."""
+
+from collections.abc import Callable
+from typing import Any, NamedTuple, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+from documentassistent.storage.models import (
+    Base,
+    Document,
+    InvoiceExtraction,
+    InvoiceLog,
+    NoteExtraction,
+    NoteTag,
+    ResultExtraction,
+    TestResult,
+)
+from documentassistent.storage.unit_of_work import Extraction, FileMetadata
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+)
+from documentassistent.structure.pydantic_llm_calls.invoice_call import (
+    InvoiceExtraction as InvoiceExtractionPydantic,
+)
+from documentassistent.structure.pydantic_llm_calls.note_call import (
+    NoteExtraction as NoteExtractionPydantic,
+)
+from documentassistent.structure.pydantic_llm_calls.result_call import (
+    ResultExtraction as ResultExtractionPydantic,
+)
+from documentassistent.utils.dates import parse_date
+
+Row = dict[str, Any]
+
+
+class DocumentRecord(NamedTuple):
+    """A classified document and its extraction, as passed to save_many()."""
+
+    file_metadata: FileMetadata
+    classification: Classification
+    extraction: Extraction | None = None
+    text_content: str | None = None
+
+
+class _ExtractionTables(NamedTuple):
+    """Where one extraction type and its child rows are stored."""
+
+    parent: type[Base]
+    values: Callable[[Any], Row]
+    child: type[Base]
+    foreign_key: str
+    children: Callable[[Any], list[Row]]
+
+
+def _table(model: type[Base]) -> Table:
+    return cast("Table", model.__table__)
+
+
+def _document_values(record: DocumentRecord) -> Row:
+    classification = record.classification
+    return {
+        "original_path": record.file_metadata.path,
+        "file_hash": record.file_metadata.hash,
+        "file_size": record.file_metadata.size,
+        "file_type": record.file_metadata.type,
+        "classification_label": classification.label,
+        "classification_confidence_level": classification.confidence.level,
+        "classification_confidence_explanation": classification.confidence.explanation,
+        "text_content": record.text_content,
+    }
+
+
+def _invoice_values(extraction: InvoiceExtractionPydantic) -> Row:
+    values = extraction.model_dump(
+        include={"type", "price", "date", "description", "notes"},
+    )
+    return {**values, "normalized_date": parse_date(extraction.date)}
+
+
+def _note_values(extraction: NoteExtractionPydantic) -> Row:
+    return extraction.model_dump(include={"author", "date", "content"})
+
+
+def _result_values(extraction: ResultExtractionPydantic) -> Row:
+    return extraction.model_dump(include={"patient_name", "overall_notes"})
+
+
+EXTRACTION_TABLES: dict[type, _ExtractionTables] = {
+    InvoiceExtractionPydantic: _ExtractionTables(
+        parent=InvoiceExtraction,
+        values=_invoice_values,
+        child=InvoiceLog,
+        foreign_key="invoice_extraction_id",
+        children=lambda e: [log.model_dump() for log in e.logs],
+    ),
+    NoteExtractionPydantic: _ExtractionTables(
+        parent=NoteExtraction,
+        values=_note_values,
+        child=NoteTag,
+        foreign_key="note_extraction_id",
+        children=lambda e: [{"tag": tag} for tag in e.tags or []],
+    ),
+    ResultExtractionPydantic: _ExtractionTables(
+        parent=ResultExtraction,
+        values=_result_values,
+        child=TestResult,
+        foreign_key="result_extraction_id",
+        children=lambda e: [test.model_dump() for test in e.test_results],
+    ),
+}
+
+
+def _insert_returning_ids(session: Session, table: Table, rows: list[Row]) -> list[int]:
+    """Insert rows with one executemany and return their IDs in row order."""
+    if not rows:
+        return []
+    statement = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+    return list(session.execute(statement, rows).scalars())
+
+
+def insert_documents(session: Session, records: list[DocumentRecord]) -> list[int]:
+    """
+    Insert documents, their extractions and child rows, and return the IDs.
+
+    Each table gets one executemany; the caller owns the transaction.
+    """
+    document_ids = _insert_returning_ids(
+        session,
+        _table(Document),
+        [_document_values(record) for record in records],
+    )
+    for kind, tables in EXTRACTION_TABLES.items():
+        owned = [
+            (document_id, record.extraction)
+            for document_id, record in zip(document_ids, records, strict=True)
+            if isinstance(record.extraction, kind)
+        ]
+        parent_ids = _insert_returning_ids(
+            session,
+            _table(tables.parent),
+            [
+                {"document_id": document_id, **tables.values(extraction)}
+                for document_id, extraction in owned
+            ],
+        )
+        child_rows = [
+            {tables.foreign_key: parent_id, **row}
+            for parent_id, (_, extraction) in zip(parent_ids, owned, strict=True)
+            for row in tables.children(extraction)
+        ]
+        if child_rows:
+            session.execute(insert(_table(tables.child)), child_rows)
+    return document_ids
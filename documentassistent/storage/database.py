@@ -1,12 +1,26 @@
 """Database connection and session management."""
 
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    Connection,
+    bindparam,
+    create_engine,
+    event,
+    inspect,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from documentassistent.exceptions import DatabaseConnectionError
-from documentassistent.storage.models import Base
+from documentassistent.storage.models import Base, InvoiceExtraction
+from documentassistent.storage.search import create_search_index
+from documentassistent.utils.dates import parse_date
 from documentassistent.utils.logger import setup_logger
 
 logger = setup_logger(
@@ -18,23 +32,147 @@ _engine = None
 _SessionLocal = None
 
 
-def init_database(db_path: str) -> None:
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    Pragmas applied to every SQLite connection, and the connection pool size.
+
+    The defaults are tuned for concurrent batch ingestion: WAL lets readers
+    run while a document is written, synchronous=NORMAL only syncs at WAL
+    checkpoints, and the busy timeout makes writers wait for each other
+    instead of failing with "database is locked".
+    """
+
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    cache_size_kib: int = 65536
+    mmap_size: int = 268435456
+    temp_store: str = "memory"
+    busy_timeout_ms: int = 5000
+    pool_size: int = 8
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any]) -> "SQLiteProfile":
+        """Create the profile from the `database.sqlite` section of config.yaml."""
+        return cls(**settings.get("database", {}).get("sqlite", {}))
+
+    def pragmas(self) -> list[str]:
+        """Return the PRAGMA statements to run on a new connection."""
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            # Negative values are KiB rather than pages
+            f"PRAGMA cache_size=-{self.cache_size_kib}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+        ]
+
+
+# SQLite's own defaults: rollback journal and a full sync on every commit
+DEFAULT_PROFILE = SQLiteProfile(
+    journal_mode="delete",
+    synchronous="full",
+    cache_size_kib=2000,
+    mmap_size=0,
+    temp_store="default",
+)
+PERFORMANCE_PROFILE = SQLiteProfile()
+
+
+def _backfill_invoice_dates(connection: Connection) -> None:
+    """Parse the dates of invoices stored before normalized_date existed."""
+    rows = connection.execute(
+        select(InvoiceExtraction.id, InvoiceExtraction.date),
+    )
+    updates = [
+        {"row_id": row.id, "normalized_date": parsed}
+        for row in rows
+        if (parsed := parse_date(row.date)) is not None
+    ]
+    if updates:
+        connection.execute(
+            update(InvoiceExtraction)
+            .where(InvoiceExtraction.id == bindparam("row_id"))
+            .values(normalized_date=bindparam("normalized_date")),
+            updates,
+        )
+    logger.info("Backfilled invoice dates", extra={"rows": len(updates)})
+
+
+# Run once when the column is added to a database created before it existed
+_BACKFILLS = {("invoice_extractions", "normalized_date"): _backfill_invoice_dates}
+
+
+def _upgrade_schema(connection: Connection) -> None:
+    """Add nullable columns and indexes that are missing from older databases."""
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}",
+                ),
+            )
+            logger.info(
+                "Added column",
+                extra={"table": table.name, "column": column.name},
+            )
+            if backfill := _BACKFILLS.get((table.name, column.name)):
+                backfill(connection)
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def init_database(db_path: str, profile: SQLiteProfile | None = None) -> None:
     """Initialize the database connection and create tables."""
     global _engine, _SessionLocal  # noqa: PLW0603
 
-    db_file = Path(db_path)
-    db_file.parent.mkdir(parents=True, exist_ok=True)
-
+    profile = profile or PERFORMANCE_PROFILE
+    if _engine is not None:
+        _engine.dispose()
+    pool_options: dict[str, Any]
+    if db_path == ":memory:":
+        # Every connection would open its own empty in-memory database
+        pool_options = {"poolclass": StaticPool}
+    else:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # One pooled connection per worker thread; overflow covers short bursts
+        pool_options = {
+            "poolclass": QueuePool,
+            "pool_size": profile.pool_size,
+            "max_overflow": profile.pool_size,
+        }
     _engine = create_engine(
         f"sqlite:///{db_path}",
         echo=False,
         connect_args={"check_same_thread": False},
+        **pool_options,
     )
 
+    pragmas = profile.pragmas()
+
+    @event.listens_for(_engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, _: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
     Base.metadata.create_all(bind=_engine)
+    with _engine.begin() as connection:
+        _upgrade_schema(connection)
+        create_search_index(connection)
     _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
 
-    logger.info("Database initialized", extra={"db_path": db_path})
+    logger.info(
+        "Database initialized",
+        extra={"db_path": db_path, "profile": asdict(profile)},
+    )
 
 
 def get_session() -> Session:
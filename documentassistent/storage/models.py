@@ -2,7 +2,18 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 from documentassistent.structure.pydantic_llm_calls.classification_call import (
@@ -22,6 +33,13 @@ class Document(Base):
     """Represents a processed document with metadata."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        Index(
+            "ix_documents_label_processed_at",
+            "classification_label",
+            "processed_at",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     original_path = Column(String, nullable=False)
@@ -62,12 +80,22 @@ class InvoiceExtraction(Base):
     """Represents extracted invoice information."""
 
     __tablename__ = "invoice_extractions"
+    __table_args__ = (
+        Index("ix_invoice_extractions_type_date", "type", "normalized_date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
+    document_id = Column(
+        Integer,
+        ForeignKey("documents.id"),
+        nullable=False,
+        index=True,
+    )
     type: Column[InvoiceTypeEnum] = Column(Enum(InvoiceTypeEnum), nullable=False)
     price = Column(Float, nullable=False)
     date = Column(String, nullable=False)
+    # date as the LLM extracted it, parsed when stored; None if unparseable
+    normalized_date = Column(Date, nullable=True)
     description = Column(Text, nullable=False)
     notes = Column(Text, nullable=True)
 
@@ -85,6 +113,7 @@ class InvoiceLog(Base):
         Integer,
         ForeignKey("invoice_extractions.id"),
         nullable=False,
+        index=True,
     )
     log = Column(Text, nullable=False)
     date = Column(String, nullable=False)
@@ -98,7 +127,12 @@ class NoteExtraction(Base):
     __tablename__ = "note_extractions"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
+    document_id = Column(
+        Integer,
+        ForeignKey("documents.id"),
+        nullable=False,
+        index=True,
+    )
     author = Column(String, nullable=True)
     date = Column(String, nullable=True)
     content = Column(Text, nullable=False)
@@ -117,6 +151,7 @@ class NoteTag(Base):
         Integer,
         ForeignKey("note_extractions.id"),
         nullable=False,
+        index=True,
     )
     tag = Column(String, nullable=False)
 
@@ -129,7 +164,12 @@ class ResultExtraction(Base):
     __tablename__ = "result_extractions"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
+    document_id = Column(
+        Integer,
+        ForeignKey("documents.id"),
+        nullable=False,
+        index=True,
+    )
     patient_name = Column(String, nullable=True)
     overall_notes = Column(Text, nullable=True)
 
@@ -147,6 +187,7 @@ class TestResult(Base):
         Integer,
         ForeignKey("result_extractions.id"),
         nullable=False,
+        index=True,
     )
     test_name = Column(String, nullable=False)
     value = Column(String, nullable=False)
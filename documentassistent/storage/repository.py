@@ -1,23 +1,38 @@
 """Repository for CRUD operations on document extractions."""
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from documentassistent.storage.base_repository import BaseRepository
-from documentassistent.storage.models import (
-    Document,
-    InvoiceExtraction,
-    InvoiceLog,
-    NoteExtraction,
-    NoteTag,
-    ResultExtraction,
-    TestResult,
+from documentassistent.storage.bulk_insert import DocumentRecord, insert_documents
+from documentassistent.storage.models import Document, InvoiceExtraction
+from documentassistent.storage.search import (
+    SearchHit,
+    rebuild_search_index,
+    search_documents,
+)
+from documentassistent.storage.unit_of_work import (
+    DocumentUnitOfWork,
+    FileMetadata,
+    document_row,
+    invoice_row,
+    note_row,
+    result_row,
+    unit_of_work,
 )
 from documentassistent.structure.pydantic_llm_calls.classification_call import (
     Classification,
+    DocumentType,
 )
 from documentassistent.structure.pydantic_llm_calls.invoice_call import (
     InvoiceExtraction as InvoiceExtractionPydantic,
 )
+from documentassistent.structure.pydantic_llm_calls.invoice_call import InvoiceTypeEnum
 from documentassistent.structure.pydantic_llm_calls.note_call import (
     NoteExtraction as NoteExtractionPydantic,
 )
@@ -32,16 +47,6 @@ logger = setup_logger(
 )
 
 
-@dataclass
-class FileMetadata:
-    """Metadata about a file being stored."""
-
-    path: str
-    hash: str
-    size: int
-    type: str
-
-
 class DocumentRepository(BaseRepository[Document]):
     """Repository for managing document storage operations."""
 
@@ -49,6 +54,10 @@ class DocumentRepository(BaseRepository[Document]):
         """Initialize DocumentRepository."""
         super().__init__(Document)
 
+    def unit_of_work(self) -> AbstractContextManager[DocumentUnitOfWork]:
+        """Start a transaction that stores one document and its extraction."""
+        return unit_of_work()
+
     def save_document(
         self,
         file_metadata: FileMetadata,
@@ -57,16 +66,7 @@ class DocumentRepository(BaseRepository[Document]):
     ) -> int:
         """Save document metadata and return the document ID."""
         with self._session() as session:
-            document = Document(
-                original_path=file_metadata.path,
-                file_hash=file_metadata.hash,
-                file_size=file_metadata.size,
-                file_type=file_metadata.type,
-                classification_label=classification.label,
-                classification_confidence_level=classification.confidence.level,
-                classification_confidence_explanation=classification.confidence.explanation,
-                text_content=text_content,
-            )
+            document = document_row(file_metadata, classification, text_content)
             session.add(document)
             session.flush()
             session.refresh(document)
@@ -80,6 +80,31 @@ class DocumentRepository(BaseRepository[Document]):
             )
             return doc_id
 
+    def save_many(
+        self,
+        records: Sequence[DocumentRecord | tuple[FileMetadata, Classification, Any]],
+        chunk_size: int = 500,
+    ) -> list[int]:
+        """
+        Insert many documents with their extractions and return their IDs.
+
+        Records are (metadata, classification, extraction[, text]) tuples.
+        Every table gets one executemany per chunk of chunk_size documents,
+        and each chunk is committed as one transaction. A failing chunk, e.g.
+        one with a file hash that is already stored, is rolled back and raised
+        as DatabaseError; earlier chunks stay committed.
+        """
+        document_ids: list[int] = []
+        for start in range(0, len(records), chunk_size):
+            chunk = [
+                DocumentRecord(*record)
+                for record in records[start : start + chunk_size]
+            ]
+            with self._session() as session:
+                document_ids.extend(insert_documents(session, chunk))
+        logger.info("Documents saved in bulk", extra={"count": len(document_ids)})
+        return document_ids
+
     def update_renamed_path(self, document_id: int, renamed_path: str) -> None:
         """Update the renamed path for a document."""
         updated = self.update_by_id(document_id, renamed_path=renamed_path)
@@ -96,24 +121,9 @@ class DocumentRepository(BaseRepository[Document]):
     ) -> None:
         """Save invoice extraction data."""
         with self._session() as session:
-            invoice = InvoiceExtraction(
-                document_id=document_id,
-                type=extraction.type,
-                price=extraction.price,
-                date=extraction.date,
-                description=extraction.description,
-                notes=extraction.notes,
-            )
+            invoice = invoice_row(extraction)
+            invoice.document_id = document_id  # type: ignore[assignment]
             session.add(invoice)
-            session.flush()
-
-            for log_entry in extraction.logs:
-                log = InvoiceLog(
-                    invoice_extraction_id=invoice.id,
-                    log=log_entry.log,
-                    date=log_entry.date,
-                )
-                session.add(log)
 
             logger.info(
                 "Invoice extraction saved",
@@ -127,22 +137,9 @@ class DocumentRepository(BaseRepository[Document]):
     ) -> None:
         """Save note extraction data."""
         with self._session() as session:
-            note = NoteExtraction(
-                document_id=document_id,
-                author=extraction.author,
-                date=extraction.date,
-                content=extraction.content,
-            )
+            note = note_row(extraction)
+            note.document_id = document_id  # type: ignore[assignment]
             session.add(note)
-            session.flush()
-
-            if extraction.tags:
-                for tag_value in extraction.tags:
-                    tag = NoteTag(
-                        note_extraction_id=note.id,
-                        tag=tag_value,
-                    )
-                    session.add(tag)
 
             logger.info("Note extraction saved", extra={"document_id": document_id})
 
@@ -153,25 +150,9 @@ class DocumentRepository(BaseRepository[Document]):
     ) -> None:
         """Save medical test result extraction data."""
         with self._session() as session:
-            result = ResultExtraction(
-                document_id=document_id,
-                patient_name=extraction.patient_name,
-                overall_notes=extraction.overall_notes,
-            )
+            result = result_row(extraction)
+            result.document_id = document_id  # type: ignore[assignment]
             session.add(result)
-            session.flush()
-
-            for test in extraction.test_results:
-                test_result = TestResult(
-                    result_extraction_id=result.id,
-                    test_name=test.test_name,
-                    value=test.value,
-                    unit=test.unit,
-                    reference_range=test.reference_range,
-                    date=test.date,
-                    notes=test.notes,
-                )
-                session.add(test_result)
 
             logger.info(
                 "Result extraction saved",
@@ -204,6 +185,96 @@ class DocumentRepository(BaseRepository[Document]):
             )
         return self.list_all(limit=limit, offset=offset)
 
+    def find_documents(
+        self,
+        classification_label: DocumentType,
+        processed_from: datetime | None = None,
+        processed_to: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[Document]:
+        """
+        List documents of one label processed in a time range, oldest first.
+
+        Uses the (classification_label, processed_at) index for the filter
+        and the order.
+        """
+        statement = select(Document).where(
+            Document.classification_label == classification_label,
+        )
+        if processed_from is not None:
+            statement = statement.where(Document.processed_at >= processed_from)
+        if processed_to is not None:
+            statement = statement.where(Document.processed_at < processed_to)
+        statement = statement.order_by(Document.processed_at).limit(limit)
+        with self._session_read_only() as session:
+            return list(session.scalars(statement))
+
+    def find_invoices(
+        self,
+        invoice_type: InvoiceTypeEnum | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        min_price: float | None = None,
+        limit: int | None = None,
+    ) -> list[InvoiceExtraction]:
+        """
+        List invoices by type, invoice date range and minimum price, by date.
+
+        Dates are inclusive and compared with the normalized date, so invoices
+        whose date could not be parsed only match without a date range. With
+        an invoice_type, the (type, normalized_date) index serves the date
+        range and the order. The invoice logs are loaded with the invoices.
+        """
+        statement = select(InvoiceExtraction).options(
+            selectinload(InvoiceExtraction.logs),
+        )
+        if invoice_type is not None:
+            statement = statement.where(InvoiceExtraction.type == invoice_type)
+        if date_from is not None:
+            statement = statement.where(InvoiceExtraction.normalized_date >= date_from)
+        if date_to is not None:
+            statement = statement.where(InvoiceExtraction.normalized_date <= date_to)
+        if min_price is not None:
+            statement = statement.where(InvoiceExtraction.price >= min_price)
+        statement = statement.order_by(InvoiceExtraction.normalized_date).limit(limit)
+        with self._session_read_only() as session:
+            return list(session.scalars(statement))
+
+    def invoices_in_tax_year(
+        self,
+        year: int,
+        invoice_type: InvoiceTypeEnum | None = None,
+        min_price: float | None = None,
+    ) -> list[InvoiceExtraction]:
+        """List the invoices dated in a calendar year, e.g. for a tax return."""
+        return self.find_invoices(
+            invoice_type=invoice_type,
+            date_from=date(year, 1, 1),
+            date_to=date(year, 12, 31),
+            min_price=min_price,
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        filters: dict[str, Any] | None = None,
+    ) -> list[SearchHit]:
+        """
+        Full-text search the document texts, best BM25 match first.
+
+        All words of the query must occur (Zahnarzt* matches word prefixes).
+        filters restrict the hits by document columns, e.g.
+        {"classification_label": DocumentType.INVOICE}.
+        """
+        with self._session_read_only() as session:
+            return search_documents(session, query, limit, filters)
+
+    def rebuild_search_index(self) -> None:
+        """Re-index the texts of all stored documents for full-text search."""
+        with self._session() as session:
+            rebuild_search_index(session)
+
     def count_documents(self, classification_label: str | None = None) -> int:
         """Count total documents, optionally filtered by classification."""
         if classification_label:
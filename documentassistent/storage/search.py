@@ -0,0 +1,216 @@
+"""
+Full-text search over the stored document texts with SQLite FTS5.
+
+    python -m documentassistent.storage.search "Zahnarzt 2024"
+    python -m documentassistent.storage.search --rebuild
+
+documents_fts is an external-content FTS5 table over documents.text_content:
+it stores only the index, and triggers keep it in sync with the documents
+table. --rebuild re-indexes all stored texts. Without FTS5 in the SQLite
+build there is no index: searches find nothing and --rebuild fails.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Connection, column, func, literal_column, select, table, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ColumnClause
+
+from documentassistent.exceptions import DatabaseError
+from documentassistent.storage.models import Document
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    DocumentType,
+)
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="DocumentSearch", log_file="logs/database.log")
+
+FTS_TABLE = "documents_fts"
+
+# remove_diacritics lets "Muller" find "Müller" and vice versa
+_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+        text_content,
+        content='documents',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS documents_fts_insert AFTER INSERT ON documents
+    BEGIN
+        INSERT INTO documents_fts(rowid, text_content)
+        VALUES (new.id, new.text_content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS documents_fts_delete AFTER DELETE ON documents
+    BEGIN
+        INSERT INTO documents_fts(documents_fts, rowid, text_content)
+        VALUES ('delete', old.id, old.text_content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS documents_fts_update
+    AFTER UPDATE OF text_content ON documents
+    BEGIN
+        INSERT INTO documents_fts(documents_fts, rowid, text_content)
+        VALUES ('delete', old.id, old.text_content);
+        INSERT INTO documents_fts(rowid, text_content)
+        VALUES (new.id, new.text_content);
+    END
+    """,
+]
+
+_fts = table(FTS_TABLE, column("rowid"))
+_fts_column: ColumnClause[Any] = literal_column(FTS_TABLE)
+# Words, optionally with a trailing * for prefix search
+_TERM = re.compile(r"\w+\*?")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A stored document matching a full-text query."""
+
+    document_id: int
+    classification_label: DocumentType
+    original_path: str
+    renamed_path: str | None
+    processed_at: datetime
+    snippet: str
+    rank: float
+
+
+def has_search_index(connection: Connection | Session) -> bool:
+    """Return True if the full-text index exists (False if SQLite has no FTS5)."""
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first()
+    return exists is not None
+
+
+def create_search_index(connection: Connection) -> None:
+    """
+    Create the FTS5 table and its triggers if they are missing.
+
+    A newly created index is filled from the documents already stored. If
+    this SQLite build has no FTS5, search is disabled with a warning.
+    """
+    exists = has_search_index(connection)
+    try:
+        for statement in _DDL:
+            connection.execute(text(statement))
+    except OperationalError:
+        logger.warning("SQLite has no FTS5, full-text search is disabled")
+        return
+    if not exists:
+        rebuild_search_index(connection)
+
+
+def rebuild_search_index(connection: Connection | Session) -> None:
+    """Re-index the texts of all stored documents."""
+    if not has_search_index(connection):
+        msg = "Full-text search is unavailable: this SQLite build has no FTS5"
+        raise DatabaseError(msg)
+    connection.execute(
+        text("INSERT INTO documents_fts(documents_fts) VALUES ('rebuild')"),
+    )
+    logger.info("Full-text index rebuilt")
+
+
+def fts_query(query: str) -> str:
+    """
+    Turn user input into an FTS5 query matching all of its words.
+
+    Each word is quoted, so punctuation and FTS5 operators in the input
+    cannot cause syntax errors; a trailing * keeps prefix search
+    (Zahnarzt* also finds Zahnarztpraxis).
+    """
+    terms = []
+    for term in _TERM.findall(query):
+        word = term.rstrip("*")
+        terms.append(f'"{word}"*' if term.endswith("*") else f'"{word}"')
+    return " ".join(terms)
+
+
+def search_documents(
+    session: Session,
+    query: str,
+    limit: int = 20,
+    filters: dict[str, Any] | None = None,
+) -> list[SearchHit]:
+    """
+    Return the documents matching query, best BM25 rank first.
+
+    Without the full-text index (SQLite without FTS5) nothing is found.
+    """
+    match = fts_query(query)
+    if not match:
+        return []
+    if not has_search_index(session):
+        logger.warning("Full-text search is unavailable, SQLite has no FTS5")
+        return []
+    statement = (
+        select(
+            Document.id,
+            Document.classification_label,
+            Document.original_path,
+            Document.renamed_path,
+            Document.processed_at,
+            func.snippet(_fts_column, 0, "[", "]", " … ", 12).label("snippet"),
+            func.bm25(_fts_column).label("rank"),
+        )
+        .select_from(_fts)
+        .join(Document, Document.id == _fts.c.rowid)
+        .where(_fts_column.match(match))
+        .filter_by(**(filters or {}))
+        .order_by(literal_column("rank"))
+        .limit(limit)
+    )
+    return [
+        SearchHit(
+            document_id=row.id,
+            classification_label=row.classification_label,
+            original_path=row.original_path,
+            renamed_path=row.renamed_path,
+            processed_at=row.processed_at,
+            snippet=row.snippet,
+            rank=row.rank,
+        )
+        for row in session.execute(statement)
+    ]
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from documentassistent.storage import (
+        DocumentRepository,
+        SQLiteProfile,
+        init_database,
+    )
+    from load_config import load_config
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("query", nargs="?", default="")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+
+    config = load_config("config.yaml")
+    init_database(config["database"]["path"], SQLiteProfile.from_settings(config))
+    repository = DocumentRepository()
+    if args.rebuild:
+        repository.rebuild_search_index()
+    for hit in repository.search(args.query, limit=args.limit):
+        sys.stdout.write(
+            f"{hit.document_id:>6}  {hit.classification_label.value:<8} "
+            f"{hit.renamed_path or hit.original_path}\n        {hit.snippet}\n",
+        )
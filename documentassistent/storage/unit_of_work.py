@@ -0,0 +1,180 @@
+"""Store a document, its extraction and its renamed path in one transaction."""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from documentassistent.exceptions import DatabaseError
+from documentassistent.storage.database import get_session
+from documentassistent.storage.models import (
+    Document,
+    InvoiceExtraction,
+    InvoiceLog,
+    NoteExtraction,
+    NoteTag,
+    ResultExtraction,
+    TestResult,
+)
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+)
+from documentassistent.structure.pydantic_llm_calls.invoice_call import (
+    InvoiceExtraction as InvoiceExtractionPydantic,
+)
+from documentassistent.structure.pydantic_llm_calls.note_call import (
+    NoteExtraction as NoteExtractionPydantic,
+)
+from documentassistent.structure.pydantic_llm_calls.result_call import (
+    ResultExtraction as ResultExtractionPydantic,
+)
+from documentassistent.utils.dates import parse_date
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="UnitOfWork", log_file="logs/database.log")
+
+Extraction = (
+    InvoiceExtractionPydantic | NoteExtractionPydantic | ResultExtractionPydantic
+)
+
+
+@dataclass
+class FileMetadata:
+    """Metadata about a file being stored."""
+
+    path: str
+    hash: str
+    size: int
+    type: str
+
+
+def document_row(
+    file_metadata: FileMetadata,
+    classification: Classification,
+    text_content: str | None = None,
+) -> Document:
+    """Build the documents row for a classified file."""
+    return Document(
+        original_path=file_metadata.path,
+        file_hash=file_metadata.hash,
+        file_size=file_metadata.size,
+        file_type=file_metadata.type,
+        classification_label=classification.label,
+        classification_confidence_level=classification.confidence.level,
+        classification_confidence_explanation=classification.confidence.explanation,
+        text_content=text_content,
+    )
+
+
+def invoice_row(extraction: InvoiceExtractionPydantic) -> InvoiceExtraction:
+    """Build the invoice_extractions row with its log rows."""
+    return InvoiceExtraction(
+        type=extraction.type,
+        price=extraction.price,
+        date=extraction.date,
+        normalized_date=parse_date(extraction.date),
+        description=extraction.description,
+        notes=extraction.notes,
+        logs=[InvoiceLog(log=entry.log, date=entry.date) for entry in extraction.logs],
+    )
+
+
+def note_row(extraction: NoteExtractionPydantic) -> NoteExtraction:
+    """Build the note_extractions row with its tag rows."""
+    return NoteExtraction(
+        author=extraction.author,
+        date=extraction.date,
+        content=extraction.content,
+        tags=[NoteTag(tag=tag) for tag in extraction.tags or []],
+    )
+
+
+def result_row(extraction: ResultExtractionPydantic) -> ResultExtraction:
+    """Build the result_extractions row with its test result rows."""
+    return ResultExtraction(
+        patient_name=extraction.patient_name,
+        overall_notes=extraction.overall_notes,
+        test_results=[
+            TestResult(
+                test_name=test.test_name,
+                value=test.value,
+                unit=test.unit,
+                reference_range=test.reference_range,
+                date=test.date,
+                notes=test.notes,
+            )
+            for test in extraction.test_results
+        ],
+    )
+
+
+class DocumentUnitOfWork:
+    """
+    Changes to one document that are committed together or not at all.
+
+    Rows are added to a single session; the document row is flushed once to
+    get its ID, everything else is written by the commit when the unit of
+    work ends.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_document_by_hash(self, file_hash: str) -> Document | None:
+        """Return the stored document with this file hash, if any."""
+        result: Document | None = (
+            self.session.query(Document).filter_by(file_hash=file_hash).first()
+        )
+        return result
+
+    def add_document(
+        self,
+        file_metadata: FileMetadata,
+        classification: Classification,
+        text_content: str | None = None,
+    ) -> Document:
+        """Add the document row and flush it, so its ID is known."""
+        document = document_row(file_metadata, classification, text_content)
+        self.session.add(document)
+        self.session.flush()
+        return document
+
+    def add_extraction(self, document: Document, extraction: Extraction) -> None:
+        """Attach the extraction and its child rows to the document."""
+        if isinstance(extraction, InvoiceExtractionPydantic):
+            document.invoice_extraction = invoice_row(extraction)
+        elif isinstance(extraction, NoteExtractionPydantic):
+            document.note_extraction = note_row(extraction)
+        else:
+            document.result_extraction = result_row(extraction)
+
+    def set_renamed_path(self, document: Document, renamed_path: str) -> None:
+        """Record the path the file is moved to."""
+        document.renamed_path = renamed_path  # type: ignore[assignment]
+
+
+@contextmanager
+def unit_of_work() -> Generator[DocumentUnitOfWork, None, None]:
+    """
+    Yield a unit of work and commit it when the block ends.
+
+    Any exception rolls the transaction back. Database errors are raised as
+    DatabaseError, other errors (e.g. from moving the file) are re-raised
+    unchanged.
+    """
+    session = get_session()
+    try:
+        yield DocumentUnitOfWork(session)
+        session.commit()
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.exception("Unit of work failed, rolling back")
+        error_msg = f"Database operation failed: {e!s}"
+        raise DatabaseError(error_msg) from e
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
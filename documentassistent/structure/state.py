@@ -13,9 +13,10 @@ from documentassistent.structure.pydantic_llm_calls.result_call import (
 
 
 class Document(BaseModel):
-    """Represents a document with content and optional metadata."""
+    """Represents a document with content, per-page text and optional metadata."""
 
     content: str
+    pages: list[str] = []
     metadata: dict | None = {}
 
 
@@ -28,7 +29,10 @@ class BaseWorkflowState(BaseModel):
     """Base state for all document processing workflows."""
 
     text: str
+    # Text as read, stored as the document's text_content; text may be normalized
+    original_text: str | None = None
     file_path: str | None = None
+    file_hash: str | None = None
     document_id: int | None = None
 
 
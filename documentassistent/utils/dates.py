@@ -0,0 +1,66 @@
+"""Parse the free-form dates the LLM extracts into calendar dates."""
+
+import re
+from datetime import date
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("januar", "jänner", "january", "jan"),
+            ("februar", "february", "feb"),
+            ("märz", "maerz", "march", "mär", "mar"),
+            ("april", "apr"),
+            ("mai", "may"),
+            ("juni", "june", "jun"),
+            ("juli", "july", "jul"),
+            ("august", "aug"),
+            ("september", "sept", "sep"),
+            ("oktober", "october", "okt", "oct"),
+            ("november", "nov"),
+            ("dezember", "december", "dez", "dec"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+
+_ISO = re.compile(r"(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})")
+# German order, day first: 01.05.2024, 1.5.24, 01/05/2024
+_DAY_FIRST = re.compile(r"(\d{1,2})[./-](\d{1,2})[./-](\d{4}|\d{2})(?!\d)")
+_DAY_MONTH_NAME = re.compile(r"(\d{1,2})\.?\s+([^\W\d_]+)\.?\s+(\d{4})")
+_MONTH_NAME_DAY = re.compile(r"([^\W\d_]+)\.?\s+(\d{1,2}),?\s+(\d{4})")
+_CENTURY = 100
+
+
+def _year(text: str) -> int:
+    """Return the year, reading two digits as 20xx."""
+    year = int(text)
+    return year + 2000 if year < _CENTURY else year
+
+
+def _date(year: int, month: int, day: int) -> date | None:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_date(text: str | None) -> date | None:
+    """
+    Return the first date found in text, or None.
+
+    Understands ISO dates, German day-first dates (01.05.2024, 1.5.24) and
+    dates with German or English month names (1. Mai 2024, May 1, 2024).
+    """
+    if not text:
+        return None
+    if match := _ISO.search(text):
+        return _date(int(match[1]), int(match[2]), int(match[3]))
+    if match := _DAY_FIRST.search(text):
+        return _date(_year(match[3]), int(match[2]), int(match[1]))
+    if (match := _DAY_MONTH_NAME.search(text)) and match[2].lower() in _MONTHS:
+        return _date(int(match[3]), _MONTHS[match[2].lower()], int(match[1]))
+    if (match := _MONTH_NAME_DAY.search(text)) and match[1].lower() in _MONTHS:
+        return _date(int(match[3]), _MONTHS[match[1].lower()], int(match[2]))
+    return None
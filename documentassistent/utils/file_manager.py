@@ -37,36 +37,33 @@ def sanitize_filename(text: str, max_length: int = 50) -> str:
     return sanitized or "unnamed"
 
 
-def rename_file_with_id(
+def renamed_file_path(
     original_path: str,
     document_id: int,
     doc_type: str,
     date: str,
     file_hash: str,
 ) -> str:
-    """Rename file following pattern: {id}_{type}_{date}_{hash}.ext."""
+    """Return the path following pattern: {id}_{type}_{date}_{hash}.ext."""
     path = Path(original_path)
-    extension = path.suffix
     short_hash = file_hash[:8]
     sanitized_date = sanitize_filename(date, max_length=10)
     sanitized_type = sanitize_filename(doc_type, max_length=15)
 
     new_filename = (
-        f"doc_{document_id}_{sanitized_type}_{sanitized_date}_{short_hash}{extension}"
+        f"doc_{document_id}_{sanitized_type}_{sanitized_date}_{short_hash}{path.suffix}"
     )
-    new_path = path.parent / new_filename
+    return str(path.parent / new_filename)
 
+
+def move_file(source: str, target: str, document_id: int) -> None:
+    """Move a document's file, raising FileWriteError on failure."""
     try:
-        shutil.move(str(path), str(new_path))
+        shutil.move(source, target)
         logger.info(
             "File renamed",
-            extra={
-                "original": str(path),
-                "new": str(new_path),
-                "document_id": document_id,
-            },
+            extra={"original": source, "new": target, "document_id": document_id},
         )
-        return str(new_path)
     except Exception as e:
         logger.exception(
             "Failed to rename file",
@@ -74,3 +71,16 @@ def rename_file_with_id(
         )
         error_msg = f"Failed to rename file for document {document_id}"
         raise FileWriteError(error_msg) from e
+
+
+def rename_file_with_id(
+    original_path: str,
+    document_id: int,
+    doc_type: str,
+    date: str,
+    file_hash: str,
+) -> str:
+    """Rename file following pattern: {id}_{type}_{date}_{hash}.ext."""
+    new_path = renamed_file_path(original_path, document_id, doc_type, date, file_hash)
+    move_file(original_path, new_path, document_id)
+    return new_path
@@ -1,3 +1,4 @@
+import inspect
 import os
 from collections.abc import Callable
 from functools import wraps
@@ -36,16 +37,27 @@ class LangfuseHandler:
     def trace(self) -> Callable[[Any], Any]:
         """Decorator to add Langfuse callback to LLM chain calls."""
 
+        def add_callback(kwargs: dict[str, Any]) -> None:
+            # Add Langfuse callback handler to config
+            if "config" not in kwargs:
+                kwargs["config"] = {}
+            if "callbacks" not in kwargs["config"]:
+                kwargs["config"]["callbacks"] = []
+            kwargs["config"]["callbacks"].append(self.handler)
+
         def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+            if inspect.iscoroutinefunction(func):
+
+                @wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    add_callback(kwargs)
+                    return await func(*args, **kwargs)
+
+                return async_wrapper
+
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
-                # Add Langfuse callback handler to config
-                if "config" not in kwargs:
-                    kwargs["config"] = {}
-                if "callbacks" not in kwargs["config"]:
-                    kwargs["config"]["callbacks"] = []
-                kwargs["config"]["callbacks"].append(self.handler)
-
+                add_callback(kwargs)
                 return func(*args, **kwargs)
 
             return wrapper
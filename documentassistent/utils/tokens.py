@@ -0,0 +1,47 @@
+"""Prompt token counting for LLM inputs."""
+
+import re
+from functools import cache
+from typing import Any
+
+from documentassistent.utils.logger import setup_logger
+
+logger = setup_logger(name="Tokens", log_file="logs/tokens.log")
+
+DEFAULT_ENCODING = "cl100k_base"
+ESTIMATE = "estimate"
+
+# Words and single punctuation marks, roughly what BPE tokenizers split on
+_PIECES = re.compile(r"\w+|[^\w\s]")
+# BPE splits long words; one token covers about four characters of a word
+_CHARS_PER_TOKEN = 4
+
+
+@cache
+def _encoding(name: str) -> Any:
+    """Load a tiktoken encoding once, or return None to fall back to estimating."""
+    if name == ESTIMATE:
+        return None
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(name)
+    except (ImportError, OSError, ValueError) as e:
+        # tiktoken downloads encodings on first use, which fails offline
+        logger.warning("Token encoding {} unavailable, estimating: {}", name, e)
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count from words and punctuation, without a tokenizer."""
+    return sum(
+        max(1, -(-len(piece) // _CHARS_PER_TOKEN)) for piece in _PIECES.findall(text)
+    )
+
+
+def count_tokens(text: str, encoding: str = DEFAULT_ENCODING) -> int:
+    """Return the number of tokens of text, estimated if encoding is unavailable."""
+    tokenizer = _encoding(encoding)
+    if tokenizer is None:
+        return estimate_tokens(text)
+    return len(tokenizer.encode(text, disallowed_special=()))
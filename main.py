@@ -1,10 +1,22 @@
+import time
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from documentassistent.input_engineering.input_reader import ImageReader, PDFReader
-from documentassistent.pipeline import create_pipeline
-from documentassistent.storage import init_database
+from documentassistent.agents.input_policy import InputPolicy
+from documentassistent.batch import BatchWorkers, process_directory
+from documentassistent.exceptions import UnsupportedFileTypeError
+from documentassistent.input_engineering.dedup_gate import DedupGate
+from documentassistent.input_engineering.reader_factory import (
+    create_extraction_cache,
+    create_image_reader,
+    create_ocr_pool,
+    create_reader_registry,
+)
+from documentassistent.input_engineering.reader_registry import ReaderRegistry
+from documentassistent.input_engineering.text_normalizer import TextNormalizer
+from documentassistent.pipeline import classify_while_reading, create_pipeline
+from documentassistent.storage import SQLiteProfile, init_database
 from documentassistent.structure.state import ClassificationState
 from documentassistent.utils.logger import setup_logger
 from load_config import load_config
@@ -15,26 +27,54 @@ logger = setup_logger(name="MyApp", log_file="logs/app.log")
 CONFIG = load_config("config.yaml")
 
 
-def main(path: Path) -> None:
+def main(
+    path: Path,
+    dedup_gate: DedupGate | None = None,
+    readers: ReaderRegistry | None = None,
+    normalizer: TextNormalizer | None = None,
+) -> int | None:
     """Process a file from the given Path using LLM based on its type (PDF or image)."""
-    if path.suffix.lower() in [".pdf"]:
-        reader_pdf = PDFReader()
-        text = reader_pdf.read(str(path)).content
-        logger.info("PDF file processed, {}", path)
-    elif path.suffix.lower() in [".png", ".jpg", ".jpeg"]:
-        reader_image = ImageReader()
-        text = reader_image.read(str(path)).content
-        logger.info("Image file processed, {}", path)
-    else:
-        logger.error("Unsupported file type, {}", path.suffix)
-        return
+    gate = dedup_gate or DedupGate()
+    dedup = gate.check(str(path))
+    if dedup.is_duplicate:
+        return dedup.document_id
+
+    start = time.perf_counter()
+    normalizer = normalizer or TextNormalizer.from_settings(CONFIG)
+    max_pages = InputPolicy.from_settings(CONFIG, "classification").max_pages
+    pipeline = create_pipeline()
+    classification = None
+    try:
+        readers = readers or create_reader_registry(
+            CONFIG,
+            create_extraction_cache(CONFIG),
+        )
+        if max_pages is None:
+            document = readers.read(str(path))
+        else:
+            with readers.stream(str(path)) as pages:
+                # The first step of the pipeline classifies
+                document, classification = classify_while_reading(
+                    pipeline.first,
+                    pages,
+                    max_pages,
+                    normalizer,
+                )
+    except UnsupportedFileTypeError:
+        logger.exception("Unsupported file type, {}", path)
+        return None
+    logger.info("File processed, {}", path)
+    text = normalizer.normalize(document).text if normalizer else document.content
 
     state = ClassificationState(
         text=text,
+        original_text=document.content,
         file_path=str(path.absolute()),
+        file_hash=dedup.file_hash,
+        classification_result=classification,
     )
-    pipeline = create_pipeline()
     result = pipeline.invoke(state)
+    gate.record_processed(time.perf_counter() - start)
     logger.debug("Final state after processing: {}", result)
 
     if hasattr(result, "document_id") and result.document_id:
@@ -43,14 +83,43 @@ def main(path: Path) -> None:
             result.document_id,
             str(path),
         )
+    return getattr(result, "document_id", None)
 
 
 if __name__ == "__main__":
-    init_database(CONFIG["database"]["path"])
-
-    path_pdfs = list(Path("data/pdfs/").glob("*.pdf"))
-    paths_pictures = list(Path("data/Pictures/").glob("*.jpg"))
-
-    main(path=path_pdfs[0])
+    init_database(
+        CONFIG["database"]["path"],
+        SQLiteProfile.from_settings(CONFIG),
+    )
 
-    main(path=paths_pictures[0])
+    cache = create_extraction_cache(CONFIG)
+    registry = create_reader_registry(CONFIG, cache)
+    paths = []
+    for directory in (CONFIG["paths"]["pdfs_dir"], CONFIG["paths"]["pictures_dir"]):
+        for path in sorted(Path(directory).iterdir()):
+            if not path.is_file():
+                continue
+            if registry.supports(path):
+                paths.append(path)
+            else:
+                logger.warning("Skipping unsupported file {}", path)
+    batch_config = CONFIG.get("batch", {})
+    workers = BatchWorkers(
+        readers=batch_config.get("read_workers") or BatchWorkers().readers,
+        llm=batch_config.get("llm_workers", BatchWorkers.llm),
+        queue_size=batch_config.get("queue_size", BatchWorkers.queue_size),
+    )
+    ocr_pool = create_ocr_pool(CONFIG)
+    try:
+        process_directory(
+            paths,
+            workers=workers,
+            readers=registry,
+            image_reader=(
+                create_image_reader(CONFIG, cache, ocr_pool) if ocr_pool else None
+            ),
+            normalizer=TextNormalizer.from_settings(CONFIG),
+        )
+    finally:
+        if ocr_pool is not None:
+            ocr_pool.close()
@@ -1,4 +1,5 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 from documentassistent.agents.classification_agent import ClassificationAgent
 from documentassistent.prompts.prompt_collection import CATEGORISATION_PROMPT
@@ -31,3 +32,38 @@ def test_classification_agent_basic() -> None:
     assert isinstance(result, State)
     assert isinstance(result.classification_result, Classification)
     assert result.classification_result.label == DocumentType.INVOICE
+
+
+def test_classification_agent_aclassify() -> None:
+    mock_llm = Mock()
+    mock_llm.acall = AsyncMock(
+        return_value=Classification(
+            label=DocumentType.NOTE,
+            confidence=Confidence(level=ConfidenceLevel.MEDIUM, explanation="Note"),
+        ),
+    )
+    agent = ClassificationAgent(llm=mock_llm)
+
+    result = asyncio.run(agent.aclassify(State(text="Remember to call Dr. Smith.")))
+
+    mock_llm.acall.assert_awaited_once()
+    mock_llm.call.assert_not_called()
+    assert result.classification_result is not None
+    assert result.classification_result.label == DocumentType.NOTE
+
+
+def test_classification_agent_keeps_an_earlier_classification() -> None:
+    mock_llm = Mock()
+    classification = Classification(
+        label=DocumentType.NOTE,
+        confidence=Confidence(level=ConfidenceLevel.HIGH, explanation="Note"),
+    )
+    state = State(
+        text="Remember to call Dr. Smith.",
+        classification_result=classification,
+    )
+
+    result = ClassificationAgent(llm=mock_llm).classify(state)
+
+    mock_llm.call.assert_not_called()
+    assert result.classification_result == classification
@@ -0,0 +1,81 @@
+from unittest.mock import Mock
+
+from documentassistent.agents.classification_agent import ClassificationAgent
+from documentassistent.agents.input_policy import (
+    EXCERPT,
+    FULL,
+    GAP,
+    InputPolicy,
+)
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.state import State
+from documentassistent.utils.tokens import ESTIMATE, count_tokens
+
+BUDGET = 60
+
+
+def _long_document() -> str:
+    filler = [f"Position {i} Beratung und Leistung laut Vertrag" for i in range(200)]
+    filler[120] = "Gesamtbetrag 1.234,56 EUR inkl. MwSt"
+    return "\n".join(["Praxis Dr. Schmidt", "Rechnung Nr. 17", *filler, "Vielen Dank"])
+
+
+def _policy(mode: str = EXCERPT) -> InputPolicy:
+    return InputPolicy(mode=mode, max_tokens=BUDGET, encoding=ESTIMATE)
+
+
+def test_excerpt_keeps_start_end_and_keyword_lines_within_budget() -> None:
+    text = _long_document()
+
+    excerpt = _policy().apply(text)
+
+    assert excerpt.startswith("Praxis Dr. Schmidt\nRechnung Nr. 17")
+    assert excerpt.endswith("Vielen Dank")
+    assert "Gesamtbetrag 1.234,56 EUR inkl. MwSt" in excerpt
+    assert GAP in excerpt
+    content = excerpt.replace(GAP, "")
+    assert count_tokens(content, ESTIMATE) <= BUDGET
+
+
+def test_short_texts_and_full_mode_are_unchanged() -> None:
+    assert _policy().apply("Rechnung 12,00 EUR") == "Rechnung 12,00 EUR"
+    assert _policy(FULL).apply(_long_document()) == _long_document()
+
+
+def test_overlong_single_line_is_cut() -> None:
+    excerpt = _policy().apply("Rechnung " * 500)
+
+    assert excerpt.startswith("Rechnung")
+    assert len(excerpt) < len("Rechnung " * 500) // 2
+
+
+def test_from_settings_per_agent() -> None:
+    settings = {"input_policy": {"classification": {"mode": EXCERPT, "max_tokens": 5}}}
+
+    assert InputPolicy.from_settings(settings, "classification").max_tokens == len(
+        "12345",
+    )
+    assert InputPolicy.from_settings(settings, "invoice").mode == FULL
+
+
+def test_classification_sends_excerpt_but_keeps_full_text() -> None:
+    llm = Mock()
+    llm.call.return_value = Classification(
+        label=DocumentType.INVOICE,
+        confidence=Confidence(level=ConfidenceLevel.HIGH, explanation="Rechnung"),
+    )
+    agent = ClassificationAgent(llm=llm, input_policy=_policy())
+    text = _long_document()
+
+    result = agent.classify(State(text=text))
+
+    sent = llm.call.call_args.args[0]
+    assert len(sent.text) < len(text)
+    assert result.text == text
@@ -0,0 +1,102 @@
+from unittest.mock import Mock
+
+from documentassistent.agents.classification_agent import ClassificationAgent
+from documentassistent.agents.rule_classifier import (
+    RuleBasedClassifier,
+    llm_labelled,
+)
+from documentassistent.storage.models import Document
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import ConfidenceLevel
+from documentassistent.structure.state import State
+
+INVOICE_TEXT = (
+    "Praxis Dr. Müller\nRechnung Nr. 2024-117 vom 12.03.2024\n"
+    "Behandlung 45,00 EUR\nSumme: 45,00 EUR\nIBAN DE02 1234 5678"
+)
+RESULT_TEXT = (
+    "Laborbefund vom 02.02.2024\nHämoglobin 14,1 g/dl Referenzbereich 12-16\n"
+    "Cholesterin 190 mg/dl"
+)
+
+
+def test_clear_invoice_is_decided_with_high_confidence() -> None:
+    result = RuleBasedClassifier().predict(INVOICE_TEXT)
+
+    assert result is not None
+    assert result.label == DocumentType.INVOICE
+    assert result.confidence.level == ConfidenceLevel.HIGH
+
+
+def test_clear_lab_result_is_decided() -> None:
+    result = RuleBasedClassifier().predict(RESULT_TEXT)
+
+    assert result is not None
+    assert result.label == DocumentType.RESULT
+
+
+def test_ambiguous_text_defers_to_llm() -> None:
+    classifier = RuleBasedClassifier()
+
+    assert classifier.predict("Call Dr. Smith about the appointment.") is None
+    # Both an invoice and a lab result: no clear winner
+    assert classifier.predict(INVOICE_TEXT + "\n" + RESULT_TEXT) is None
+
+
+def test_agent_skips_llm_on_fast_path_and_counts_avoided_calls() -> None:
+    mock_llm = Mock()
+    classifier = RuleBasedClassifier()
+    agent = ClassificationAgent(llm=mock_llm, pre_classifier=classifier)
+
+    fast = agent.classify(State(text=INVOICE_TEXT))
+    agent.classify(State(text="Call Dr. Smith."))
+
+    assert fast.classification_result is not None
+    assert fast.classification_result.label == DocumentType.INVOICE
+    mock_llm.call.assert_called_once()
+    assert (classifier.stats.attempts, classifier.stats.decided) == (2, 1)
+    assert classifier.stats.llm_calls_avoided == classifier.stats.decided / 2
+
+
+def test_evaluate_reports_coverage_and_agreement() -> None:
+    report = RuleBasedClassifier().evaluate(
+        [
+            (INVOICE_TEXT, DocumentType.INVOICE),
+            (RESULT_TEXT, DocumentType.NOTE),
+            ("Call Dr. Smith.", DocumentType.NOTE),
+        ],
+    )
+
+    assert (report.total, report.decided, report.agreed) == (3, 2, 1)
+    assert report.coverage == report.decided / report.total
+    assert report.agreement == report.agreed / report.decided
+
+
+def test_fast_path_labels_are_not_used_for_evaluation() -> None:
+    fast_path = RuleBasedClassifier().predict(INVOICE_TEXT)
+    assert fast_path is not None
+    documents = [
+        Document(
+            text_content=INVOICE_TEXT,
+            classification_label=DocumentType.INVOICE,
+            classification_confidence_explanation=fast_path.confidence.explanation,
+        ),
+        Document(
+            text_content=RESULT_TEXT,
+            classification_label=DocumentType.RESULT,
+            classification_confidence_explanation="Reference ranges and lab values",
+        ),
+    ]
+
+    assert list(llm_labelled(documents)) == [(RESULT_TEXT, DocumentType.RESULT)]
+
+
+def test_from_settings_respects_enabled_flag() -> None:
+    assert RuleBasedClassifier.from_settings({}) is None
+    classifier = RuleBasedClassifier.from_settings(
+        {"classification": {"fast_path": {"enabled": True, "margin": 1.0}}},
+    )
+    assert classifier is not None
+    assert classifier.margin == 1.0
@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from documentassistent.agents import storage_agent
+from documentassistent.agents.storage_agent import StorageAgent
+from documentassistent.exceptions import DatabaseError, FileWriteError
+from documentassistent.storage import get_session, init_database
+from documentassistent.storage.models import Document, InvoiceLog
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.pydantic_llm_calls.invoice_call import (
+    InvoiceExtraction,
+    InvoiceTypeEnum,
+    Logs,
+)
+from documentassistent.structure.state import InvoiceExtractionState
+
+
+@pytest.fixture
+def invoice_state(tmp_path: Path) -> InvoiceExtractionState:
+    init_database(str(tmp_path / "documents.db"))
+    path = tmp_path / "scan.pdf"
+    path.write_bytes(b"%PDF-1.4 invoice")
+    return InvoiceExtractionState(
+        text="Rechnung",
+        file_path=str(path),
+        classification_result=Classification(
+            label=DocumentType.INVOICE,
+            confidence=Confidence(level=ConfidenceLevel.HIGH, explanation="test"),
+        ),
+        invoice_extraction_result=InvoiceExtraction(
+            type=InvoiceTypeEnum.DOCTOR_RECEIPT,
+            price=42.0,
+            date="2024-05-01",
+            description="Behandlung",
+            notes=None,
+            logs=[Logs(log="bezahlt", date="2024-05-02")],
+        ),
+    )
+
+
+def _counts() -> tuple[int, int]:
+    session = get_session()
+    try:
+        return session.query(Document).count(), session.query(InvoiceLog).count()
+    finally:
+        session.close()
+
+
+def test_document_extraction_and_path_are_stored_together(
+    invoice_state: InvoiceExtractionState,
+) -> None:
+    result = StorageAgent().store_results(invoice_state)
+
+    document = StorageAgent().repository.get_document_by_id(result.document_id or 0)
+    assert document is not None
+    assert Path(str(document.renamed_path)).name.startswith(
+        f"doc_{result.document_id}_receipt_from_do_2024-05-01_",
+    )
+    assert Path(str(document.renamed_path)).exists()
+    assert not Path(str(invoice_state.file_path)).exists()
+    assert _counts() == (1, 1)
+
+
+def test_known_hash_returns_the_stored_document(
+    invoice_state: InvoiceExtractionState,
+) -> None:
+    first = StorageAgent().store_results(invoice_state)
+    copy = Path(str(invoice_state.file_path))
+    copy.write_bytes(b"%PDF-1.4 invoice")
+
+    second = StorageAgent().store_results(invoice_state)
+
+    assert second.document_id == first.document_id
+    assert copy.exists()
+    assert _counts() == (1, 1)
+
+
+def test_failed_move_stores_nothing(
+    invoice_state: InvoiceExtractionState,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(*_: object) -> None:
+        raise FileWriteError
+
+    monkeypatch.setattr(storage_agent, "move_file", fail)
+
+    with pytest.raises(FileWriteError):
+        StorageAgent().store_results(invoice_state)
+
+    assert _counts() == (0, 0)
+
+
+def test_failed_commit_moves_the_file_back(
+    invoice_state: InvoiceExtractionState,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(*_: object) -> None:
+        statement, msg = "COMMIT", "disk I/O error"
+        raise OperationalError(statement, {}, Exception(msg))
+
+    monkeypatch.setattr(Session, "commit", fail)
+
+    with pytest.raises(DatabaseError):
+        StorageAgent().store_results(invoice_state)
+
+    monkeypatch.undo()
+    assert Path(str(invoice_state.file_path)).exists()
+    assert _counts() == (0, 0)
+
+
+def test_original_text_is_stored_instead_of_normalized_text(
+    invoice_state: InvoiceExtractionState,
+) -> None:
+    state = invoice_state.model_copy(
+        update={"text": "Rechnung", "original_text": "Rechnung\n\nMenge\n3"},
+    )
+
+    result = StorageAgent().store_results(state)
+
+    document = StorageAgent().repository.get_document_by_id(result.document_id or 0)
+    assert document is not None
+    assert document.text_content == "Rechnung\n\nMenge\n3"
@@ -0,0 +1,47 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+from documentassistent.input_engineering.dedup_gate import DedupGate
+from documentassistent.utils.file_manager import compute_file_hash
+
+STORED_ID = 7
+
+
+def test_dedup_gate_skips_stored_file(tmp_path: Path) -> None:
+    file_path = tmp_path / "receipt.pdf"
+    file_path.write_bytes(b"%PDF-1.4 stored")
+    repository = Mock()
+    repository.get_document_by_hash.return_value = Mock(id=STORED_ID)
+    gate = DedupGate(repository=repository)
+
+    result = gate.check(str(file_path))
+
+    assert result.is_duplicate
+    assert result.document_id == STORED_ID
+    assert result.file_hash == compute_file_hash(str(file_path))
+    assert gate.stats.skipped == 1
+
+
+def test_dedup_gate_passes_new_file(tmp_path: Path) -> None:
+    file_path = tmp_path / "new.pdf"
+    file_path.write_bytes(b"%PDF-1.4 new")
+    repository = Mock()
+    repository.get_document_by_hash.return_value = None
+    gate = DedupGate(repository=repository)
+
+    result = gate.check(str(file_path))
+
+    assert not result.is_duplicate
+    assert gate.stats.checked == 1
+    assert gate.stats.skipped == 0
+
+
+def test_dedup_stats_estimate_time_saved() -> None:
+    gate = DedupGate(repository=Mock())
+    gate.stats.checked = 4
+    gate.stats.skipped = 2
+    gate.record_processed(10.0)
+    gate.record_processed(20.0)
+
+    assert gate.stats.average_processing_seconds == 15.0  # noqa: PLR2004
+    assert gate.stats.estimated_seconds_saved == 30.0  # noqa: PLR2004
@@ -0,0 +1,112 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from documentassistent.input_engineering.extraction_cache import ExtractionCache
+from documentassistent.input_engineering.input_reader import ImageReader
+from documentassistent.input_engineering.ocr_engine import PytesseractEngine
+from documentassistent.structure.state import Document
+
+READS = 2
+
+
+def test_key_depends_on_reader_settings() -> None:
+    file_hash = "a" * 64
+    assert ExtractionCache.key(file_hash, {"lang": "deu"}) != ExtractionCache.key(
+        file_hash,
+        {"lang": "eng"},
+    )
+    assert ExtractionCache.key(file_hash, {"a": 1, "b": 2}) == ExtractionCache.key(
+        file_hash,
+        {"b": 2, "a": 1},
+    )
+
+
+def test_get_returns_stored_document(tmp_path: Path) -> None:
+    cache = ExtractionCache(directory=str(tmp_path))
+    document = Document(content="Rechnung", pages=["Rechnung"], metadata={"x": 1})
+
+    assert cache.get("missing") is None
+    cache.put("key-1", document)
+
+    assert cache.get("key-1") == document
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = ExtractionCache(directory=str(tmp_path), max_bytes=10**6)
+    for index in range(3):
+        cache.put(f"key-{index}", Document(content="x" * 400))
+        entry = next(tmp_path.glob(f"*/key-{index}.json"))
+        os.utime(entry, (1000 + index, 1000 + index))
+    cache.get("key-0")  # now the most recently used
+
+    entry_size = cache.size() // 3
+    cache.max_bytes = 2 * entry_size
+    assert cache.evict() == 1
+
+    assert cache.get("key-1") is None
+    assert cache.get("key-0") is not None
+    assert cache.get("key-2") is not None
+
+
+def test_put_scans_the_directory_only_past_max_bytes(tmp_path: Path) -> None:
+    cache = ExtractionCache(directory=str(tmp_path), max_bytes=10**6)
+
+    with patch.object(cache, "_entries", wraps=cache._entries) as entries:  # noqa: SLF001
+        for index in range(10):
+            cache.put(f"key-{index}", Document(content="x" * 400))
+        assert entries.call_count == 1
+
+        cache.max_bytes = cache.size()
+        entries.reset_mock()
+        cache.put("key-10", Document(content="x" * 400))
+        assert entries.call_count == 1
+
+    assert cache.size() <= cache.max_bytes
+
+
+def test_unreadable_entry_is_dropped_as_a_miss(tmp_path: Path) -> None:
+    cache = ExtractionCache(directory=str(tmp_path))
+    cache.put("key-1", Document(content="Rechnung"))
+    entry = next(tmp_path.glob("*/key-1.json"))
+    entry.write_text("{not json", encoding="utf-8")
+
+    assert cache.get("key-1") is None
+    assert not entry.exists()
+
+
+def test_image_reader_runs_ocr_once_per_content(tmp_path: Path) -> None:
+    photo = tmp_path / "receipt.jpg"
+    photo.write_bytes(b"fake image bytes")
+    copy = tmp_path / "renamed.jpg"
+    copy.write_bytes(photo.read_bytes())
+    reader = ImageReader(cache=ExtractionCache(directory=str(tmp_path / "cache")))
+
+    with (
+        patch("PIL.Image.open", return_value=MagicMock(n_frames=1)),
+        patch("pytesseract.image_to_string", return_value="Quittung") as ocr,
+        patch.object(PytesseractEngine, "version", return_value="5.3.0"),
+    ):
+        first = reader.read(str(photo))
+        second = reader.read(str(copy))
+
+    ocr.assert_called_once()
+    assert second.content == first.content == "Quittung"
+    assert second.metadata is not None
+    assert second.metadata["source"] == str(copy)
+
+
+def test_empty_output_is_not_cached(tmp_path: Path) -> None:
+    photo = tmp_path / "blank.jpg"
+    photo.write_bytes(b"blank")
+    reader = ImageReader(cache=ExtractionCache(directory=str(tmp_path / "cache")))
+
+    with (
+        patch("PIL.Image.open", return_value=MagicMock(n_frames=1)),
+        patch("pytesseract.image_to_string", return_value="  ") as ocr,
+        patch.object(PytesseractEngine, "version", return_value="5.3.0"),
+    ):
+        for _ in range(READS):
+            reader.read(str(photo))
+
+    assert ocr.call_count == READS
@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.synthetic import statement_page, write_text_pdf
+from documentassistent.input_engineering.extraction_cache import ExtractionCache
+from documentassistent.input_engineering.hybrid_pdf_reader import (
+    HybridPDFReader,
+    has_text_layer,
+)
+from documentassistent.input_engineering.ocr_engine import engine_fingerprint
+
+OCR_TEXT = "Laborbefund vom 02.02.2024, Hämoglobin 14,1 g/dl"
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path: Path) -> Path:
+    """Two text pages around a page without a text layer."""
+    return write_text_pdf(
+        tmp_path / "mixed.pdf",
+        [statement_page(1, lines=3), [], statement_page(3, lines=3)],
+    )
+
+
+def test_has_text_layer_rejects_empty_and_garbage() -> None:
+    assert not has_text_layer("")
+    assert not has_text_layer("  \n ")
+    assert not has_text_layer("(cid:3)(cid:17)" * 20)
+    assert not has_text_layer("■□▪▫●◦" * 10)
+    assert has_text_layer("Rechnung Nr. 2024-117 vom 12.03.2024, Summe 45,00 EUR")
+
+
+def test_only_pages_without_text_layer_are_ocred(mixed_pdf: Path) -> None:
+    with patch(
+        "documentassistent.input_engineering.hybrid_pdf_reader._ocr_images",
+        return_value=OCR_TEXT,
+    ) as ocr:
+        document = HybridPDFReader().read(str(mixed_pdf))
+
+    ocr.assert_called_once()
+    assert document.pages[1] == OCR_TEXT
+    assert document.pages[0].startswith("Kontoauszug Seite 1")
+    assert document.content == "".join(document.pages)
+    assert document.metadata is not None
+    assert [page["method"] for page in document.metadata["pages"]] == [
+        "text",
+        "ocr",
+        "text",
+    ]
+
+
+def test_failed_ocr_marks_page_empty(mixed_pdf: Path) -> None:
+    with patch(
+        "documentassistent.input_engineering.hybrid_pdf_reader._ocr_images",
+        side_effect=OSError("tesseract is not installed"),
+    ):
+        document = HybridPDFReader().read(str(mixed_pdf))
+
+    assert document.pages[1] == ""
+    assert document.metadata is not None
+    assert document.metadata["pages"][1]["method"] == "empty"
+    assert document.metadata["ocr_pages"] == 0
+
+
+def test_iter_pages_ocrs_lazily(mixed_pdf: Path) -> None:
+    with patch(
+        "documentassistent.input_engineering.hybrid_pdf_reader._ocr_images",
+        return_value=OCR_TEXT,
+    ) as ocr:
+        pages = HybridPDFReader().iter_pages(str(mixed_pdf))
+        next(pages)
+        ocr.assert_not_called()
+        assert next(pages) == OCR_TEXT
+
+
+def test_text_pdf_is_cached_without_an_ocr_engine(tmp_path: Path) -> None:
+    pdf = write_text_pdf(tmp_path / "text.pdf", [statement_page(1, lines=3)])
+    reader = HybridPDFReader(
+        ocr_engine="tesserocr",
+        cache=ExtractionCache(directory=str(tmp_path / "cache")),
+    )
+    engine_fingerprint.cache_clear()
+
+    with patch.dict(sys.modules, {"tesserocr": None}):
+        first = reader.read(str(pdf))
+        second = reader.read(str(pdf))
+    engine_fingerprint.cache_clear()
+
+    assert second.content == first.content
+    assert first.content.startswith("Kontoauszug Seite 1")
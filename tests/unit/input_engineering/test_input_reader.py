@@ -1,6 +1,15 @@
+from collections.abc import Iterator
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from documentassistent.input_engineering.input_reader import ImageReader, PDFReader
+from benchmarks.synthetic import write_text_pdf
+from documentassistent.input_engineering.extraction_cache import ExtractionCache
+from documentassistent.input_engineering.input_reader import (
+    ImageReader,
+    PageStream,
+    PDFReader,
+    split_page_range,
+)
 from documentassistent.structure.state import Document
 
 
@@ -38,3 +47,67 @@ def test_image_reader_reads_image() -> None:
     assert doc.content == "Image text"
     assert doc.metadata is not None
     assert doc.metadata["type"] == "image"
+
+
+def test_split_page_range_covers_all_pages_in_order() -> None:
+    assert split_page_range(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert split_page_range(2, 8) == [(0, 1), (1, 2)]
+
+
+def test_pdf_reader_parallel_keeps_page_order(tmp_path: Path) -> None:
+    pdf = write_text_pdf(
+        tmp_path / "statement.pdf",
+        [[f"Seite {number}"] for number in range(7)],
+    )
+
+    serial = PDFReader().read(str(pdf))
+    parallel = PDFReader(workers=2, parallel_min_pages=1).read(str(pdf))
+
+    assert parallel.pages == serial.pages
+    assert [page.strip() for page in parallel.pages] == [
+        f"Seite {number}" for number in range(7)
+    ]
+    assert parallel.content == "".join(parallel.pages)
+    assert parallel.metadata is not None
+    assert parallel.metadata["page_count"] == len(parallel.pages)
+
+
+def test_pdf_iter_pages_is_lazy_and_page_stream_stops_early(tmp_path: Path) -> None:
+    pdf = write_text_pdf(
+        tmp_path / "scan.pdf",
+        [[f"Seite {number}"] for number in range(5)],
+    )
+    extracted: list[str] = []
+
+    def record(pages: Iterator[str]) -> Iterator[str]:
+        for page in pages:
+            extracted.append(page)
+            yield page
+
+    with PageStream(record(PDFReader().iter_pages(str(pdf)))) as stream:
+        head = stream.head(2)
+        assert [page.strip() for page in head] == ["Seite 0", "Seite 1"]
+        assert len(extracted) == len(head)
+
+        assert stream.text() == PDFReader().read(str(pdf)).content
+        assert stream.exhausted
+
+
+def test_pdf_iter_pages_caches_a_fully_read_stream(tmp_path: Path) -> None:
+    pdf = write_text_pdf(
+        tmp_path / "letter.pdf",
+        [[f"Seite {number}"] for number in range(3)],
+    )
+    reader = PDFReader(cache=ExtractionCache(directory=str(tmp_path / "cache")))
+
+    with PageStream(reader.iter_pages(str(pdf))) as stream:
+        stream.head(1)
+    assert reader.cache is not None
+    assert reader.cache.size() == 0
+
+    pages = list(reader.iter_pages(str(pdf)))
+    with patch.object(PDFReader, "_iter_pages") as extract:
+        cached = list(reader.iter_pages(str(pdf)))
+
+    extract.assert_not_called()
+    assert cached == pages
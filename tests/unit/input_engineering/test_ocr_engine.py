@@ -0,0 +1,87 @@
+import io
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+from documentassistent.exceptions import ConfigurationError
+from documentassistent.input_engineering.input_reader import ImageReader
+from documentassistent.input_engineering.ocr_engine import (
+    PytesseractEngine,
+    engine_fingerprint,
+    get_engine,
+    recognize_image_bytes,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_engines() -> Iterator[None]:
+    """Engines are cached per process; isolate each test."""
+    get_engine.cache_clear()
+    engine_fingerprint.cache_clear()
+    yield
+    get_engine.cache_clear()
+    engine_fingerprint.cache_clear()
+
+
+def _tiff_bytes(frames: int) -> bytes:
+    images = [Image.new("L", (40, 20), color=index * 40) for index in range(frames)]
+    buffer = io.BytesIO()
+    images[0].save(buffer, format="TIFF", save_all=True, append_images=images[1:])
+    return buffer.getvalue()
+
+
+def test_auto_falls_back_to_pytesseract_and_is_reused() -> None:
+    with patch.dict(sys.modules, {"tesserocr": None}):
+        engine = get_engine("auto", "deu")
+
+        assert isinstance(engine, PytesseractEngine)
+        assert engine.lang == "deu"
+        assert get_engine("auto", "deu") is engine
+
+
+def test_fingerprint_asks_for_the_version_once() -> None:
+    with (
+        patch.dict(sys.modules, {"tesserocr": None}),
+        patch.object(PytesseractEngine, "version", return_value="5.3.0") as version,
+    ):
+        fingerprints = {engine_fingerprint("auto", "deu") for _ in range(3)}
+
+    assert fingerprints == {("pytesseract", "5.3.0")}
+    version.assert_called_once()
+
+
+def test_fingerprint_tolerates_a_missing_engine() -> None:
+    with patch.dict(sys.modules, {"tesserocr": None}):
+        assert engine_fingerprint("tesserocr") == ("tesserocr", "unavailable")
+
+
+def test_unknown_engine_is_rejected() -> None:
+    with pytest.raises(ConfigurationError):
+        get_engine("easyocr")
+
+
+def test_recognize_image_bytes_returns_one_text_per_frame() -> None:
+    with patch.object(
+        PytesseractEngine,
+        "recognize",
+        side_effect=["Seite 1", "Seite 2", "Seite 3"],
+    ):
+        texts = recognize_image_bytes(_tiff_bytes(3), engine="pytesseract")
+
+    assert texts == ["Seite 1", "Seite 2", "Seite 3"]
+
+
+def test_image_reader_sends_image_bytes_to_pool(tmp_path: Path) -> None:
+    photo = tmp_path / "scan.tiff"
+    photo.write_bytes(_tiff_bytes(2))
+    pool = Mock(engine="pytesseract")
+    pool.recognize.return_value = ["Seite 1", "Seite 2"]
+
+    document = ImageReader(ocr_pool=pool).read(str(photo))
+
+    pool.recognize.assert_called_once_with(photo.read_bytes())
+    assert document.pages == ["Seite 1", "Seite 2"]
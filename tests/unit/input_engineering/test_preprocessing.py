@@ -0,0 +1,106 @@
+import io
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from benchmarks.synthetic import phone_photo, receipt_lines
+from documentassistent.input_engineering.input_reader import ImageReader
+from documentassistent.input_engineering.ocr_engine import (
+    PytesseractEngine,
+    get_engine,
+)
+from documentassistent.input_engineering.preprocessing import (
+    PreprocessConfig,
+    adaptive_binarize,
+    downscale,
+    estimate_skew,
+    preprocess,
+)
+
+PORTRAIT = (1200, 1600)
+BLACK, WHITE = 0, 255
+
+
+@pytest.fixture(autouse=True)
+def fresh_engines() -> Iterator[None]:
+    get_engine.cache_clear()
+    yield
+    get_engine.cache_clear()
+
+
+def _open(data: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(data))
+
+
+def _lines_image(angle: float = 0.0) -> Image.Image:
+    image = Image.new("L", (600, 600), 255)
+    draw = ImageDraw.Draw(image)
+    for row in range(10):
+        draw.rectangle((60, 60 + row * 50, 540, 72 + row * 50), fill=0)
+    return image.rotate(angle, fillcolor=255)
+
+
+def test_exif_orientation_turns_photo_upright() -> None:
+    photo = _open(phone_photo(["Quittung"], size=PORTRAIT, exif_orientation=6))
+    assert photo.size == PORTRAIT[::-1]
+
+    upright = preprocess(photo, PreprocessConfig(target_dpi=None, binarize=False))
+
+    assert upright.size == PORTRAIT
+
+
+def test_downscale_targets_dpi_and_never_upscales() -> None:
+    photo = Image.new("L", (3024, 4032))
+
+    assert downscale(photo, 150).size == (1316, 1754)
+    assert downscale(photo, 600).size == photo.size
+
+
+def test_binarize_removes_uneven_lighting() -> None:
+    # Background fades so its dark end is darker than the text at the bright end
+    background = np.linspace(250, 60, 400, dtype=np.uint8)
+    pixels = np.tile(background, (200, 1))
+    pixels[90:110, ::40] = np.clip(background[::40].astype(int) - 50, 0, 255)
+    binary = np.asarray(adaptive_binarize(Image.fromarray(pixels)))
+
+    assert set(np.unique(binary)) <= {BLACK, WHITE}
+    assert (binary[90:110, ::40] == BLACK).all()
+    assert (binary[10:30] == WHITE).all()
+
+
+def test_estimate_skew_returns_the_correcting_angle() -> None:
+    assert estimate_skew(_lines_image(3.0)) == pytest.approx(-3.0, abs=0.5)
+    assert estimate_skew(_lines_image()) == 0.0
+
+
+def test_preprocess_outputs_black_and_white() -> None:
+    photo = _open(phone_photo(receipt_lines(1), shade=True))
+
+    result = preprocess(photo, PreprocessConfig(target_dpi=100, deskew=True))
+
+    assert result.mode == "L"
+    assert set(np.unique(np.asarray(result))) <= {BLACK, WHITE}
+
+
+def test_image_reader_preprocesses_before_ocr(tmp_path: Path) -> None:
+    photo = tmp_path / "receipt.jpg"
+    photo.write_bytes(phone_photo(["Quittung"], exif_orientation=6))
+    seen: list[tuple[str, tuple[int, int]]] = []
+
+    def recognize(_engine: PytesseractEngine, image: Image.Image) -> str:
+        seen.append((image.mode, image.size))
+        return "Quittung"
+
+    reader = ImageReader(
+        ocr_engine="pytesseract",
+        preprocess_config=PreprocessConfig(target_dpi=None),
+    )
+    with patch.object(PytesseractEngine, "recognize", recognize):
+        document = reader.read(str(photo))
+
+    assert document.content == "Quittung"
+    assert seen == [("L", PORTRAIT)]
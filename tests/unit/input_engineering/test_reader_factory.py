@@ -0,0 +1,53 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+from PIL import Image
+
+from documentassistent.input_engineering.input_reader import ImageReader
+from documentassistent.input_engineering.reader_factory import (
+    create_image_reader,
+    create_ocr_pool,
+    create_reader_registry,
+)
+
+SETTINGS = {
+    "reading": {
+        "ocr_engine": "pytesseract",
+        "ocr_language": "deu",
+        "ocr": {"pool_workers": 2},
+        "preprocess": {"enabled": False},
+    },
+}
+
+
+def test_ocr_pool_is_created_from_settings() -> None:
+    pool = create_ocr_pool(SETTINGS)
+
+    assert pool is not None
+    with pool:
+        assert (pool.workers, pool.engine, pool.lang) == (2, "pytesseract", "deu")
+        assert pool.preprocess_config is None
+
+
+def test_ocr_pool_is_disabled_by_default() -> None:
+    assert create_ocr_pool({"reading": {}}) is None
+
+
+def test_image_reader_ocrs_in_the_given_pool() -> None:
+    pool = Mock(engine="pytesseract", preprocess_config=None)
+
+    reader = create_image_reader(SETTINGS, ocr_pool=pool)
+
+    assert reader.ocr_pool is pool
+    assert reader.lang == "deu"
+
+
+def test_registry_builds_image_readers_with_the_pool(tmp_path: Path) -> None:
+    photo = tmp_path / "scan.png"
+    Image.new("L", (8, 8)).save(photo)
+    pool = Mock(engine="pytesseract", preprocess_config=None)
+
+    reader = create_reader_registry(SETTINGS, ocr_pool=pool).reader_for(photo)
+
+    assert isinstance(reader, ImageReader)
+    assert reader.ocr_pool is pool
@@ -0,0 +1,125 @@
+import io
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from benchmarks.synthetic import write_text_pdf
+from documentassistent.exceptions import UnsupportedFileTypeError
+from documentassistent.input_engineering.hybrid_pdf_reader import HybridPDFReader
+from documentassistent.input_engineering.input_reader import ImageReader
+from documentassistent.input_engineering.reader_registry import (
+    HEIC,
+    JPEG,
+    PDF,
+    PNG,
+    TIFF,
+    ReaderRegistry,
+    detect_format,
+)
+
+TEXT = "Rechnung Nr. 2024-117 vom 03.05.2024"
+
+
+def _image_bytes(image_format: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("L", (8, 8)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (b"%PDF-1.7\n", PDF),
+        (b"\x00" * 16 + b"%PDF-1.4\n", PDF),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", JPEG),
+        (b"\x89PNG\r\n\x1a\n\x00", PNG),
+        (b"II*\x00\x08\x00", TIFF),
+        (b"MM\x00*\x00\x00", TIFF),
+        (b"\x00\x00\x00\x18ftypheic\x00\x00", HEIC),
+    ],
+)
+def test_detect_format_by_signature(
+    tmp_path: Path,
+    header: bytes,
+    expected: str,
+) -> None:
+    path = tmp_path / "upload.bin"
+    path.write_bytes(header)
+
+    assert detect_format(path) == expected
+
+
+def test_signature_wins_over_suffix_and_suffix_is_fallback(tmp_path: Path) -> None:
+    misnamed = tmp_path / "scan.pdf"
+    misnamed.write_bytes(_image_bytes("PNG"))
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    unknown = tmp_path / "notes.txt"
+    unknown.write_text("hello")
+
+    assert (detect_format(misnamed), detect_format(empty)) == (PNG, PDF)
+    assert detect_format(unknown) is None
+
+
+def test_registry_creates_readers_lazily_once(tmp_path: Path) -> None:
+    pdf = write_text_pdf(tmp_path / "a.pdf", [[TEXT]])
+    created: list[str] = []
+
+    def pdf_factory() -> HybridPDFReader:
+        created.append("pdf")
+        return HybridPDFReader()
+
+    def image_factory() -> ImageReader:
+        created.append("image")
+        return ImageReader()
+
+    registry = ReaderRegistry()
+    registry.register(PDF, pdf_factory)
+    registry.register(PNG, image_factory)
+
+    assert created == []
+    assert registry.read(str(pdf)).content.strip() == TEXT
+    assert registry.reader_for(pdf) is registry.reader_for(pdf)
+    assert created == ["pdf"]
+
+
+def test_unregistered_format_is_rejected(tmp_path: Path) -> None:
+    photo = tmp_path / "photo.jpg"
+    photo.write_bytes(_image_bytes("JPEG"))
+    registry = ReaderRegistry()
+    registry.register(PDF, HybridPDFReader)
+
+    assert not registry.supports(photo)
+    with pytest.raises(UnsupportedFileTypeError):
+        registry.read(str(photo))
+
+
+def test_default_registry_is_picklable() -> None:
+    registry = pickle.loads(pickle.dumps(ReaderRegistry.default()))  # noqa: S301
+
+    assert registry.formats == {PDF, JPEG, PNG, TIFF, HEIC}
+
+
+def test_reading_pdfs_does_not_import_the_image_stack(tmp_path: Path) -> None:
+    pdf = write_text_pdf(tmp_path / "a.pdf", [[TEXT]])
+    script = (
+        "import sys\n"
+        "from documentassistent.input_engineering.reader_registry import"
+        " ReaderRegistry\n"
+        f"ReaderRegistry.default().read({str(pdf)!r})\n"
+        "print(sorted({'PIL', 'numpy', 'pytesseract'} & set(sys.modules)))\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[3],
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,87 @@
+from documentassistent.input_engineering.text_normalizer import TextNormalizer
+from documentassistent.structure.state import Document
+from documentassistent.utils.tokens import ESTIMATE, count_tokens
+
+HEADER = "Stadtwerke Musterstadt GmbH  -  Kundennummer 4711"
+
+
+def _page(number: int, body: list[str]) -> str:
+    return "\n".join([HEADER, *body, f"Seite {number} von 3"])
+
+
+def test_repeated_headers_and_footers_are_kept_once() -> None:
+    pages = [_page(n, [f"Position {n}: Strom 120,00 EUR"]) for n in (1, 2, 3)]
+
+    text, removed = TextNormalizer(encoding=ESTIMATE).normalize_pages(pages)
+
+    assert text.count("Stadtwerke Musterstadt GmbH - Kundennummer 4711") == 1
+    assert "Seite" not in text
+    assert all(f"Position {n}" in text for n in (1, 2, 3))
+    assert removed == 2 + 3
+
+
+def test_single_page_lines_are_not_treated_as_headers() -> None:
+    text, _ = TextNormalizer().normalize_pages([_page(1, ["Betrag 5,00 EUR"])])
+
+    assert text.splitlines()[0] == "Stadtwerke Musterstadt GmbH - Kundennummer 4711"
+    assert "Seite 1 von 3" in text
+
+
+def test_whitespace_hyphenation_and_noise() -> None:
+    raw = (
+        "Rechnung   für\tdie  Kranken-\nversicherung\n"
+        "~~ | ,, .\n"
+        "____________\n"
+        "\n\n\n\n"
+        "---- Summe ----\n"
+        "Gesamt-\nBetrag 42,00 EUR\n"
+    )
+
+    text, _ = TextNormalizer().normalize_pages([raw])
+
+    assert text == (
+        "Rechnung für die Krankenversicherung\n"
+        "\n"
+        "---- Summe ----\n"
+        "Gesamt-\nBetrag 42,00 EUR"
+    )
+
+
+def test_values_in_tables_are_kept() -> None:
+    lab_page = "Laborbefund\nParameter\nWert\nCRP\n< 5\nLeukozyten\n7\nKreatinin\n2"
+    invoice_page = "Position\nMenge\nZahnreinigung\n3\nFüllung\n2\nSeite 2 von 2"
+
+    text, removed = TextNormalizer().normalize_pages([lab_page, invoice_page])
+
+    lines = text.splitlines()
+    assert lines.count("7") == lines.count("3") == 1
+    # "2" ends both pages but is a value, not a repeated footer
+    assert lines.count("2") == len(["Kreatinin", "Füllung"])
+    assert "< 5" in lines
+    assert "Seite 2 von 2" not in text
+    assert removed == 1
+
+
+def test_normalize_reports_tokens_before_and_after() -> None:
+    pages = [_page(n, ["Verbrauch   " * 5]) for n in (1, 2, 3)]
+    document = Document(content="".join(pages), pages=pages)
+    normalizer = TextNormalizer(encoding=ESTIMATE)
+
+    result = normalizer.normalize(document)
+
+    assert result.tokens_before == count_tokens(document.content, ESTIMATE)
+    assert result.tokens_after == count_tokens(result.text, ESTIMATE)
+    assert result.tokens_after < result.tokens_before
+    assert (normalizer.stats.documents, normalizer.stats.tokens_after) == (
+        1,
+        result.tokens_after,
+    )
+
+
+def test_from_settings_returns_none_when_disabled() -> None:
+    assert TextNormalizer.from_settings({"normalization": {"enabled": False}}) is None
+    normalizer = TextNormalizer.from_settings(
+        {"normalization": {"enabled": True, "min_alnum": 3}},
+    )
+    assert normalizer is not None
+    assert normalizer.min_alnum == len("abc")
@@ -0,0 +1,133 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from documentassistent.exceptions import LLMResponseError
+from documentassistent.llm.cascade_llm import CascadeLLM
+from documentassistent.llm.chunked_llm import ChunkedLLM
+from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
+from documentassistent.llm.ollama_llm import OllamaLLMCall
+from documentassistent.llm.replay_llm import RecordingLLM
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.pydantic_llm_calls.note_call import NoteExtraction
+from documentassistent.structure.state import State
+
+
+def _classification(level: ConfidenceLevel) -> Classification:
+    return Classification(
+        label=DocumentType.INVOICE,
+        confidence=Confidence(level=level, explanation="test"),
+    )
+
+
+def _tier(model: str, response: object) -> Mock:
+    tier = Mock(model=model)
+    if isinstance(response, Exception):
+        tier.call.side_effect = response
+    else:
+        tier.call.return_value = response
+    return tier
+
+
+def test_confident_small_model_is_not_escalated() -> None:
+    small = _tier("gemma:2b", _classification(ConfidenceLevel.HIGH))
+    large = _tier("gemma:7b", _classification(ConfidenceLevel.HIGH))
+    cascade = CascadeLLM(tiers=[small, large])
+
+    result = cascade.call(State(text="Rechnung"), Classification)
+
+    assert result.confidence.level == ConfidenceLevel.HIGH
+    large.call.assert_not_called()
+    assert cascade.stats.tiers[0].escalation_rate == 0.0
+
+
+def test_low_confidence_is_escalated_to_larger_model() -> None:
+    small = _tier("gemma:2b", _classification(ConfidenceLevel.LOW))
+    large = _tier("gemma:7b", _classification(ConfidenceLevel.MEDIUM))
+    cascade = CascadeLLM(tiers=[small, large])
+
+    result = cascade.call(State(text="unclear"), Classification)
+
+    # The last tier's answer is final, whatever its confidence
+    assert result.confidence.level == ConfidenceLevel.MEDIUM
+    assert cascade.stats.tiers[0].escalated_low_confidence == 1
+    assert cascade.stats.tiers[1].calls == 1
+    assert cascade.stats.tiers[1].escalations == 0
+
+
+def test_validation_failure_is_escalated_for_schemas_without_confidence() -> None:
+    note = NoteExtraction.model_construct()
+    small = _tier("gemma:2b", LLMResponseError("bad json"))
+    large = _tier("gemma:7b", note)
+    cascade = CascadeLLM(tiers=[small, large])
+
+    assert cascade.call(State(text="note"), NoteExtraction) is note
+    assert cascade.stats.tiers[0].escalated_failure == 1
+
+
+def test_failure_of_last_tier_falls_back_or_raises() -> None:
+    unsure = _classification(ConfidenceLevel.LOW)
+    cascade = CascadeLLM(
+        tiers=[_tier("gemma:2b", unsure), _tier("gemma:7b", LLMResponseError("x"))],
+    )
+    assert cascade.call(State(text="unclear"), Classification) is unsure
+
+    failing = CascadeLLM(tiers=[_tier("gemma:7b", LLMResponseError("x"))])
+    with pytest.raises(LLMResponseError):
+        failing.call(State(text="unclear"), Classification)
+
+
+def test_acall_escalates_asynchronously() -> None:
+    small = Mock(model="gemma:2b")
+    small.acall = AsyncMock(return_value=_classification(ConfidenceLevel.LOW))
+    large = Mock(model="gemma:7b")
+    large.acall = AsyncMock(return_value=_classification(ConfidenceLevel.HIGH))
+    cascade = CascadeLLM(tiers=[small, large])
+
+    result = asyncio.run(cascade.acall(State(text="unclear"), Classification))
+
+    assert result.confidence.level == ConfidenceLevel.HIGH
+    large.acall.assert_awaited_once()
+
+
+def test_factory_builds_cascade_from_config() -> None:
+    config: ConfigDict = {
+        "llm": {
+            "type": "ollama",
+            "model": "gemma:7b",
+            "cascade": {
+                "enabled": True,
+                "models": ["gemma:2b", "gemma:7b"],
+                "escalate_on": ["low"],
+            },
+        },
+    }
+
+    llm = LLMFactory.create_llm(config)
+
+    assert isinstance(llm, CascadeLLM)
+    assert [tier.model for tier in llm.tiers] == ["gemma:2b", "gemma:7b"]
+    assert all(isinstance(tier, OllamaLLMCall) for tier in llm.tiers)
+    assert llm.escalate_on == frozenset({ConfidenceLevel.LOW})
+
+
+def test_summary_reaches_the_cascade_through_wrappers(tmp_path: Path) -> None:
+    small, large = _tier("gemma:2b", None), _tier("gemma:7b", None)
+    cascade = CascadeLLM(tiers=[small, large])
+    llm = ChunkedLLM(RecordingLLM(cascade, path=str(tmp_path / "rec.jsonl")))
+
+    with patch.object(cascade.stats, "log_summary") as cascade_summary:
+        llm.log_summary()
+
+    cascade_summary.assert_called_once()
+    small.log_summary.assert_called_once()
+    large.log_summary.assert_called_once()
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 
 import pytest
@@ -46,11 +48,9 @@ def test_call_creates_chain(mock_llm: ChainLLM, mocker: MockFixture) -> None:
     )
 
     # Mock the chain creation and invocation
-    mocker.patch.object(mock_llm, "create_chain")
     mock_chain = Mock()
     mock_chain.invoke.return_value = mock_response
-    mock_llm.chain = mock_chain
-    mocker.patch.object(mock_llm, "_current_pydantic_type", DocumentType)
+    mocker.patch.object(mock_llm, "create_chain", return_value=mock_chain)
 
     state = State(prompt="test prompt", text="test text")
     result = mock_llm.call(state, DocumentType)
@@ -59,3 +59,64 @@ def test_call_creates_chain(mock_llm: ChainLLM, mocker: MockFixture) -> None:
     assert isinstance(result, DocumentType)
     assert result.type == InvoiceTypeEnum.DOCTOR_RECEIPT
     assert result.description == "Doctor visit"
+
+
+def test_acall_uses_ainvoke(mock_llm: ChainLLM, mocker: MockFixture) -> None:
+    """Test that acall awaits the chain's ainvoke instead of blocking invoke."""
+    mock_chain = Mock()
+    mock_chain.ainvoke = mocker.AsyncMock(return_value=DummyPydantic(value="async"))
+    mocker.patch.object(mock_llm, "create_chain", return_value=mock_chain)
+
+    state = State(prompt="test prompt", text="test text")
+    result = asyncio.run(mock_llm.acall(state, DummyPydantic))
+
+    mock_chain.ainvoke.assert_awaited_once()
+    mock_chain.invoke.assert_not_called()
+    assert result == DummyPydantic(value="async")
+
+
+def test_chains_are_cached_per_prompt_and_schema(
+    mock_llm: ChainLLM,
+    mocker: MockFixture,
+) -> None:
+    """Test that alternating schemas reuse chains instead of rebuilding them."""
+
+    class OtherPydantic(BaseModel):
+        other: str = "other"
+
+    create_chain = mocker.spy(mock_llm, "create_chain")
+    mocker.patch(
+        "documentassistent.llm.chain_llm.LocalRepairFixingParser.from_llm",
+        return_value=mocker.Mock(get_format_instructions=lambda: ""),
+    )
+
+    for _ in range(3):
+        first = mock_llm.get_chain("prompt {text}", DummyPydantic)
+        second = mock_llm.get_chain("prompt {text}", OtherPydantic)
+
+    assert first is not second
+    assert create_chain.call_count == 2  # noqa: PLR2004
+    assert mock_llm.get_chain("prompt {text}", DummyPydantic) is first
+
+
+def test_get_chain_builds_once_under_concurrency(
+    mock_llm: ChainLLM,
+    mocker: MockFixture,
+) -> None:
+    """Test that concurrent callers share a single chain per schema."""
+    create_chain = mocker.patch.object(
+        mock_llm,
+        "create_chain",
+        side_effect=lambda *_: Mock(),
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        chains = list(
+            executor.map(
+                lambda _: mock_llm.get_chain("prompt", DummyPydantic),
+                range(32),
+            ),
+        )
+
+    create_chain.assert_called_once()
+    assert all(chain is chains[0] for chain in chains)
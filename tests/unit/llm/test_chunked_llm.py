@@ -0,0 +1,175 @@
+import asyncio
+from itertools import pairwise
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from documentassistent.exceptions import ConfigurationError
+from documentassistent.llm.chunked_llm import ChunkedLLM, merge_results, split_text
+from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
+from documentassistent.llm.ollama_llm import OllamaLLMCall
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+)
+from documentassistent.structure.pydantic_llm_calls.result_call import (
+    ResultExtraction,
+)
+from documentassistent.structure.pydantic_llm_calls.result_call import (
+    TestResult as Row,
+)
+from documentassistent.structure.state import State
+from documentassistent.utils.tokens import ESTIMATE, count_tokens
+
+MAX_TOKENS = 40
+NUM_CTX = 4096
+LINES = [f"Leukozyten Messung {n}: {n},{n} G/l" for n in range(12)]
+TEXT = "\n".join(LINES)
+
+
+def _row(name: str, value: str = "1,0") -> Row:
+    return Row(
+        test_name=name,
+        value=value,
+        unit="G/l",
+        reference_range=None,
+        date=None,
+        notes=None,
+    )
+
+
+def _extraction(*names: str) -> ResultExtraction:
+    return ResultExtraction(
+        patient_name=None,
+        test_results=[_row(name) for name in names],
+        overall_notes=None,
+    )
+
+
+def test_split_text_respects_budget_and_overlaps() -> None:
+    chunks = split_text(TEXT, MAX_TOKENS, overlap_tokens=15, encoding=ESTIMATE)
+
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk, ESTIMATE) <= MAX_TOKENS for chunk in chunks)
+    # Every line is in some chunk, and consecutive chunks share a line
+    assert all(any(line in chunk for chunk in chunks) for line in LINES)
+    for previous, current in pairwise(chunks):
+        assert previous.splitlines()[-1] == current.splitlines()[0]
+
+
+def test_split_text_cuts_overlong_lines_at_words() -> None:
+    line = " ".join(["Wort"] * 100)
+
+    chunks = split_text(line, MAX_TOKENS, encoding=ESTIMATE)
+
+    assert len(chunks) > 1
+    assert " ".join(chunks) == line
+
+
+def test_merge_results_keeps_repeated_rows_once() -> None:
+    first = _extraction("Leukozyten", "Hämoglobin")
+    first.patient_name = "Erika Muster"
+    second = _extraction("hämoglobin ", "Kreatinin")
+
+    merged = merge_results([first, second])
+
+    assert merged.patient_name == "Erika Muster"
+    assert [row.test_name for row in merged.test_results] == [
+        "Leukozyten",
+        "Hämoglobin",
+        "Kreatinin",
+    ]
+
+
+def test_short_text_and_classification_are_passed_through() -> None:
+    inner = Mock(model="gemma:7b")
+    chunked = ChunkedLLM(llm=inner, max_tokens=MAX_TOKENS, encoding=ESTIMATE)
+
+    chunked.call(State(text="kurz"), ResultExtraction)
+    chunked.call(State(text=TEXT), Classification)
+
+    assert [call.args[0].text for call in inner.call.call_args_list] == ["kurz", TEXT]
+
+
+def test_long_text_is_extracted_per_chunk_and_merged() -> None:
+    inner = Mock(model="gemma:7b")
+    inner.call.side_effect = lambda state, _: _extraction(
+        *(line.split(":")[0] for line in state.text.splitlines()),
+    )
+    chunked = ChunkedLLM(
+        llm=inner,
+        max_tokens=MAX_TOKENS,
+        overlap_tokens=15,
+        encoding=ESTIMATE,
+    )
+
+    result = chunked.call(State(text=TEXT), ResultExtraction)
+
+    assert inner.call.call_count > 1
+    assert [row.test_name for row in result.test_results] == [
+        line.split(":")[0] for line in LINES
+    ]
+
+
+def test_acall_extracts_chunks_concurrently() -> None:
+    inner = Mock(model="gemma:7b")
+    inner.acall = AsyncMock(return_value=_extraction("Leukozyten"))
+    chunked = ChunkedLLM(llm=inner, max_tokens=MAX_TOKENS, encoding=ESTIMATE)
+
+    result = asyncio.run(chunked.acall(State(text=TEXT), ResultExtraction))
+
+    assert inner.acall.await_count > 1
+    assert len(result.test_results) == 1
+
+
+def test_factory_wraps_llm_when_chunking_enabled() -> None:
+    config: ConfigDict = {
+        "llm": {
+            "type": "ollama",
+            "model": "gemma:7b",
+            "max_tokens": 1000,
+            "num_ctx": NUM_CTX,
+            "chunking": {"enabled": True, "max_tokens": 500},
+        },
+    }
+
+    llm = LLMFactory.create_llm(config)
+
+    assert isinstance(llm, ChunkedLLM)
+    assert isinstance(llm.llm, OllamaLLMCall)
+    assert (llm.max_tokens, llm.overlap_tokens) == (500, 200)
+    assert (llm.num_ctx, llm.output_tokens) == (NUM_CTX, 1000)
+    assert llm.llm.llm.num_ctx == NUM_CTX
+
+
+def test_chunks_fill_the_context_left_by_the_prompt() -> None:
+    prompt = "Extract the lab results from this text: "
+    inner = Mock(model="gemma:7b")
+    inner.render_prompt.return_value = prompt
+    inner.call.side_effect = lambda state, _: _extraction(state.text.split(":")[0])
+    num_ctx = count_tokens(prompt, ESTIMATE) + 10 + MAX_TOKENS
+    chunked = ChunkedLLM(
+        llm=inner,
+        max_tokens=None,
+        encoding=ESTIMATE,
+        num_ctx=num_ctx,
+        output_tokens=10,
+    )
+
+    assert chunked.text_budget(State(text=TEXT), ResultExtraction) == MAX_TOKENS
+    chunked.call(State(text=TEXT), ResultExtraction)
+
+    assert inner.render_prompt.call_args.args[0].text == ""
+    assert inner.call.call_count > 1
+    assert all(
+        count_tokens(call.args[0].text, ESTIMATE) <= MAX_TOKENS
+        for call in inner.call.call_args_list
+    )
+
+
+def test_context_without_room_for_text_is_rejected() -> None:
+    inner = Mock(model="gemma:7b")
+    inner.render_prompt.return_value = "Extract: " * 50
+    chunked = ChunkedLLM(llm=inner, encoding=ESTIMATE, num_ctx=50)
+
+    with pytest.raises(ConfigurationError):
+        chunked.call(State(text=TEXT), ResultExtraction)
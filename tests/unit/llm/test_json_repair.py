@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.runnables import RunnableLambda
+
+from documentassistent.llm import json_repair
+from documentassistent.llm.json_repair import (
+    LocalRepairFixingParser,
+    LocalRepairParser,
+    RepairStats,
+    extract_json_object,
+    fix_json_syntax,
+    repair_json,
+    repair_stats,
+)
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import ConfidenceLevel
+from documentassistent.structure.pydantic_llm_calls.invoice_call import (
+    InvoiceExtraction,
+    InvoiceTypeEnum,
+)
+
+
+@pytest.fixture
+def parser() -> LocalRepairParser:
+    repair_stats.reset()
+    return LocalRepairParser(
+        parser=PydanticOutputParser(pydantic_object=Classification),
+    )
+
+
+def test_extract_json_object_closes_missing_braces() -> None:
+    text = 'Sure! {"label": "note", "confidence": {"level": "low", "explanation": "x"'
+    assert extract_json_object(text) == (
+        '{"label": "note", "confidence": {"level": "low", "explanation": "x"}}'
+    )
+
+
+def test_fix_json_syntax_keeps_string_contents() -> None:
+    text = '{"notes": "True, }", "paid": True, "logs": [1, 2,],}'
+    assert fix_json_syntax(text) == '{"notes": "True, }", "paid": true, "logs": [1, 2]}'
+
+
+def test_repair_json_coerces_nested_enums() -> None:
+    text = """```json
+    {
+      "type": "Receipt from doctor",
+      "price": 120.0,
+      "date": "2024-01-02",
+      "description": "GP visit",
+      "notes": None,
+      "logs": [],
+    }
+    ```"""
+    repaired = repair_json(text, InvoiceExtraction)
+
+    assert repaired is not None
+    assert InvoiceExtraction.model_validate(repaired).type == (
+        InvoiceTypeEnum.DOCTOR_RECEIPT
+    )
+
+
+def test_local_repair_parser_repairs_without_llm(parser: LocalRepairParser) -> None:
+    text = (
+        "Here is the result:\n"
+        '{"label": "Invoice", "confidence": {"level": "High", "explanation": "EUR",},'
+    )
+
+    result = parser.parse(text)
+
+    assert result.label == DocumentType.INVOICE
+    assert result.confidence.level == ConfidenceLevel.HIGH
+    assert repair_stats.snapshot()["Classification"][RepairStats.REPAIRED] == 1
+
+
+def test_local_repair_parser_falls_back_when_unrepairable(
+    parser: LocalRepairParser,
+) -> None:
+    with pytest.raises(OutputParserException):
+        parser.parse("I could not classify this document.")
+
+    counts = repair_stats.snapshot()["Classification"]
+    assert counts[RepairStats.LLM_FALLBACK] == 1
+    assert counts[RepairStats.REPAIRED] == 0
+
+
+def test_repair_summary_is_logged_per_schema(parser: LocalRepairParser) -> None:
+    answer = '{"label": "note", "confidence": {"level": "low", "explanation": ""}}'
+    parser.parse(answer)
+    parser.parse(f"```json\n{answer[:-2]},}},\n```")
+    with pytest.raises(OutputParserException):
+        parser.parse("no JSON")
+
+    with patch.object(json_repair.logger, "info") as info:
+        repair_stats.log_summary()
+
+    [(message, schema_name, parsed, repaired, fallback)] = [
+        call.args for call in info.call_args_list
+    ]
+    assert "LLM round-trips saved" in message
+    assert (schema_name, parsed, repaired, fallback) == ("Classification", 1, 1, 1)
+
+
+def test_fixer_output_is_not_counted_as_another_response(
+    parser: LocalRepairParser,
+) -> None:
+    answer = '{"label": "note", "confidence": {"level": "low", "explanation": ""}}'
+    fixing_parser = LocalRepairFixingParser.from_llm(
+        parser=parser,
+        llm=RunnableLambda(lambda _: answer),
+    )
+
+    result = fixing_parser.parse("no JSON")
+    async_result = asyncio.run(fixing_parser.aparse("still no JSON"))
+
+    assert result.label == async_result.label == DocumentType.NOTE
+    counts = repair_stats.snapshot()["Classification"]
+    assert counts == {
+        RepairStats.PARSED: 0,
+        RepairStats.REPAIRED: 0,
+        RepairStats.LLM_FALLBACK: 2,
+    }
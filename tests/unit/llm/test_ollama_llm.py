@@ -27,7 +27,7 @@ def test_ollama_llm_initialization() -> None:
     """Test OllamaLLM initialization with default model."""
     llm = OllamaLLMCall()
     assert llm.llm is not None
-    assert llm.chain is None
+    assert llm._chains == {}  # noqa: SLF001
 
 
 def test_ollama_llm_initialization_with_custom_model() -> None:
@@ -45,7 +45,7 @@ def test_ollama_llm_call(mock_ollama_llm: OllamaLLMCall, sample_state: State) ->
         Logs,
     )
 
-    mock_ollama_llm.chain = Mock()
+    mock_chain = Mock()
     mock_response = DocumentType(
         type=InvoiceTypeEnum.DOCTOR_RECEIPT,
         price=100.0,
@@ -54,12 +54,12 @@ def test_ollama_llm_call(mock_ollama_llm: OllamaLLMCall, sample_state: State) ->
         notes="Test notes",
         logs=[Logs(log="Test log", date="2024-05-24")],
     )
-    mock_ollama_llm.chain.invoke.return_value = mock_response
-    mock_ollama_llm._current_pydantic_type = DocumentType  # noqa: SLF001
+    mock_chain.invoke.return_value = mock_response
+    mock_ollama_llm._chains[(sample_state.prompt, DocumentType)] = mock_chain  # noqa: SLF001
 
     result = mock_ollama_llm.call(sample_state, DocumentType)
 
-    mock_ollama_llm.chain.invoke.assert_called_once()
+    mock_chain.invoke.assert_called_once()
     assert isinstance(result, DocumentType)
     assert result.type == InvoiceTypeEnum.DOCTOR_RECEIPT
     assert result.description == "Test description"
@@ -70,8 +70,8 @@ def test_ollama_llm_chain_creation(mock_ollama_llm: OllamaLLMCall) -> None:
     from documentassistent.structure.pydantic_llm_calls.invoice_call import DocumentType
 
     prompt = "Test prompt"
-    mock_ollama_llm.create_chain(prompt, DocumentType)
-    assert mock_ollama_llm.chain is not None
+    chain = mock_ollama_llm.create_chain(prompt, DocumentType)
+    assert chain is not None
 
 
 def test_ollama_llm_error_handling(mocker: Mock) -> None:
@@ -83,3 +83,116 @@ def test_ollama_llm_error_handling(mocker: Mock) -> None:
 
     with pytest.raises(ConnectionError):
         OllamaLLMCall(model="gemma:7b")
+
+
+def test_ollama_structured_chain_passes_schema_as_format() -> None:
+    """Test that structured mode passes the schema as Ollama's format."""
+    from langchain_core.language_models.fake import FakeListLLM
+    from langchain_core.prompts import PromptTemplate
+    from langchain_core.runnables import RunnableBinding
+
+    from documentassistent.structure.pydantic_llm_calls.classification_call import (
+        Classification,
+        DocumentType,
+    )
+
+    llm = OllamaLLMCall(model="gemma:7b")
+    llm.llm = FakeListLLM(
+        responses=[
+            '{"label": "note", "confidence": {"level": "high", "explanation": "x"}}',
+        ],
+    )
+    llm.structured_output = True
+
+    chain = llm.create_chain("Classify: {text}", Classification)
+    result = chain.invoke({"text": "Remember the milk"})
+
+    prompt, constrained_llm = chain.first, chain.steps[1]
+    assert isinstance(prompt, PromptTemplate)
+    assert isinstance(constrained_llm, RunnableBinding)
+    assert prompt.template.startswith("Classify: {text}")
+    assert constrained_llm.kwargs["format"] == Classification.model_json_schema()
+    assert isinstance(result, Classification)
+    assert result.label == DocumentType.NOTE
+
+
+def test_structured_prompt_keeps_the_field_descriptions() -> None:
+    """Test that structured mode still shows the schema descriptions."""
+    from langchain_core.language_models.fake import FakeListLLM
+
+    from documentassistent.structure.pydantic_llm_calls.classification_call import (
+        Classification,
+    )
+
+    llm = OllamaLLMCall(model="gemma:7b")
+    llm.llm = FakeListLLM(responses=[])
+    llm.structured_output = True
+
+    chain = llm.create_chain("Classify: {text}", Classification)
+    prompt = chain.first.invoke({"text": "Remember the milk"}).to_string()
+
+    assert prompt.startswith("Classify: Remember the milk\n")
+    assert "such as invoice, result, or note" in prompt
+    assert '"enum": ["invoice", "result", "note"]' in prompt
+
+
+def test_rendered_prompt_includes_the_schema_description() -> None:
+    """Test that render_prompt returns what the chain sends to the model."""
+    from langchain_core.language_models.fake import FakeListLLM
+
+    from documentassistent.structure.pydantic_llm_calls.classification_call import (
+        Classification,
+    )
+
+    llm = OllamaLLMCall(model="gemma:7b")
+    llm.llm = FakeListLLM(responses=[])
+    llm.structured_output = True
+
+    prompt = llm.render_prompt(
+        State(text="", prompt="Classify: {text}"),
+        Classification,
+    )
+
+    assert prompt.startswith("Classify: \n")
+    assert "such as invoice, result, or note" in prompt
+
+
+def test_factory_enables_structured_output_per_provider() -> None:
+    """Test that the factory turns structured output on unless configured off."""
+    from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
+
+    default_config: ConfigDict = {"llm": {"type": "ollama", "model": "gemma:7b"}}
+    disabled_config: ConfigDict = {
+        "llm": {"type": "ollama", "model": "gemma:7b", "structured_output": False},
+    }
+
+    default_llm = LLMFactory.create_llm(default_config)
+    disabled_llm = LLMFactory.create_llm(disabled_config)
+
+    assert isinstance(default_llm, OllamaLLMCall)
+    assert default_llm.structured_output
+    assert isinstance(disabled_llm, OllamaLLMCall)
+    assert not disabled_llm.structured_output
+
+
+def test_factory_leaves_structured_output_off_for_openai(mocker: Mock) -> None:
+    """Test that OpenAI models get format instructions unless configured on."""
+    from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
+    from documentassistent.llm.openai_llm import OpenAILLM
+
+    mocker.patch.dict("os.environ", {"OPENAI_API_KEY": "test"})
+    chat_openai = mocker.patch("documentassistent.llm.openai_llm.ChatOpenAI")
+    default_config: ConfigDict = {"llm": {"type": "openai", "model": "gpt-4"}}
+    enabled_config: ConfigDict = {
+        "llm": {"type": "openai", "model": "gpt-4o", "structured_output": True},
+    }
+
+    default_llm = LLMFactory.create_llm(default_config)
+    enabled_llm = LLMFactory.create_llm(enabled_config)
+
+    assert isinstance(default_llm, OpenAILLM)
+    assert not default_llm.structured_output
+    assert isinstance(enabled_llm, OpenAILLM)
+    assert enabled_llm.structured_output
+    assert enabled_llm.model == "gpt-4o"
+    assert chat_openai.call_args.kwargs["model"] == "gpt-4o"
@@ -0,0 +1,123 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.language_models.fake import FakeListLLM
+
+from documentassistent.exceptions import LLMResponseError
+from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
+from documentassistent.llm.ollama_llm import OllamaLLMCall
+from documentassistent.llm.replay_llm import (
+    FixedLatency,
+    LatencyModel,
+    LognormalLatency,
+    RecordedLatency,
+    RecordingLLM,
+    ReplayLLM,
+)
+from documentassistent.prompts.prompt_collection import CATEGORISATION_PROMPT
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.state import State
+
+RECORDED_SECONDS = 2.0
+
+
+@pytest.fixture
+def recordings(tmp_path: Path) -> Path:
+    """Record one classification through a mocked provider."""
+    path = tmp_path / "recordings.jsonl"
+    inner = Mock(model="gemma:7b")
+    inner.call.return_value = Classification(
+        label=DocumentType.INVOICE,
+        confidence=Confidence(level=ConfidenceLevel.HIGH, explanation="Rechnung"),
+    )
+    recorder = RecordingLLM(llm=inner, path=str(path))
+    with patch(
+        "documentassistent.llm.replay_llm.time.perf_counter",
+        side_effect=[0.0, RECORDED_SECONDS],
+    ):
+        recorder.call(
+            State(prompt=CATEGORISATION_PROMPT, text="Rechnung 12 EUR"),
+            Classification,
+        )
+    return path
+
+
+def test_replay_serves_recorded_response(recordings: Path) -> None:
+    replay = ReplayLLM(path=str(recordings), latency=RecordedLatency(scale=0.5))
+
+    with patch("documentassistent.llm.replay_llm.time.sleep") as sleep:
+        result = replay.call(
+            State(prompt=CATEGORISATION_PROMPT, text="Rechnung  12 EUR"),
+            Classification,
+        )
+
+    assert isinstance(result, Classification)
+    assert result.label == DocumentType.INVOICE
+    sleep.assert_called_once_with(RECORDED_SECONDS * 0.5)
+
+
+def test_replay_acall_and_missing_recording(recordings: Path) -> None:
+    replay = ReplayLLM(path=str(recordings))
+    state = State(prompt=CATEGORISATION_PROMPT, text="Rechnung 12 EUR")
+
+    assert asyncio.run(replay.acall(state, Classification)).label == (
+        DocumentType.INVOICE
+    )
+    with pytest.raises(LLMResponseError, match="No recorded Classification"):
+        replay.call(State(prompt=CATEGORISATION_PROMPT, text="unknown"), Classification)
+
+
+def test_latency_models_from_config() -> None:
+    assert isinstance(LatencyModel.from_config(None), FixedLatency)
+    assert LatencyModel.from_config({"kind": "fixed", "seconds": 0.3}).sample(9) == (
+        0.3  # noqa: PLR2004
+    )
+    lognormal = LatencyModel.from_config(
+        {"kind": "lognormal", "median": 1.0, "sigma": 0.0, "seed": 1},
+    )
+    assert isinstance(lognormal, LognormalLatency)
+    assert lognormal.sample(0.0) == 1.0
+    with pytest.raises(ValueError, match="Unknown latency kind"):
+        LatencyModel.from_config({"kind": "uniform"})
+
+
+def test_factory_creates_replay_provider(recordings: Path) -> None:
+    config: ConfigDict = {
+        "llm": {
+            "type": "replay",
+            "model": None,
+            "replay": {"path": str(recordings), "latency": {"kind": "recorded"}},
+        },
+    }
+    llm = LLMFactory.create_llm(config)
+    assert isinstance(llm, ReplayLLM)
+    assert isinstance(llm.latency, RecordedLatency)
+    assert llm.structured_output
+
+
+@pytest.mark.parametrize("structured_output", [True, False])
+def test_replay_renders_the_recorded_providers_prompt(
+    recordings: Path,
+    *,
+    structured_output: bool,
+) -> None:
+    provider = OllamaLLMCall(model="gemma:7b")
+    provider.llm = FakeListLLM(responses=[])
+    provider.structured_output = structured_output
+    replay = ReplayLLM(path=str(recordings))
+    replay.structured_output = structured_output
+    state = State(prompt=CATEGORISATION_PROMPT, text="Rechnung 12 EUR")
+
+    assert replay.render_prompt(state, Classification) == provider.render_prompt(
+        state,
+        Classification,
+    )
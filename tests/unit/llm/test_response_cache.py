@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from documentassistent.llm.cached_llm import CachedLLM
+from documentassistent.llm.llm_factory import ConfigDict, LLMFactory
+from documentassistent.llm.response_cache import ResponseCache, cache_key
+from documentassistent.prompts.prompt_collection import CATEGORISATION_PROMPT
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.state import State
+
+
+@pytest.fixture
+def classification() -> Classification:
+    return Classification(
+        label=DocumentType.INVOICE,
+        confidence=Confidence(level=ConfidenceLevel.HIGH, explanation="Rechnung"),
+    )
+
+
+def test_cache_key_ignores_whitespace_differences() -> None:
+    first = cache_key("ollama", "gemma:7b", "v1.0", "Classification", "Summe  12 EUR")
+    second = cache_key("ollama", "gemma:7b", "v1.0", "Classification", "Summe\n12 EUR")
+    other_model = cache_key("ollama", "gemma:2b", "v1.0", "Classification", "Summe")
+
+    assert first == second
+    assert first != other_model
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(path=":memory:", max_entries=2)
+    cache.put("a", "Schema", "{}")
+    cache.put("b", "Schema", "{}")
+    with patch("documentassistent.llm.response_cache.time.time", return_value=1e12):
+        assert cache.get("a") == "{}"
+    cache.put("c", "Schema", "{}")
+
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.get("b") is None
+    assert cache.stats.evictions == 1
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    cache = ResponseCache(path=":memory:", ttl_seconds=60)
+    cache.put("a", "Schema", "{}")
+    with patch("documentassistent.llm.response_cache.time.time", return_value=1e12):
+        assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+
+def test_cached_llm_skips_wrapped_llm_on_hit(classification: Classification) -> None:
+    inner = Mock(model="gemma:7b")
+    inner.call.return_value = classification
+    llm = CachedLLM(llm=inner, cache=ResponseCache(path=":memory:"), provider="ollama")
+    state = State(prompt=CATEGORISATION_PROMPT, text="Rechnung Summe 12 EUR")
+
+    first = llm.call(state, Classification)
+    second = llm.call(state, Classification)
+
+    inner.call.assert_called_once()
+    assert isinstance(second, Classification)
+    assert second == first
+    assert llm.cache.stats.hits == 1
+    assert llm.cache.stats.misses == 1
+    llm.log_summary()
+    inner.log_summary.assert_called_once()
+
+
+def test_cached_llm_drops_a_payload_that_no_longer_validates(
+    classification: Classification,
+) -> None:
+    inner = Mock(model="gemma:7b")
+    inner.call.return_value = classification
+    llm = CachedLLM(llm=inner, cache=ResponseCache(path=":memory:"), provider="ollama")
+    state = State(prompt=CATEGORISATION_PROMPT, text="Rechnung")
+    key = llm._key(state, Classification)  # noqa: SLF001
+    llm.cache.put(key, "Classification", '{"label": "receipt"}')
+
+    result = llm.call(state, Classification)
+
+    inner.call.assert_called_once()
+    assert result == classification
+    assert llm.cache.get(key) == classification.model_dump_json()
+    assert (llm.cache.stats.hits, llm.cache.stats.misses) == (1, 1)
+
+
+def test_cached_llm_acall_shares_entries(classification: Classification) -> None:
+    inner = Mock(model="gemma:7b")
+    inner.call.return_value = classification
+    inner.acall = AsyncMock()
+    llm = CachedLLM(llm=inner, cache=ResponseCache(path=":memory:"), provider="ollama")
+    state = State(prompt=CATEGORISATION_PROMPT, text="Rechnung")
+
+    llm.call(state, Classification)
+    result = asyncio.run(llm.acall(state, Classification))
+
+    inner.acall.assert_not_called()
+    assert result == classification
+
+
+def test_factory_wraps_llm_when_cache_enabled() -> None:
+    config: ConfigDict = {
+        "llm": {
+            "type": "ollama",
+            "model": "gemma:7b",
+            "cache": {"enabled": True, "path": ":memory:"},
+        },
+    }
+    llm = LLMFactory.create_llm(config)
+    assert isinstance(llm, CachedLLM)
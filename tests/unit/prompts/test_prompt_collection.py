@@ -9,3 +9,12 @@ def test_categorisation_prompt_exists() -> None:
 def test_invoice_extraction_prompt_exists() -> None:
     assert isinstance(prompt_collection.INVOICE_EXTRACTION_PROMPT, str)
     assert "extract the following fields" in prompt_collection.INVOICE_EXTRACTION_PROMPT
+
+
+def test_extraction_prompts_include_the_text() -> None:
+    for prompt in (
+        prompt_collection.INVOICE_EXTRACTION_PROMPT,
+        prompt_collection.NOTE_EXTRACTION_PROMPT,
+        prompt_collection.RESULT_EXTRACTION_PROMPT,
+    ):
+        assert "{text}" in prompt
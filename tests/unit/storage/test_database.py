@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import text
+
+from documentassistent.storage import SQLiteProfile, get_session, init_database
+from documentassistent.storage.database import DEFAULT_PROFILE
+
+# PRAGMA synchronous and temp_store report their setting as a number
+SYNCHRONOUS_NORMAL = 1
+SYNCHRONOUS_FULL = 2
+TEMP_STORE_MEMORY = 2
+
+
+def _pragma(name: str) -> object:
+    session = get_session()
+    try:
+        return session.execute(text(f"PRAGMA {name}")).scalar()
+    finally:
+        session.close()
+
+
+def test_profile_is_applied_to_every_connection(tmp_path: Path) -> None:
+    profile = SQLiteProfile(busy_timeout_ms=1234, cache_size_kib=4096)
+    init_database(str(tmp_path / "documents.db"), profile)
+
+    assert _pragma("journal_mode") == "wal"
+    assert _pragma("synchronous") == SYNCHRONOUS_NORMAL
+    assert _pragma("busy_timeout") == profile.busy_timeout_ms
+    assert _pragma("cache_size") == -profile.cache_size_kib
+    assert _pragma("temp_store") == TEMP_STORE_MEMORY
+
+
+def test_default_profile_keeps_rollback_journal(tmp_path: Path) -> None:
+    init_database(str(tmp_path / "documents.db"), DEFAULT_PROFILE)
+
+    assert _pragma("journal_mode") == "delete"
+    assert _pragma("synchronous") == SYNCHRONOUS_FULL
+
+
+def test_in_memory_database_is_shared_across_sessions() -> None:
+    init_database(":memory:")
+    session = get_session()
+    try:
+        session.execute(text("SELECT 1"))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # A second connection would open a new, empty database
+            tables = executor.submit(_pragma, "table_info(documents)").result()
+    finally:
+        session.close()
+
+    assert tables is not None
+
+
+def test_profile_from_settings() -> None:
+    settings = {"database": {"sqlite": {"synchronous": "full", "pool_size": 2}}}
+
+    profile = SQLiteProfile.from_settings(settings)
+
+    assert (profile.synchronous, profile.pool_size) == ("full", 2)
+    assert SQLiteProfile.from_settings({}) == SQLiteProfile()
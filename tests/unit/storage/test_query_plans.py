@@ -0,0 +1,120 @@
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, event
+
+from documentassistent.storage import (
+    DocumentRepository,
+    FileMetadata,
+    get_session,
+    init_database,
+)
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.pydantic_llm_calls.invoice_call import (
+    InvoiceExtraction,
+    InvoiceTypeEnum,
+)
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> DocumentRepository:
+    init_database(str(tmp_path / "documents.db"))
+    return DocumentRepository()
+
+
+def _query_plans(run: Callable[[], object]) -> list[str]:
+    """Run the queries and return EXPLAIN QUERY PLAN of each SELECT issued."""
+    session = get_session()
+    engine = session.get_bind()
+    session.close()
+    assert isinstance(engine, Engine)
+    executed: list[tuple[str, Any]] = []
+
+    def capture(*args: Any) -> None:
+        _, _, statement, parameters, _, _ = args
+        if statement.lstrip().upper().startswith("SELECT"):
+            executed.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        plans = []
+        for statement, parameters in executed:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plans.append("\n".join(row[-1] for row in cursor.fetchall()))
+        return plans
+    finally:
+        connection.close()
+
+
+def test_tax_year_query_uses_type_date_index(repository: DocumentRepository) -> None:
+    [invoices] = _query_plans(
+        lambda: repository.invoices_in_tax_year(
+            2025,
+            invoice_type=InvoiceTypeEnum.DOCTOR_RECEIPT,
+            min_price=50,
+        ),
+    )
+
+    assert "USING INDEX ix_invoice_extractions_type_date" in invoices
+    assert "normalized_date>? AND normalized_date<?" in invoices
+    assert "TEMP B-TREE" not in invoices
+
+
+def test_invoice_logs_are_loaded_through_fk_index(
+    repository: DocumentRepository,
+) -> None:
+    # selectinload only queries the logs when there are invoices
+    repository.save_many(
+        [
+            (
+                FileMetadata(path="a.pdf", hash="a" * 64, size=1, type="pdf"),
+                Classification(
+                    label=DocumentType.INVOICE,
+                    confidence=Confidence(level=ConfidenceLevel.HIGH, explanation=""),
+                ),
+                InvoiceExtraction(
+                    type=InvoiceTypeEnum.FLAT_RECEIPT,
+                    price=850.0,
+                    date="2025-01-01",
+                    description="Miete",
+                    notes=None,
+                    logs=[],
+                ),
+            ),
+        ],
+    )
+
+    _, logs = _query_plans(repository.find_invoices)
+
+    assert "USING INDEX ix_invoice_logs_invoice_extraction_id" in logs
+
+
+def test_document_range_query_uses_label_processed_at_index(
+    repository: DocumentRepository,
+) -> None:
+    [documents] = _query_plans(
+        lambda: repository.find_documents(
+            DocumentType.INVOICE,
+            processed_from=datetime(2025, 1, 1),  # noqa: DTZ001
+        ),
+    )
+
+    assert "USING INDEX ix_documents_label_processed_at" in documents
+    assert "TEMP B-TREE" not in documents
@@ -0,0 +1,204 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from documentassistent.exceptions import DatabaseError
+from documentassistent.storage import (
+    DocumentRepository,
+    FileMetadata,
+    get_session,
+    init_database,
+    models,
+)
+from documentassistent.storage.bulk_insert import DocumentRecord
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.pydantic_llm_calls.invoice_call import (
+    InvoiceExtraction,
+    InvoiceTypeEnum,
+    Logs,
+)
+from documentassistent.structure.pydantic_llm_calls.note_call import NoteExtraction
+from documentassistent.structure.pydantic_llm_calls.result_call import (
+    ResultExtraction,
+)
+from documentassistent.structure.pydantic_llm_calls.result_call import (
+    TestResult as Row,
+)
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> DocumentRepository:
+    init_database(str(tmp_path / "documents.db"))
+    return DocumentRepository()
+
+
+def _metadata(number: int) -> FileMetadata:
+    return FileMetadata(
+        path=f"/scans/{number}.pdf",
+        hash=f"{number:064x}",
+        size=1000 + number,
+        type="pdf",
+    )
+
+
+def _classification(label: DocumentType) -> Classification:
+    return Classification(
+        label=label,
+        confidence=Confidence(level=ConfidenceLevel.HIGH, explanation="test"),
+    )
+
+
+def _records() -> list[DocumentRecord]:
+    invoice = InvoiceExtraction(
+        type=InvoiceTypeEnum.FLAT_RECEIPT,
+        price=850.0,
+        date="2024-06-01",
+        description="Miete Juni",
+        notes=None,
+        logs=[Logs(log="überwiesen", date="2024-06-03")],
+    )
+    note = NoteExtraction(author=None, date=None, content="Notiz", tags=["a", "b"])
+    result = ResultExtraction(
+        patient_name="Erika Muster",
+        test_results=[
+            Row(
+                test_name=name,
+                value="1,0",
+                unit=None,
+                reference_range=None,
+                date=None,
+                notes=None,
+            )
+            for name in ("Leukozyten", "Hämoglobin", "Kreatinin")
+        ],
+        overall_notes=None,
+    )
+    return [
+        DocumentRecord(_metadata(1), _classification(DocumentType.INVOICE), invoice),
+        DocumentRecord(_metadata(2), _classification(DocumentType.NOTE), note, "Notiz"),
+        DocumentRecord(_metadata(3), _classification(DocumentType.RESULT), result),
+        DocumentRecord(_metadata(4), _classification(DocumentType.INVOICE)),
+    ]
+
+
+def _child_counts() -> tuple[int, int, int]:
+    session = get_session()
+    try:
+        return (
+            session.query(models.InvoiceLog).count(),
+            session.query(models.NoteTag).count(),
+            session.query(models.TestResult).count(),
+        )
+    finally:
+        session.close()
+
+
+def test_save_many_inserts_parents_and_children_in_chunks(
+    repository: DocumentRepository,
+) -> None:
+    records = _records()
+
+    ids = repository.save_many(records, chunk_size=3)
+
+    assert len(set(ids)) == len(records)
+    for document_id, record in zip(ids, records, strict=True):
+        document = repository.get_document_by_id(document_id)
+        assert document is not None
+        assert document.file_hash == record.file_metadata.hash
+        assert document.classification_label == record.classification.label
+    assert _child_counts() == (1, 2, 3)
+    session = get_session()
+    try:
+        stored = session.query(models.InvoiceExtraction).one()
+        assert (stored.document_id, stored.type) == (
+            ids[0],
+            InvoiceTypeEnum.FLAT_RECEIPT,
+        )
+    finally:
+        session.close()
+
+
+def test_save_many_accepts_plain_tuples(repository: DocumentRepository) -> None:
+    metadata, classification, extraction, _ = _records()[0]
+
+    [document_id] = repository.save_many([(metadata, classification, extraction)])
+
+    document = repository.get_document_by_id(document_id)
+    assert document is not None
+    assert document.text_content is None
+
+
+def test_failing_chunk_is_rolled_back(repository: DocumentRepository) -> None:
+    records = _records()
+    duplicate = records[0]
+
+    with pytest.raises(DatabaseError):
+        repository.save_many([*records, duplicate], chunk_size=len(records) - 1)
+
+    # The first chunk is committed, the second one with the duplicate hash is not
+    assert repository.count_documents() == len(records) - 1
+
+
+def _invoice(number: int, invoice_date: str, price: float) -> DocumentRecord:
+    return DocumentRecord(
+        _metadata(number),
+        _classification(DocumentType.INVOICE),
+        InvoiceExtraction(
+            type=InvoiceTypeEnum.DOCTOR_RECEIPT,
+            price=price,
+            date=invoice_date,
+            description=f"Behandlung {number}",
+            notes=None,
+            logs=[],
+        ),
+    )
+
+
+def test_invoices_in_tax_year_uses_parsed_dates(
+    repository: DocumentRepository,
+) -> None:
+    repository.save_many(
+        [
+            _invoice(1, "15.03.2025", 80.0),
+            _invoice(2, "2025-01-10", 120.0),
+            _invoice(3, "2025-06-01", 20.0),
+            _invoice(4, "31.12.2024", 90.0),
+            _invoice(5, "unleserlich", 300.0),
+        ],
+    )
+
+    invoices = repository.invoices_in_tax_year(
+        2025,
+        invoice_type=InvoiceTypeEnum.DOCTOR_RECEIPT,
+        min_price=50,
+    )
+
+    assert [invoice.description for invoice in invoices] == [
+        "Behandlung 2",
+        "Behandlung 1",
+    ]
+
+
+def test_init_database_adds_and_backfills_normalized_date(tmp_path: Path) -> None:
+    path = str(tmp_path / "documents.db")
+    init_database(path)
+    DocumentRepository().save_many([_invoice(1, "15.03.2025", 80.0)])
+    session = get_session()
+    session.execute(text("DROP INDEX ix_invoice_extractions_type_date"))
+    session.execute(text("ALTER TABLE invoice_extractions DROP COLUMN normalized_date"))
+    session.commit()
+    session.close()
+
+    init_database(path)
+
+    [invoice] = DocumentRepository().invoices_in_tax_year(2025)
+    assert invoice.normalized_date == date(2025, 3, 15)
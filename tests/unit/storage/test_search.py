@@ -0,0 +1,141 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from documentassistent.exceptions import DatabaseError
+from documentassistent.storage import (
+    DocumentRepository,
+    FileMetadata,
+    get_session,
+    init_database,
+    search,
+)
+from documentassistent.storage.bulk_insert import DocumentRecord
+from documentassistent.storage.search import SearchHit, fts_query
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+
+TEXTS = {
+    "dentist": (
+        "Zahnarztpraxis Dr. Müller\nRechnung vom 12.03.2024\nZahnarzt Behandlung"
+    ),
+    "dentist_2023": "Zahnarzt Behandlung\nRechnung vom 05.05.2023",
+    "lab": "Laborbefund 2024\nLeukozyten 6,1 G/l",
+}
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> DocumentRepository:
+    init_database(str(tmp_path / "documents.db"))
+    repository = DocumentRepository()
+    labels = {"lab": DocumentType.RESULT}
+    repository.save_many(
+        [
+            DocumentRecord(
+                FileMetadata(
+                    path=f"{name}.pdf",
+                    hash=name.ljust(64, "0"),
+                    size=1,
+                    type="pdf",
+                ),
+                Classification(
+                    label=labels.get(name, DocumentType.INVOICE),
+                    confidence=Confidence(level=ConfidenceLevel.HIGH, explanation=""),
+                ),
+                text_content=content,
+            )
+            for name, content in TEXTS.items()
+        ],
+    )
+    return repository
+
+
+def _paths(hits: list[SearchHit]) -> list[str]:
+    return [hit.original_path for hit in hits]
+
+
+def test_search_matches_all_words_with_snippet(repository: DocumentRepository) -> None:
+    [hit] = repository.search("Zahnarzt 2024")
+
+    assert hit.original_path == "dentist.pdf"
+    assert "[Zahnarzt]" in hit.snippet
+
+
+def test_search_prefix_diacritics_and_filters(repository: DocumentRepository) -> None:
+    assert _paths(repository.search("muller")) == ["dentist.pdf"]
+    assert set(_paths(repository.search("Zahnarzt*"))) == {
+        "dentist.pdf",
+        "dentist_2023.pdf",
+    }
+    invoices = repository.search(
+        "2024",
+        filters={"classification_label": DocumentType.INVOICE},
+    )
+    assert _paths(invoices) == ["dentist.pdf"]
+
+
+def test_search_input_is_not_fts_syntax(repository: DocumentRepository) -> None:
+    assert fts_query('Zahnarzt: "2024" -OR') == '"Zahnarzt" "2024" "OR"'
+    assert repository.search('Zahnarzt: "2024"')
+    assert repository.search("  ") == []
+
+
+def test_index_follows_updates_and_deletes(repository: DocumentRepository) -> None:
+    [lab] = repository.search("Leukozyten")
+
+    repository.update_by_id(lab.document_id, text_content="Kreatinin 0,9 mg/dl")
+    assert repository.search("Leukozyten") == []
+    assert _paths(repository.search("Kreatinin")) == ["lab.pdf"]
+
+    repository.delete_document(lab.document_id)
+    assert repository.search("Kreatinin") == []
+
+
+def test_index_is_built_for_existing_databases(tmp_path: Path) -> None:
+    path = str(tmp_path / "documents.db")
+    init_database(path)
+    DocumentRepository().save_many(
+        [
+            DocumentRecord(
+                FileMetadata(path="old.pdf", hash="f" * 64, size=1, type="pdf"),
+                Classification(
+                    label=DocumentType.NOTE,
+                    confidence=Confidence(level=ConfidenceLevel.LOW, explanation=""),
+                ),
+                text_content="Notiz zur Steuererklärung",
+            ),
+        ],
+    )
+    session = get_session()
+    session.execute(text("DROP TABLE documents_fts"))
+    session.commit()
+    session.close()
+
+    init_database(path)
+
+    assert _paths(DocumentRepository().search("Steuererklarung")) == ["old.pdf"]
+
+
+def test_search_without_fts5_finds_nothing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A module SQLite does not know fails like FTS5 in a build without it
+    monkeypatch.setattr(
+        search,
+        "_DDL",
+        ["CREATE VIRTUAL TABLE documents_fts USING no_fts5(text_content)"],
+    )
+    init_database(str(tmp_path / "documents.db"))
+    repository = DocumentRepository()
+
+    assert repository.search("Zahnarzt") == []
+    with pytest.raises(DatabaseError, match="no FTS5"):
+        repository.rebuild_search_index()
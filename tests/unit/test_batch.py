@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+from PIL import Image
+
+from benchmarks.synthetic import statement_page, write_text_pdf
+from documentassistent.batch import BatchWorkers, process_directory
+from documentassistent.input_engineering.dedup_gate import DedupGate
+from documentassistent.input_engineering.input_reader import PDFReader
+from documentassistent.input_engineering.reader_registry import PDF, ReaderRegistry
+from documentassistent.structure.state import ClassificationState, Document
+from documentassistent.utils.file_manager import compute_file_hash
+
+STORED_ID = 99
+
+
+def _make_files(tmp_path: Path, count: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"doc_{i}.pdf"
+        path.write_bytes(f"%PDF-1.4 {i}".encode())
+        paths.append(path)
+    return paths
+
+
+def test_process_directory_stores_new_and_skips_known(tmp_path: Path) -> None:
+    paths = _make_files(tmp_path, 5)
+    known_hash = compute_file_hash(str(paths[0]))
+    repository = Mock()
+    repository.get_document_by_hash.side_effect = lambda file_hash: (
+        Mock(id=STORED_ID) if file_hash == known_hash else None
+    )
+    gate = DedupGate(repository=repository)
+    llm = Mock()
+    pre_classifier = Mock()
+
+    extraction_pipeline = Mock()
+    extraction_pipeline.invoke.side_effect = lambda state: state
+    storage_agent = Mock()
+    stored_ids = iter(range(1, 10))
+    storage_agent.store_results.side_effect = lambda state: state.model_copy(
+        update={"document_id": next(stored_ids)},
+    )
+
+    def fake_read(path: str) -> Document:
+        return Document(content=f"text of {Path(path).name}")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        report = process_directory(
+            paths,
+            workers=BatchWorkers(readers=2, llm=3, queue_size=2),
+            extraction_pipeline=extraction_pipeline,
+            storage_agent=storage_agent,
+            dedup_gate=gate,
+            read_executor=executor,
+            readers=Mock(read=Mock(side_effect=fake_read)),
+            llm=llm,
+            pre_classifier=pre_classifier,
+        )
+
+    assert report.skipped == {str(paths[0]): STORED_ID}
+    assert set(report.stored) == {str(path) for path in paths[1:]}
+    assert not report.failed
+    states: list[Any] = [
+        call.args[0] for call in storage_agent.store_results.call_args_list
+    ]
+    assert all(isinstance(state, ClassificationState) for state in states)
+    assert all(state.file_hash for state in states)
+    llm.log_summary.assert_called_once()
+    pre_classifier.log_summary.assert_called_once()
+
+
+def test_process_directory_records_failures(tmp_path: Path) -> None:
+    paths = _make_files(tmp_path, 2)
+    repository = Mock()
+    repository.get_document_by_hash.return_value = None
+
+    extraction_pipeline = Mock()
+    extraction_pipeline.invoke.side_effect = RuntimeError("LLM down")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        report = process_directory(
+            paths,
+            workers=BatchWorkers(readers=1, llm=1, queue_size=1),
+            extraction_pipeline=extraction_pipeline,
+            storage_agent=Mock(),
+            dedup_gate=DedupGate(repository=repository),
+            read_executor=executor,
+            readers=Mock(read=Mock(return_value=Document(content="text"))),
+        )
+
+    assert set(report.failed) == {str(path) for path in paths}
+    assert report.failed[str(paths[0])] == "LLM down"
+    assert not report.stored
+
+
+def test_process_pool_reads_with_a_registry_per_worker(tmp_path: Path) -> None:
+    pdf = write_text_pdf(tmp_path / "statement.pdf", [statement_page(1, lines=2)])
+    repository = Mock()
+    repository.get_document_by_hash.return_value = None
+    extraction_pipeline = Mock()
+    extraction_pipeline.invoke.side_effect = lambda state: state
+    storage_agent = Mock()
+    storage_agent.store_results.side_effect = lambda state: state.model_copy(
+        update={"document_id": STORED_ID},
+    )
+    readers = ReaderRegistry()
+    readers.register(PDF, PDFReader)
+
+    report = process_directory(
+        [pdf],
+        workers=BatchWorkers(readers=1, llm=1, queue_size=1),
+        extraction_pipeline=extraction_pipeline,
+        storage_agent=storage_agent,
+        dedup_gate=DedupGate(repository=repository),
+        readers=readers,
+    )
+
+    assert report.stored == {str(pdf): STORED_ID}
+    [state] = [call.args[0] for call in storage_agent.store_results.call_args_list]
+    assert state.text.startswith("Kontoauszug Seite 1")
+
+
+def test_images_are_read_with_the_image_reader(tmp_path: Path) -> None:
+    pdf = write_text_pdf(tmp_path / "statement.pdf", [statement_page(1, lines=2)])
+    photo = tmp_path / "scan.png"
+    Image.new("L", (8, 8)).save(photo)
+    repository = Mock()
+    repository.get_document_by_hash.return_value = None
+    extraction_pipeline = Mock()
+    extraction_pipeline.invoke.side_effect = lambda state: state
+    storage_agent = Mock()
+    storage_agent.store_results.side_effect = lambda state: state.model_copy(
+        update={"document_id": STORED_ID},
+    )
+    image_reader = Mock()
+    image_reader.read.return_value = Document(content="OCR text")
+    readers = Mock(read=Mock(return_value=Document(content="PDF text")))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        report = process_directory(
+            [pdf, photo],
+            workers=BatchWorkers(readers=1, llm=1, queue_size=2),
+            extraction_pipeline=extraction_pipeline,
+            storage_agent=storage_agent,
+            dedup_gate=DedupGate(repository=repository),
+            read_executor=executor,
+            readers=readers,
+            image_reader=image_reader,
+        )
+
+    assert set(report.stored) == {str(pdf), str(photo)}
+    image_reader.read.assert_called_once_with(str(photo))
+    readers.read.assert_called_once_with(str(pdf))
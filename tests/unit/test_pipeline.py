@@ -0,0 +1,74 @@
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock
+
+from documentassistent.agents.classification_agent import ClassificationAgent
+from documentassistent.agents.invoice_agent import InvoiceAgent
+from documentassistent.agents.note_agent import NoteAgent
+from documentassistent.agents.result_agent import ResultAgent
+from documentassistent.input_engineering.input_reader import PageStream
+from documentassistent.pipeline import classify_while_reading, create_pipeline
+from documentassistent.structure.pydantic_llm_calls.classification_call import (
+    Classification,
+    DocumentType,
+)
+from documentassistent.structure.pydantic_llm_calls.confidence import (
+    Confidence,
+    ConfidenceLevel,
+)
+from documentassistent.structure.pydantic_llm_calls.note_call import NoteExtraction
+from documentassistent.structure.state import ClassificationState, State
+
+
+def test_pipeline_ainvoke_runs_async_nodes() -> None:
+    classification = Classification(
+        label=DocumentType.NOTE,
+        confidence=Confidence(level=ConfidenceLevel.HIGH, explanation="Note"),
+    )
+    note = NoteExtraction(author=None, date=None, content="Call back", tags=None)
+    mock_llm = Mock()
+    mock_llm.acall = AsyncMock(side_effect=[classification, note])
+    storage_agent = Mock()
+    storage_agent.astore_results = AsyncMock(side_effect=lambda state: state)
+
+    pipeline = create_pipeline(
+        classification_agent=ClassificationAgent(llm=mock_llm),
+        invoice_agent=InvoiceAgent(llm=mock_llm),
+        note_agent=NoteAgent(llm=mock_llm),
+        result_agent=ResultAgent(llm=mock_llm),
+        storage_agent=storage_agent,
+    )
+    result = asyncio.run(pipeline.ainvoke(ClassificationState(text="Call back")))
+
+    assert mock_llm.acall.await_count == 2  # noqa: PLR2004
+    mock_llm.call.assert_not_called()
+    storage_agent.astore_results.assert_awaited_once()
+    assert result.note_extraction_result == note
+
+
+def test_classify_while_reading_sends_only_the_first_pages() -> None:
+    classification = Classification(
+        label=DocumentType.NOTE,
+        confidence=Confidence(level=ConfidenceLevel.HIGH, explanation="Note"),
+    )
+    read: list[str] = []
+
+    def pages() -> Iterator[str]:
+        for number in range(4):
+            read.append(f"page {number} ")
+            yield f"page {number} "
+
+    def classify(state: State) -> State:
+        return state.model_copy(update={"classification_result": classification})
+
+    classify_agent = Mock()
+    classify_agent.invoke = Mock(side_effect=classify)
+
+    with PageStream(pages()) as stream:
+        document, result = classify_while_reading(classify_agent, stream, 2)
+
+    sent = classify_agent.invoke.call_args.args[0]
+    assert sent.text == "page 0 page 1 "
+    assert document.content == "".join(read)
+    assert document.pages == read
+    assert result == classification
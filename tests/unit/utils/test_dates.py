@@ -0,0 +1,28 @@
+from datetime import date
+
+import pytest
+
+from documentassistent.utils.dates import parse_date
+
+MAY_FIRST = date(2024, 5, 1)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2024-05-01",
+        "2024-05-01T10:30:00",
+        "01.05.2024",
+        "1.5.24",
+        "01/05/2024",
+        "Rechnungsdatum: 1. Mai 2024",
+        "May 1, 2024",
+    ],
+)
+def test_parse_date_formats(text: str) -> None:
+    assert parse_date(text) == MAY_FIRST
+
+
+@pytest.mark.parametrize("text", [None, "", "unknown", "31.02.2024", "Mai 2024"])
+def test_parse_date_returns_none_when_no_valid_date(text: str | None) -> None:
+    assert parse_date(text) is None